@@ -0,0 +1,290 @@
+""" This module defines the tick benchmark suite, which times the phases of a
+    headless engine tick for several population sizes, spatial index
+    backends and execution backends, saves the results as JSON and compares
+    them against a saved baseline.
+
+    Run it with:
+        python -m infection.benchmarks.tick_benchmark --output bench.json
+        python -m infection.benchmarks.tick_benchmark --baseline bench.json
+"""
+from __future__ import annotations
+from infection.engine import epidemic, movement
+from infection.engine.population import STATUS_HEALTHY
+from infection.engine.simulation_engine import SimulationEngine
+from infection.engine.spatial_index import INDEX_BACKENDS
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+
+SIZES = (100, 1000, 10000, 100000)
+PHASES = ("index", "query", "draw", "move", "tick")
+TICKS = 20
+THRESHOLD = 0.1
+INFECTED_FRACTION = 0.01
+INDIVIDUAL_SIZE = 21.0
+AREA_PER_INDIVIDUAL = 800 * 600 / 100
+
+
+def executions() -> dict:
+    """ Function that returns the execution backends available in this
+        machine: "serial" steps the population in this process, and
+        "process" in a ProcessPool with one worker per CPU, up to 4, when
+        there is more than one CPU.
+
+    Returns:
+        executions (dict): The number of workers of every execution backend,
+            by name.
+    """
+    available = {"serial": 1}
+    cpus = os.cpu_count() or 1
+    if cpus > 1:
+        available["process"] = min(cpus, 4)
+    return available
+
+
+def create_engine(agents: int, index_backend: str, workers: int,
+                  seed: int) -> SimulationEngine:
+    """ Function that creates an engine with "agents" individuals spread
+        uniformly over an arena that grows with the population, so every
+        size has the same density as 100 individuals in an 800x600 window.
+        INFECTED_FRACTION of them start infected.
+
+    Args:
+        agents (int): The number of individuals.
+        index_backend (str): The spatial index backend.
+        workers (int): The number of worker processes.
+        seed (int): The seed of the engine.
+
+    Returns:
+        engine (SimulationEngine): The engine, ready to tick.
+    """
+    height = np.sqrt(agents * AREA_PER_INDIVIDUAL * 3 / 4)
+    engine = SimulationEngine(width=height * 4 / 3, height=height,
+                              individual_size=INDIVIDUAL_SIZE,
+                              index_backend=index_backend, workers=workers,
+                              seed=seed)
+    infected = max(int(agents * INFECTED_FRACTION), 1)
+    engine.add_healthy(agents - infected)
+    engine.add_infected(infected)
+    return engine
+
+
+def time_phases(engine: SimulationEngine, random: np.random.Generator,
+                serial: bool) -> dict:
+    """ Function that times the phases of one tick and then runs the tick.
+        The spatial index is rebuilt, and in serial execution the neighbor
+        query, the infection draw and the movement are run on their own on
+        the current frame, with their results thrown away, before the whole
+        tick is timed. In process execution those phases run in the
+        workers, so only the index build and the whole tick are timed.
+
+    Args:
+        engine (SimulationEngine): The engine to time.
+        random (np.random.Generator): The generator of the uniform numbers
+            of the infection draw.
+        serial (bool): True if the engine steps in this process.
+
+    Returns:
+        times (dict): The seconds each phase took, by phase name.
+    """
+    times = {}
+    start = time.perf_counter()
+    engine.build_index()
+    times["index"] = time.perf_counter() - start
+    if serial:
+        columns = engine.population.columns
+        susceptible = np.flatnonzero(~columns["recovered"] &
+                                     (columns["cooldown"] == 0) &
+                                     (columns["status"] == STATUS_HEALTHY))
+        start = time.perf_counter()
+        counts = epidemic.count_infected_neighbors(
+            columns["x"], columns["y"], susceptible, engine.spatial_index,
+            engine.individual_size, engine.index_backend)
+        times["query"] = time.perf_counter() - start
+        contact = counts > 0
+        exposed = susceptible[contact]
+        uniforms = random.random(len(exposed))
+        start = time.perf_counter()
+        epidemic.draw_infections(columns["infection_probability"][exposed],
+                                 counts[contact], uniforms)
+        times["draw"] = time.perf_counter() - start
+        moved = {name: columns[name].copy()
+                 for name in ("x", "y", "direction_x", "direction_y")}
+        start = time.perf_counter()
+        movement.move(moved["x"], moved["y"], moved["direction_x"],
+                      moved["direction_y"], columns["speed"], engine.bounds,
+                      engine.individual_size)
+        times["move"] = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.tick()
+    times["tick"] = time.perf_counter() - start
+    return times
+
+
+def bench_case(agents: int, index_backend: str, execution: str,
+               workers: int, ticks: int = TICKS, seed: int = 0) -> dict:
+    """ Function that benchmarks one combination of population size, index
+        backend and execution backend. A first tick warms up the caches and
+        the worker processes, and is not counted.
+
+    Args:
+        agents (int): The number of individuals.
+        index_backend (str): The spatial index backend.
+        execution (str): The name of the execution backend.
+        workers (int): The number of worker processes.
+        ticks (int): The number of timed ticks. Defaults to TICKS.
+        seed (int): The seed of the engine. Defaults to 0.
+
+    Returns:
+        result (dict): The case and the median seconds of every phase.
+    """
+    engine = create_engine(agents, index_backend, workers, seed)
+    random = np.random.default_rng(seed)
+    try:
+        engine.tick()
+        samples = [time_phases(engine, random, workers == 1)
+                   for _ in range(ticks)]
+    finally:
+        engine.close()
+    phases = {phase: float(np.median([sample[phase] for sample in samples]))
+              for phase in PHASES if phase in samples[0]}
+    return {"agents": agents, "index": index_backend,
+            "execution": execution, "workers": workers, "ticks": ticks,
+            "phases": phases}
+
+
+def run(sizes: tuple = SIZES, index_backends: tuple = INDEX_BACKENDS,
+        execution_backends: dict = None, ticks: int = TICKS,
+        seed: int = 0) -> dict:
+    """ Function that benchmarks every combination of population size, index
+        backend and execution backend.
+
+    Args:
+        sizes (tuple): The population sizes. Defaults to SIZES.
+        index_backends (tuple): The spatial index backends. Defaults to
+            INDEX_BACKENDS.
+        execution_backends (dict): The number of workers of every execution
+            backend, by name. Defaults to the available executions().
+        ticks (int): The number of timed ticks per case. Defaults to TICKS.
+        seed (int): The seed of the engines. Defaults to 0.
+
+    Returns:
+        report (dict): The machine the benchmark ran on, and the result of
+            every case.
+    """
+    if execution_backends is None:
+        execution_backends = executions()
+    results = [bench_case(agents, index_backend, execution, workers, ticks,
+                          seed)
+               for agents in sizes
+               for index_backend in index_backends
+               for execution, workers in execution_backends.items()]
+    return {"machine": {"python": platform.python_version(),
+                        "numpy": np.__version__,
+                        "platform": platform.platform(),
+                        "cpus": os.cpu_count()},
+            "results": results}
+
+
+def compare(report: dict, baseline: dict,
+            threshold: float = THRESHOLD) -> list:
+    """ Function that compares the phases of every case of a report against
+        the same case of a baseline report. A phase regressed when it got
+        slower by more than the threshold, as a fraction of the baseline
+        time. Cases or phases missing from either report are skipped.
+
+    Args:
+        report (dict): The report of the current run.
+        baseline (dict): The saved baseline report.
+        threshold (float): The allowed slowdown, 0.1 for 10%. Defaults to
+            THRESHOLD.
+
+    Returns:
+        regressions (list): One dictionary per regressed phase, with the
+            case, the phase, both times and their ratio.
+    """
+    def key(result: dict) -> tuple:
+        return result["agents"], result["index"], result["execution"]
+
+    saved = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        if key(result) not in saved:
+            continue
+        before = saved[key(result)]["phases"]
+        for phase, seconds in result["phases"].items():
+            if phase not in before or before[phase] <= 0:
+                continue
+            ratio = seconds / before[phase]
+            if ratio > 1 + threshold:
+                regressions.append({"agents": result["agents"],
+                                    "index": result["index"],
+                                    "execution": result["execution"],
+                                    "phase": phase,
+                                    "baseline": before[phase],
+                                    "current": seconds, "ratio": ratio})
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    """ Function that runs the benchmark from the command line, prints a
+        table of the median milliseconds per phase, and optionally saves
+        the report and compares it against a baseline.
+
+    Args:
+        argv (list): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        status (int): 1 if a phase regressed against the baseline, 0
+            otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the phases of a headless engine tick.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--indexes", nargs="+", default=INDEX_BACKENDS,
+                        choices=INDEX_BACKENDS)
+    parser.add_argument("--executions", nargs="+",
+                        default=list(executions()),
+                        choices=("serial", "process"))
+    parser.add_argument("--ticks", type=int, default=TICKS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to save the report to")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown, 0.1 for 10%%")
+    arguments = parser.parse_args(argv)
+    workers = {"serial": 1, "process": executions().get("process", 2)}
+    report = run(arguments.sizes, arguments.indexes,
+                 {execution: workers[execution]
+                  for execution in arguments.executions},
+                 arguments.ticks, arguments.seed)
+    print(f"{'agents':>8} {'index':>9} {'execution':>10} " +
+          " ".join(f"{phase + ' ms':>9}" for phase in PHASES))
+    for result in report["results"]:
+        print(f"{result['agents']:>8} {result['index']:>9} "
+              f"{result['execution']:>10} " +
+              " ".join(f"{result['phases'][phase] * 1000:>9.3f}"
+                       if phase in result["phases"] else f"{'-':>9}"
+                       for phase in PHASES))
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline:
+            regressions = compare(report, json.load(baseline),
+                                  arguments.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression['phase']} with "
+                  f"{regression['agents']} agents, {regression['index']} "
+                  f"index, {regression['execution']} execution: "
+                  f"{regression['ratio']:.2f}x the baseline")
+        return int(bool(regressions))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
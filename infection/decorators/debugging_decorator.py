@@ -8,7 +8,10 @@ import sys
 def debugging_decorator(func):
     """ This decorator will take any function and log information about the
         function itself, its arguments, and the value it returns.
-        Important: It will only log when running in debugging mode.
+        Important: It will only log when running in debugging mode. The
+        check is made once, when the function is decorated, so outside of a
+        debugger the function is returned as it is and its calls cost
+        nothing extra.
 
     Args:
         func (function): The function to decorate
@@ -18,20 +21,20 @@ def debugging_decorator(func):
             debugging mode, otherwise the funcion is returned without
             decoration.
     """
+    if sys.gettrace() is None:
+        return func
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        if sys.gettrace() is not None:
-            logging.basicConfig(level=10, format="%(threadName)s:%(message)s")
-            args_representation = [repr(arg) for arg in args]
-            kwargs_representation = [f"{key}={value!r}"
-                                     for key, value in kwargs.items()]
-            arguments = ", ".join(
-                args_representation + kwargs_representation)
-            logging.info(
-                f"Calling {func.__name__} with arguments: {arguments}")
-            value = func(*args, **kwargs)
-            logging.info(f"{func.__name__} returned: {value}")
-            return value
-        else:
-            return func(*args, **kwargs)
+        logging.basicConfig(level=10, format="%(threadName)s:%(message)s")
+        args_representation = [repr(arg) for arg in args]
+        kwargs_representation = [f"{key}={value!r}"
+                                 for key, value in kwargs.items()]
+        arguments = ", ".join(
+            args_representation + kwargs_representation)
+        logging.info(
+            f"Calling {func.__name__} with arguments: {arguments}")
+        value = func(*args, **kwargs)
+        logging.info(f"{func.__name__} returned: {value}")
+        return value
     return wrapper
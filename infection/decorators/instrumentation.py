@@ -0,0 +1,71 @@
+""" This module defines the instrumented decorator, which times the phases of
+    a tick, and the functions to read and reset those timers. Whether the
+    timers are on is decided once, when the module is imported, from the
+    INFECTION_INSTRUMENTATION environment variable, so with them off the
+    decorated functions are returned as they are and cost nothing.
+"""
+import functools
+import os
+import time
+
+PHASES = ("index", "query", "infection", "recovery", "movement", "render")
+ENABLED = os.environ.get("INFECTION_INSTRUMENTATION", "0") not in ("", "0")
+_seconds = dict.fromkeys(PHASES, 0.0)
+_calls = dict.fromkeys(PHASES, 0)
+
+
+def instrumented(phase: str, enabled: bool = None):
+    """ This decorator will add the wall-clock time and the number of calls
+        of a function to the timers of a phase. Only the calls made in this
+        process are counted, so with a ProcessPool the phases that run in
+        the workers are not.
+
+    Args:
+        phase (str): The phase the function belongs to, one of PHASES.
+        enabled (bool): True to time the function. Defaults to ENABLED.
+
+    Returns:
+        value (function): A decorator that returns the function timed when
+            the timers are on, otherwise the function without decoration.
+
+    Raises:
+        ValueError: If the phase is not one of PHASES.
+    """
+    if phase not in PHASES:
+        raise ValueError(f"Unknown instrumentation phase: {phase}")
+    if enabled is None:
+        enabled = ENABLED
+
+    def decorator(func):
+        if not enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _seconds[phase] += time.perf_counter() - start
+                _calls[phase] += 1
+        return wrapper
+    return decorator
+
+
+def stats() -> dict:
+    """ Function that returns the timers of every phase.
+
+    Returns:
+        stats (dict): The number of calls and the total seconds of every
+            phase, by phase name.
+    """
+    return {phase: {"calls": _calls[phase], "seconds": _seconds[phase]}
+            for phase in PHASES}
+
+
+def reset() -> None:
+    """ Function that sets the timers of every phase back to zero.
+    """
+    for phase in PHASES:
+        _seconds[phase] = 0.0
+        _calls[phase] = 0
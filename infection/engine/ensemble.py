@@ -0,0 +1,399 @@
+""" This module defines the Ensemble class, which runs many independent
+    replicates of the same scenario at once in stacked arrays, and the
+    EnsembleSeries class, which keeps the mean and the quantile bands of
+    their S/I/R curves tick by tick.
+"""
+from __future__ import annotations
+from infection.engine import epidemic, movement
+from infection.engine.epidemic import HEALTHY_SPEED, INFECTED_SPEED
+from infection.engine.layouts import spawn_positions
+from infection.engine.population import COLUMNS, STATUS_INFECTED
+from infection.engine.random_streams import RandomStreams
+from infection.engine.simulation_engine import (
+    DIRECTION_MAGNITUDE, MAX_COOLDOWN, MAX_TIME_INFECTED
+)
+from infection.engine.spatial_index import create_index
+from pathlib import Path
+import numpy as np
+
+CURVES = ("susceptible", "infected", "recovered")
+QUANTILES = (.05, .25, .5, .75, .95)
+CHUNK = 4096
+
+
+class EnsembleSeries:
+    """ This is the definition of the EnsembleSeries class. On every tick it
+        gets the S/I/R counts of every replicate, and keeps only their
+        mean, standard deviation and QUANTILES across the replicates, in
+        buffers that grow by CHUNK ticks at a time. The counts of a tick are
+        dropped once summarized, so the memory grows with the number of
+        ticks but not with the number of replicates.
+
+    Args:
+        quantiles (tuple): The quantiles of the bands, between 0 and 1.
+            Defaults to QUANTILES.
+        chunk (int): The number of ticks added every time the buffers grow.
+            Defaults to CHUNK.
+
+    Attributes:
+        size: Integer with the number of recorded ticks.
+        quantiles: Tuple with the quantiles of the bands.
+        ticks: Integer array with the recorded tick numbers.
+        mean: Float array with shape (size, len(CURVES)) with the mean of
+            every curve.
+        std: Float array with shape (size, len(CURVES)) with the standard
+            deviation of every curve.
+        bands: Float array with shape (size, len(quantiles), len(CURVES))
+            with every quantile of every curve.
+    """
+
+    def __init__(self, quantiles: tuple = QUANTILES,
+                 chunk: int = CHUNK) -> None:
+        self._quantiles = tuple(quantiles)
+        self._chunk = max(chunk, 1)
+        self._size = 0
+        self._ticks = np.zeros(self._chunk, dtype=np.int64)
+        self._mean = np.zeros((self._chunk, len(CURVES)))
+        self._std = np.zeros((self._chunk, len(CURVES)))
+        self._bands = np.zeros((self._chunk, len(quantiles), len(CURVES)))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def quantiles(self) -> tuple:
+        return self._quantiles
+
+    @property
+    def ticks(self) -> np.ndarray:
+        return self._ticks[:self._size]
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self._mean[:self._size]
+
+    @property
+    def std(self) -> np.ndarray:
+        return self._std[:self._size]
+
+    @property
+    def bands(self) -> np.ndarray:
+        return self._bands[:self._size]
+
+    def record(self, tick: int, counts: np.ndarray) -> None:
+        """ Method that summarizes the counts of every replicate in a tick,
+            growing the buffers by one chunk if they are full.
+
+        Args:
+            tick (int): The tick number.
+            counts (np.ndarray): Integer array with shape (replicates,
+                len(CURVES)) with the S/I/R counts of every replicate.
+        """
+        if self._size == len(self._ticks):
+            grow = self._chunk
+            self._ticks = np.concatenate(
+                (self._ticks, np.zeros(grow, dtype=np.int64)))
+            self._mean = np.concatenate(
+                (self._mean, np.zeros((grow, len(CURVES)))))
+            self._std = np.concatenate(
+                (self._std, np.zeros((grow, len(CURVES)))))
+            self._bands = np.concatenate((self._bands, np.zeros(
+                (grow, len(self.quantiles), len(CURVES)))))
+        self._ticks[self._size] = tick
+        self._mean[self._size] = counts.mean(axis=0)
+        self._std[self._size] = counts.std(axis=0)
+        self._bands[self._size] = np.quantile(counts, self.quantiles, axis=0)
+        self._size += 1
+
+    def clear(self) -> None:
+        """ Method that forgets every record, keeping the buffers.
+        """
+        self._size = 0
+
+    def columns(self) -> dict:
+        """ Method that returns every recorded statistic as a named column:
+            the ticks, and the mean, the standard deviation and every
+            quantile of every curve, like "infected_mean", "infected_std"
+            or "infected_q95".
+
+        Returns:
+            columns (dict): The columns, by name.
+        """
+        columns = {"tick": self.ticks}
+        for number, curve in enumerate(CURVES):
+            columns[f"{curve}_mean"] = self.mean[:, number]
+            columns[f"{curve}_std"] = self.std[:, number]
+            for band, quantile in enumerate(self.quantiles):
+                columns[f"{curve}_q{round(quantile * 100):02d}"] = (
+                    self.bands[:, band, number])
+        return columns
+
+    def save(self, path: str) -> None:
+        """ Method that writes the columns to a CSV file with a header row,
+            or to a compressed .npz file with one array per column,
+            depending on the suffix of "path".
+
+        Args:
+            path (str): The path of the file.
+
+        Raises:
+            ValueError: If the suffix is not ".csv" or ".npz".
+        """
+        columns = self.columns()
+        match Path(path).suffix:
+            case ".csv":
+                np.savetxt(path, np.column_stack(list(columns.values())),
+                           fmt="%.6g", delimiter=",",
+                           header=",".join(columns), comments="")
+            case ".npz":
+                np.savez_compressed(path, **columns)
+            case suffix:
+                raise ValueError(f"Unknown ensemble series format: {suffix}")
+
+
+class Ensemble:
+    """ This is the definition of the Ensemble class. It runs K independent
+        replicates of the same scenario, each with N individuals, without a
+        Python loop over the replicates: every column of the population is
+        an array with shape (2, K, N), one frame for the current tick and
+        one for the next like in a Population, and the epidemic and movement
+        kernels of the SimulationEngine run on all of them at once. For the
+        neighbor search, the arena of replicate k is shifted k times its
+        width plus a gap along the 'x' axis, so one spatial index holds the
+        infected individuals of every replicate and no search can reach
+        into another one. Every random number comes from the seed.
+
+    Args:
+        replicates (int): The number of replicates, K.
+        population (int): The number of individuals in each replicate, N.
+        infected (int): The number of them that start infected. Defaults
+            to 1.
+        width (float): The width of the arena. Defaults to 800.
+        height (float): The height of the arena. Defaults to 600.
+        individual_size (float): The size of an individual in the arena.
+            Defaults to 3.5% of the height.
+        infection_probability (float): The infection probability of the
+            healthy individuals. Defaults to 0.2.
+        max_time_infected (int): The number of ticks an individual stays
+            infected. Defaults to MAX_TIME_INFECTED.
+        max_cooldown (int): The number of ticks of a cooldown. Defaults to
+            MAX_COOLDOWN.
+        index_backend (str): The spatial index used for the neighbor search,
+            "grid" or "quadtree". Defaults to "grid".
+        seed (int): The seed of the ensemble. Defaults to None, which takes
+            a fresh seed from the operating system.
+        layout (str): The spawn layout of the positions of every replicate.
+            Defaults to "uniform".
+        quantiles (tuple): The quantiles of the bands of the series.
+            Defaults to QUANTILES.
+        **options: The options of the layout.
+
+    Attributes:
+        replicates: Integer with the number of replicates, K.
+        population: Integer with the number of individuals in each one, N.
+        columns: Dictionary with every column of the current frame, by
+            name, with shape (K, N).
+        susceptible: Integer array with the susceptible individuals of
+            every replicate.
+        infected: Integer array with the infected individuals of every
+            replicate.
+        recovered: Integer array with the recovered individuals of every
+            replicate.
+        ticks: Integer that counts how many ticks have been simulated.
+        series: The EnsembleSeries with the mean and the quantile bands of
+            the S/I/R curves on every tick.
+        streams: The RandomStreams that every random number of the ensemble
+            comes from.
+    """
+
+    def __init__(self, replicates: int, population: int, infected: int = 1,
+                 width: float = 800, height: float = 600,
+                 individual_size: float = None,
+                 infection_probability: float = 0.2,
+                 max_time_infected: int = MAX_TIME_INFECTED,
+                 max_cooldown: int = MAX_COOLDOWN,
+                 index_backend: str = "grid", seed: int = None,
+                 layout: str = "uniform", quantiles: tuple = QUANTILES,
+                 **options) -> None:
+        if individual_size is None:
+            individual_size = height * .035
+        self._replicates = replicates
+        self._population = population
+        self._bounds = (0, 0, width, height)
+        self._individual_size = individual_size
+        self._durations = (max_time_infected, max_cooldown)
+        self._index_backend = index_backend
+        self._streams = RandomStreams(seed)
+        self._series = EnsembleSeries(quantiles)
+        self._ticks = 0
+        self._frame = 0
+        self._arrays = {name: np.zeros((2, replicates, population), dtype)
+                        for name, dtype in COLUMNS.items()}
+        overshoot = DIRECTION_MAGNITUDE * max(HEALTHY_SPEED[1],
+                                              INFECTED_SPEED[1])
+        stride = width + 2 * (individual_size + overshoot)
+        self._offsets = np.repeat(np.arange(replicates) * stride, population)
+        self.spawn(min(infected, population), infection_probability, layout,
+                   **options)
+        self._infected = np.full(replicates, min(infected, population))
+        self._recovered = np.zeros(replicates, dtype=np.int64)
+        self._susceptible = population - self._infected
+        self.record()
+
+    @property
+    def replicates(self) -> int:
+        return self._replicates
+
+    @property
+    def population(self) -> int:
+        return self._population
+
+    @property
+    def columns(self) -> dict:
+        return {name: array[self._frame]
+                for name, array in self._arrays.items()}
+
+    @property
+    def susceptible(self) -> np.ndarray:
+        return self._susceptible
+
+    @property
+    def infected(self) -> np.ndarray:
+        return self._infected
+
+    @property
+    def recovered(self) -> np.ndarray:
+        return self._recovered
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def series(self) -> EnsembleSeries:
+        return self._series
+
+    @property
+    def streams(self) -> RandomStreams:
+        return self._streams
+
+    def flat(self, frame: int) -> dict:
+        """ Method that returns the columns of a frame as flat views with
+            K * N values, replicate after replicate, as the kernels take
+            them.
+
+        Args:
+            frame (int): The frame, 0 or 1.
+
+        Returns:
+            columns (dict): The flat views of the columns, by name.
+        """
+        return {name: array[frame].reshape(-1)
+                for name, array in self._arrays.items()}
+
+    def spawn(self, infected: int, infection_probability: float,
+              layout: str, **options) -> None:
+        """ Method that fills every replicate with its individuals: the
+            positions are drawn with the layout, replicate by replicate, and
+            the directions and speeds for all of them at once. The last
+            "infected" individuals of every replicate start infected.
+
+        Args:
+            infected (int): The number of infected individuals in every
+                replicate.
+            infection_probability (float): The infection probability of the
+                healthy individuals.
+            layout (str): The spawn layout of the positions.
+            **options: The options of the layout.
+        """
+        random = self.streams.generator
+        columns = self.columns
+        x_min, y_min, x_max, y_max = self._bounds
+        if layout == "poisson_disk":
+            options.setdefault("radius", self._individual_size)
+        area = (x_min, y_min, x_max - self._individual_size,
+                y_max - self._individual_size)
+        for replicate in range(self.replicates):
+            columns["x"][replicate], columns["y"][replicate] = (
+                spawn_positions(layout, random, self.population, area,
+                                **options))
+        shape = (self.replicates, self.population)
+        angle = np.radians(random.integers(0, 361, shape))
+        columns["direction_x"][:] = DIRECTION_MAGNITUDE * np.cos(angle)
+        columns["direction_y"][:] = DIRECTION_MAGNITUDE * np.sin(angle)
+        healthy = self.population - infected
+        columns["speed"][:, :healthy] = random.uniform(
+            *HEALTHY_SPEED, (self.replicates, healthy))
+        columns["speed"][:, healthy:] = random.uniform(
+            *INFECTED_SPEED, (self.replicates, infected))
+        columns["status"][:, healthy:] = STATUS_INFECTED
+        columns["infection_probability"][:, :healthy] = infection_probability
+
+    def tick(self) -> int:
+        """ Method that advances every replicate one step: the infected
+            individuals of all of them are indexed at their shifted
+            positions, epidemic.infection_step updates the infection status
+            of every individual, movement.move moves them inside the shared
+            arena bounds, and the frames are swapped. The transitions are
+            counted per replicate with a bincount, and the S/I/R counts are
+            recorded in the series.
+
+        Returns:
+            self.ticks (int): The number of ticks simulated so far.
+        """
+        current, following = self.flat(self._frame), self.flat(1 - self._frame)
+        size = self.replicates * self.population
+        x = current["x"] + self._offsets
+        infectious = np.flatnonzero(current["status"] == STATUS_INFECTED)
+        spatial_index = create_index(
+            self._index_backend, self._individual_size).build(
+                x[infectious], current["y"][infectious], infectious)
+        owned = np.arange(size)
+        infected, recovered = epidemic.infection_step(
+            current, following, owned, spatial_index, self._individual_size,
+            self._index_backend,
+            self.streams.tick_uniforms(self.ticks, owned, size), "auto",
+            *self._durations, positions=(x, current["y"]))
+        movement.move(following["x"], following["y"],
+                      following["direction_x"], following["direction_y"],
+                      following["speed"], self._bounds,
+                      self._individual_size)
+        self._frame = 1 - self._frame
+        infections = np.bincount(infected // self.population,
+                                 minlength=self.replicates)
+        recoveries = np.bincount(recovered // self.population,
+                                 minlength=self.replicates)
+        self._susceptible -= infections
+        self._infected += infections - recoveries
+        self._recovered += recoveries
+        self._ticks += 1
+        self.record()
+        return self.ticks
+
+    def record(self) -> None:
+        """ Method that adds the S/I/R counts of every replicate to the
+            series.
+        """
+        self.series.record(self.ticks, np.column_stack(
+            (self.susceptible, self.infected, self.recovered)))
+
+    def run(self, ticks: int) -> int:
+        """ Method that runs up to "ticks" ticks, stopping early once no
+            replicate has infected individuals, since the curves can't
+            change after that.
+
+        Args:
+            ticks (int): The maximum number of ticks to run.
+
+        Returns:
+            self.ticks (int): The number of ticks simulated so far.
+        """
+        for _ in range(ticks):
+            if not self.infected.any():
+                break
+            self.tick()
+        return self.ticks
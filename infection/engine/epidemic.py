@@ -0,0 +1,296 @@
+""" This module defines the functions that update the infection status of
+    the individuals for one tick. They work on the two frames of the columns
+    of a Population and on a subset of the individuals, so the same code
+    steps the whole population in the SimulationEngine and one chunk of it
+    in a worker process.
+"""
+from __future__ import annotations
+from infection.decorators.instrumentation import instrumented
+from infection.engine.population import STATUS_HEALTHY, STATUS_INFECTED
+from infection.engine.spatial_index import SpatialIndex, create_index
+import numpy as np
+
+MAX_COOLDOWN = 30
+MAX_TIME_INFECTED = 2000
+HEALTHY_SPEED = (0.3, 0.7)
+INFECTED_SPEED = (0.2, 0.5)
+
+
+@instrumented("query")
+def count_infected_neighbors(x: np.ndarray, y: np.ndarray,
+                             queried: np.ndarray,
+                             spatial_index: SpatialIndex, radius: float,
+                             backend: str,
+                             direction: str = "auto") -> np.ndarray:
+    """ Function that counts the infected individuals within radius of each
+        queried individual, with a single bulk query. The search can go in
+        either direction, since the distance is symmetric: from the
+        susceptible side, each queried individual is looked up in the
+        spatial_index of the infected ones; from the infected side, a
+        temporary index of the queried individuals is built and each infected
+        individual is looked up in it. With "auto", the side with fewer
+        individuals is the one that queries, so early and late in an epidemic
+        the cost follows the smaller set.
+
+    Args:
+        x (np.ndarray): The positions of the population in the 'x' axis.
+        y (np.ndarray): The positions of the population in the 'y' axis.
+        queried (np.ndarray): The indices of the individuals to count
+            infected neighbors for.
+        spatial_index (SpatialIndex): A spatial index that contains the
+            positions of the infected individuals.
+        radius (float): The infection radius.
+        backend (str): The spatial index backend used for the temporary
+            index of the queried individuals.
+        direction (str): The side that queries: "susceptible", "infected"
+            or "auto". Defaults to "auto".
+
+    Returns:
+        counts (np.ndarray): The number of infected neighbors of each queried
+            individual.
+    """
+    if direction == "auto":
+        if len(queried) <= len(spatial_index):
+            direction = "susceptible"
+        else:
+            direction = "infected"
+    match direction:
+        case "susceptible":
+            return spatial_index.count_neighbors(x[queried], y[queried],
+                                                 radius)
+        case "infected":
+            queried_index = create_index(backend, radius).build(
+                x[queried], y[queried], queried)
+            _, ids = queried_index.pairs(spatial_index.x, spatial_index.y,
+                                         radius)
+            return np.bincount(ids, minlength=len(queried))
+        case _:
+            raise ValueError(f"Unknown query direction: {direction}")
+
+
+def draw_infections(infection_probability: np.ndarray,
+                    infected_neighbor_counts: np.ndarray,
+                    uniforms: np.ndarray) -> np.ndarray:
+    """ Function that calculates, with one vectorized comparison against
+        uniform random numbers, which individuals get infected. Each contact
+        with an infected neighbor infects with the individual's
+        infection_probability p, so an individual with k infected neighbors
+        gets infected with probability 1 - (1 - p) ** k, the same as drawing
+        k contacts and checking if any of them infected it.
+
+    Args:
+        infection_probability (np.ndarray): The infection probability of
+            each individual.
+        infected_neighbor_counts (np.ndarray): The number of infected
+            individuals within the infection radius of each individual.
+        uniforms (np.ndarray): One uniform random number in [0, 1) for each
+            individual.
+
+    Returns:
+        infected (np.ndarray): Boolean array that is True for the
+            individuals that get infected.
+    """
+    return (uniforms <
+            1 - (1 - infection_probability) ** infected_neighbor_counts)
+
+
+def scale(limits: tuple[float, float], uniforms: np.ndarray) -> np.ndarray:
+    """ Function that maps uniform random numbers in [0, 1) to the range
+        between the given limits.
+
+    Args:
+        limits (tuple[float, float]): The (low, high) limits of the range.
+        uniforms (np.ndarray): The uniform random numbers.
+
+    Returns:
+        values (np.ndarray): The numbers in [low, high).
+    """
+    low, high = limits
+    return low + (high - low) * uniforms
+
+
+def infection_step(current: dict, following: dict, owned: np.ndarray,
+                   spatial_index: SpatialIndex, radius: float, backend: str,
+                   uniforms: np.ndarray, direction: str = "auto",
+                   max_time_infected: int = MAX_TIME_INFECTED,
+                   max_cooldown: int = MAX_COOLDOWN,
+                   positions: tuple[np.ndarray, np.ndarray] = None
+                   ) -> tuple[np.ndarray, np.ndarray]:
+    """ Function that updates the infection status of the "owned"
+        individuals for one tick. Every value is read from the current frame
+        and written to the next one, and only the owned individuals are
+        written, so the chunks of a population can be stepped in any order,
+        or at the same time, with the same result. Recovered individuals are
+        ignored. Individuals in cooldown only decrease their cooldown.
+        Infected individuals recover after max_time_infected cycles. The
+        infected neighbors of the rest of the healthy individuals are
+        counted with one bulk query, and the ones with one or more infected
+        neighbors either get infected or start a cooldown of max_cooldown
+        cycles if they had contact but did not get infected.
+
+    Args:
+        current (dict): The columns of the current frame, by column name.
+        following (dict): The columns of the next frame, by column name.
+        owned (np.ndarray): The indices of the individuals to update.
+        spatial_index (SpatialIndex): A spatial index that contains the
+            positions of the infected individuals near the owned ones in the
+            current frame.
+        radius (float): The infection radius.
+        backend (str): The spatial index backend for temporary indices.
+        uniforms (np.ndarray): The uniform random numbers of the owned
+            individuals, from RandomStreams.tick_uniforms.
+        direction (str): The query direction for count_infected_neighbors.
+            Defaults to "auto".
+        max_time_infected (int): The cycles an individual stays infected.
+            Defaults to MAX_TIME_INFECTED.
+        max_cooldown (int): The cycles of the cooldown after a contact
+            that did not infect. Defaults to MAX_COOLDOWN.
+        positions (tuple[np.ndarray, np.ndarray]): The x and y positions
+            the infected neighbors are counted at, which must match the
+            spatial_index. Defaults to the x and y columns of the current
+            frame.
+
+    Returns:
+        infected (np.ndarray): The indices of the individuals that got
+            infected.
+        recovered (np.ndarray): The indices of the individuals that
+            recovered.
+    """
+    for name, column in following.items():
+        column[owned] = current[name][owned]
+    infection_uniforms, healthy_uniforms, infected_uniforms = uniforms
+    status = current["status"][owned]
+    cooldown = current["cooldown"][owned]
+    active = ~current["recovered"][owned]
+    cooling = active & (cooldown > 0)
+    evaluating = active & (cooldown == 0)
+    infectious = evaluating & (status == STATUS_INFECTED)
+    susceptible = np.flatnonzero(evaluating & (status == STATUS_HEALTHY))
+    following["cooldown"][owned[cooling]] -= 1
+    recovered = recovery_step(current, following, owned, infectious,
+                              healthy_uniforms, max_time_infected)
+    x, y = (current["x"], current["y"]) if positions is None else positions
+    counts = count_infected_neighbors(x, y, owned[susceptible],
+                                      spatial_index, radius, backend,
+                                      direction)
+    infected = contagion_step(current, following, owned, susceptible,
+                              counts, infection_uniforms, infected_uniforms,
+                              max_cooldown)
+    return infected, recovered
+
+
+@instrumented("recovery")
+def recovery_step(current: dict, following: dict, owned: np.ndarray,
+                  infectious: np.ndarray, uniforms: np.ndarray,
+                  max_time_infected: int = MAX_TIME_INFECTED) -> np.ndarray:
+    """ Function that adds a cycle to the time infected of the infectious
+        individuals, and makes the ones that reach max_time_infected recover
+        with a new healthy speed.
+
+    Args:
+        current (dict): The columns of the current frame, by column name.
+        following (dict): The columns of the next frame, by column name.
+        owned (np.ndarray): The indices of the individuals to update.
+        infectious (np.ndarray): Boolean array that is True for the owned
+            individuals that are infected and not in cooldown.
+        uniforms (np.ndarray): One uniform random number per owned
+            individual for the healthy speed.
+        max_time_infected (int): The cycles an individual stays infected.
+            Defaults to MAX_TIME_INFECTED.
+
+    Returns:
+        recovered (np.ndarray): The indices of the individuals that
+            recovered.
+    """
+    following["time_infected"][owned[infectious]] += 1
+    recovering = infectious & (
+        current["time_infected"][owned] + 1 == max_time_infected)
+    recovered = owned[recovering]
+    following["recovered"][recovered] = True
+    following["status"][recovered] = STATUS_HEALTHY
+    following["speed"][recovered] = scale(HEALTHY_SPEED,
+                                          uniforms[recovering])
+    return recovered
+
+
+@instrumented("infection")
+def contagion_step(current: dict, following: dict, owned: np.ndarray,
+                   susceptible: np.ndarray, counts: np.ndarray,
+                   infection_uniforms: np.ndarray,
+                   speed_uniforms: np.ndarray,
+                   max_cooldown: int = MAX_COOLDOWN) -> np.ndarray:
+    """ Function that draws which susceptible individuals with infected
+        neighbors get infected, gives them a new infected speed, and starts
+        a cooldown of max_cooldown cycles for the ones that had contact but
+        did not get infected.
+
+    Args:
+        current (dict): The columns of the current frame, by column name.
+        following (dict): The columns of the next frame, by column name.
+        owned (np.ndarray): The indices of the individuals to update.
+        susceptible (np.ndarray): The positions in owned of the healthy
+            individuals that are not in cooldown.
+        counts (np.ndarray): The number of infected neighbors of each
+            susceptible individual.
+        infection_uniforms (np.ndarray): One uniform random number per
+            owned individual for the infection draw.
+        speed_uniforms (np.ndarray): One uniform random number per owned
+            individual for the infected speed.
+        max_cooldown (int): The cycles of the cooldown. Defaults to
+            MAX_COOLDOWN.
+
+    Returns:
+        infected (np.ndarray): The indices of the individuals that got
+            infected.
+    """
+    contact = counts > 0
+    exposed = susceptible[contact]
+    got_infected = draw_infections(
+        current["infection_probability"][owned[exposed]], counts[contact],
+        infection_uniforms[exposed])
+    infected = owned[exposed[got_infected]]
+    following["status"][infected] = STATUS_INFECTED
+    following["speed"][infected] = scale(
+        INFECTED_SPEED, speed_uniforms[exposed[got_infected]])
+    following["cooldown"][owned[exposed[~got_infected]]] = max_cooldown
+    return infected
+
+
+def attribute_infections(x: np.ndarray, y: np.ndarray,
+                         infectees: np.ndarray, spatial_index: SpatialIndex,
+                         radius: float, uniforms: np.ndarray) -> np.ndarray:
+    """ Function that picks which infected neighbor infected each infectee.
+        Every infected individual within the infection radius was equally
+        likely to be the one, so one is picked uniformly. The neighbors of
+        every infectee are sorted by index first, so the pick doesn't depend
+        on how the spatial index orders them.
+
+    Args:
+        x (np.ndarray): The positions of the population in the 'x' axis,
+            when the infections were drawn.
+        y (np.ndarray): The positions of the population in the 'y' axis,
+            when the infections were drawn.
+        infectees (np.ndarray): The indices of the individuals that got
+            infected.
+        spatial_index (SpatialIndex): A spatial index that contains the
+            positions of the infected individuals when the infections were
+            drawn.
+        radius (float): The infection radius.
+        uniforms (np.ndarray): One uniform random number in [0, 1) for each
+            infectee.
+
+    Returns:
+        infectors (np.ndarray): The index of the infector of each infectee,
+            or -1 if no infected individual is within the radius.
+    """
+    queries, ids = spatial_index.pairs(x[infectees], y[infectees], radius)
+    neighbors = spatial_index.data[ids]
+    order = np.lexsort((neighbors, queries))
+    neighbors = neighbors[order]
+    counts = np.bincount(queries, minlength=len(infectees))
+    starts = np.cumsum(counts) - counts
+    infectors = np.full(len(infectees), -1, dtype=np.intp)
+    found = counts > 0
+    infectors[found] = neighbors[starts[found] + (
+        uniforms[found] * counts[found]).astype(np.intp)]
+    return infectors
@@ -0,0 +1,203 @@
+""" This module defines the EventLog class, which writes the structured
+    events of a simulation to a JSON-lines file from a background thread, so
+    the thread that emits them never formats a message or waits on a file.
+"""
+from __future__ import annotations
+from queue import SimpleQueue
+from threading import Event, Thread
+import json
+import time
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING}
+BATCH = 256
+FLUSH_POLL = 0.1
+
+
+class EventLog:
+    """ This is the definition of the EventLog class. An event is a name, a
+        level and a few fields. emit() only checks the level and puts a
+        tuple in an unbounded queue, so it never blocks. A background writer
+        thread takes the events out of the queue in batches of up to BATCH,
+        turns every one into a JSON object with the time, the level name,
+        the event name and the fields, and writes the batch as JSON lines.
+        Without a sink, or below the level, events are dropped right away.
+        If the sink can't be opened or written, the writer thread stops and
+        keeps the error, and the next emit(), flush() or close() raises it
+        instead of queueing events nobody will write.
+
+    Args:
+        sink (str): The path of the JSON-lines file, or a writable text
+            file. Defaults to None, which drops every event.
+        level (str): The lowest level that is written: "debug", "info" or
+            "warning". Defaults to "info".
+
+    Attributes:
+        level: Integer with the lowest level that is written.
+        enabled: Boolean that is True when a sink was given.
+        running: Boolean that is True while the writer thread runs.
+        error: The OSError that stopped the writer thread, or None.
+    """
+
+    def __init__(self, sink=None, level: str = "info") -> None:
+        if level not in LEVELS:
+            raise ValueError(f"Unknown event level: {level}")
+        self._level = LEVELS[level]
+        self._sink = sink
+        self._file = None
+        self._queue = SimpleQueue()
+        self._thread = None
+        self._error = None
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @property
+    def enabled(self) -> bool:
+        return self._sink is not None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def error(self) -> OSError:
+        return self._error
+
+    def check(self) -> None:
+        """ Method that raises the error that stopped the writer thread, if
+            it stopped because of one.
+
+        Raises:
+            OSError: If the sink could not be opened or written.
+        """
+        if self._error is not None:
+            raise self._error
+
+    def enabled_for(self, level: int) -> bool:
+        """ Method that tells if events of a level are written, to skip
+            building expensive fields when they are not.
+
+        Args:
+            level (int): The level of the event.
+
+        Returns:
+            enabled (bool): True if the events are written.
+        """
+        return self._sink is not None and level >= self._level
+
+    def emit(self, level: int, event: str, **fields) -> None:
+        """ Method that queues an event for the writer thread, starting it
+            on the first event.
+
+        Args:
+            level (int): The level of the event: DEBUG, INFO or WARNING.
+            event (str): The name of the event.
+            **fields: The values of the event. They must be JSON
+                serializable.
+
+        Raises:
+            OSError: If the writer thread stopped because the sink could
+                not be opened or written.
+        """
+        if self._sink is None or level < self._level:
+            return
+        self.check()
+        if self._thread is None:
+            self.start()
+        self._queue.put((time.time(), level, event, fields))
+
+    def start(self) -> None:
+        """ Method that starts the writer thread, if it isn't running. The
+            thread opens the sink itself, so the thread that emits the first
+            event never waits on the file system.
+        """
+        if self.running or self._sink is None:
+            return
+        self._thread = Thread(target=self.run, name="EventLog", daemon=True)
+        self._thread.start()
+
+    def run(self) -> None:
+        """ Method that runs in the writer thread: it opens the sink when it
+            is a path, then waits for an event, takes the ones queued after
+            it up to BATCH, and writes them in one go, until close() queues
+            None. An OSError stops the thread and is kept in self.error.
+        """
+        try:
+            if (isinstance(self._sink, str) or
+                    hasattr(self._sink, "__fspath__")):
+                self._file = open(self._sink, "a", encoding="utf-8")
+            else:
+                self._file = self._sink
+            self.write_batches()
+        except OSError as error:
+            self._error = error
+
+    def write_batches(self) -> None:
+        """ Method that writes the queued events in batches to the opened
+            sink, until close() queues None.
+        """
+        names = {number: name for name, number in LEVELS.items()}
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH and not self._queue.empty():
+                batch.append(self._queue.get())
+            lines = []
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, Event):
+                    self._file.write("".join(lines))
+                    self._file.flush()
+                    lines = []
+                    item.set()
+                else:
+                    stamp, level, event, fields = item
+                    lines.append(json.dumps(
+                        {"time": stamp, "level": names[level],
+                         "event": event, **fields},
+                        separators=(",", ":")) + "\n")
+            self._file.write("".join(lines))
+            self._file.flush()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """ Method that waits until every event queued so far is written.
+
+        Raises:
+            OSError: If the writer thread stopped because the sink could
+                not be opened or written.
+        """
+        self.check()
+        if not self.running:
+            return
+        written = Event()
+        self._queue.put(written)
+        while not written.wait(FLUSH_POLL):
+            if not self._thread.is_alive():
+                self.check()
+                return
+
+    def close(self) -> None:
+        """ Method that writes the queued events, stops the writer thread
+            and closes the file it opened.
+
+        Raises:
+            OSError: If the writer thread stopped because the sink could
+                not be opened or written. The thread is stopped and the
+                file closed anyway.
+        """
+        if not self.running:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._file is not None and self._file is not self._sink:
+            self._file.close()
+        self._file = None
+        self.check()
@@ -0,0 +1,252 @@
+""" This module defines the Journal class, which records the actions a user
+    takes on a simulation with the tick they were taken at, and the
+    functions that replay a saved journal on a headless SimulationEngine as
+    fast as it can tick, so an interactive run can be repeated exactly.
+"""
+from __future__ import annotations
+from infection.engine.events import EventLog
+from infection.engine.simulation_engine import SimulationEngine
+import argparse
+import json
+import sys
+import time
+
+JOURNAL_VERSION = 1
+ACTIONS = ("add_healthy", "add_infected", "reset", "infection_probability",
+           "bounds")
+SETTINGS = ("width", "height", "individual_size", "infection_probability",
+            "index_backend", "seed", "max_time_infected", "max_cooldown")
+
+
+class Journal:
+    """ This is the definition of the Journal class. It keeps the settings
+        an engine was created with, its seed included, and every action
+        taken on it as a (tick, action, value) entry, where the tick is the
+        number of ticks the engine had run when the action was taken. The
+        actions are the names in ACTIONS: adding healthy or infected
+        individuals, resetting the population, changing the infection
+        probability and changing the arena bounds. Since every random
+        number of a run comes from the seed, applying the same actions at
+        the same ticks gives the same run.
+
+    Args:
+        settings (dict): The arguments the engine was created with, by name
+            in SETTINGS. The missing ones take the engine's defaults.
+
+    Attributes:
+        settings: Dictionary with the arguments of the engine.
+        actions: List with the (tick, action, value) entries, in the order
+            they were taken.
+        ticks: Integer with the tick count the run ended at, or None while
+            it runs.
+    """
+
+    def __init__(self, settings: dict) -> None:
+        self._settings = {name: settings[name] for name in SETTINGS
+                          if name in settings}
+        self._actions = []
+        self._ticks = None
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    @classmethod
+    def from_engine(cls, engine: SimulationEngine) -> Journal:
+        """ Method that creates an empty journal with the settings of an
+            engine that has not been changed yet.
+
+        Args:
+            engine (SimulationEngine): The engine.
+
+        Returns:
+            journal (Journal): The new journal.
+        """
+        x_min, y_min, x_max, y_max = engine.bounds
+        return cls({"width": x_max - x_min, "height": y_max - y_min,
+                    "individual_size": engine.individual_size,
+                    "infection_probability": engine.infection_probability,
+                    "index_backend": engine.index_backend,
+                    "seed": engine.seed,
+                    "max_time_infected": engine.max_time_infected,
+                    "max_cooldown": engine.max_cooldown})
+
+    @classmethod
+    def load(cls, path: str) -> Journal:
+        """ Method that reads a journal written by save().
+
+        Args:
+            path (str): The path of the JSON file.
+
+        Returns:
+            journal (Journal): The journal.
+
+        Raises:
+            ValueError: If the file was written by an unknown journal
+                version.
+        """
+        with open(path, encoding="utf-8") as file:
+            document = json.load(file)
+        if document.get("version") != JOURNAL_VERSION:
+            raise ValueError(
+                f"Unknown journal version: {document.get('version')}")
+        journal = cls(document["settings"])
+        for tick, action, value in document["actions"]:
+            journal.record(tick, action, value)
+        journal.ticks = document["ticks"]
+        return journal
+
+    @property
+    def settings(self) -> dict:
+        return self._settings
+
+    @property
+    def actions(self) -> list:
+        return self._actions
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @ticks.setter
+    def ticks(self, ticks: int) -> None:
+        self._ticks = ticks
+
+    def record(self, tick: int, action: str, value=None) -> None:
+        """ Method that appends an action to the journal.
+
+        Args:
+            tick (int): The number of ticks the engine had run.
+            action (str): The action, one of ACTIONS.
+            value: The number of individuals added, the new infection
+                probability, the new bounds or the seed a reset restarted
+                from. Defaults to None.
+
+        Raises:
+            ValueError: If the action is not one of ACTIONS.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown journal action: {action}")
+        if isinstance(value, tuple):
+            value = list(value)
+        self._actions.append((tick, action, value))
+
+    def clear(self) -> None:
+        """ Method that forgets every action, keeping the settings.
+        """
+        self._actions = []
+        self._ticks = None
+
+    def save(self, path: str) -> None:
+        """ Method that writes the settings, the actions and the final tick
+            count to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"version": JOURNAL_VERSION,
+                       "settings": self.settings,
+                       "actions": self.actions,
+                       "ticks": self.ticks}, file)
+
+
+def apply(engine: SimulationEngine, action: str, value=None) -> None:
+    """ Function that takes a journaled action on an engine.
+
+    Args:
+        engine (SimulationEngine): The engine.
+        action (str): The action, one of ACTIONS.
+        value: The value of the action.
+
+    Raises:
+        ValueError: If the action is not one of ACTIONS.
+    """
+    match action:
+        case "add_healthy":
+            engine.add_healthy(value)
+        case "add_infected":
+            engine.add_infected(value)
+        case "reset":
+            engine.reset(value)
+        case "infection_probability":
+            engine.infection_probability = value
+        case "bounds":
+            engine.bounds = value
+        case _:
+            raise ValueError(f"Unknown journal action: {action}")
+
+
+def replay(journal: Journal, workers: int = 1, ticks: int = None,
+           events: EventLog = None) -> SimulationEngine:
+    """ Function that creates an engine with the settings of a journal and
+        runs it back to back, taking every action when the engine reaches
+        its tick, until the final tick count.
+
+    Args:
+        journal (Journal): The journal to replay.
+        workers (int): The number of worker processes of the engine.
+            Defaults to 1.
+        ticks (int): The tick count to stop at after the last action.
+            Defaults to the final tick count of the journal, or to the tick
+            of the last action if it has none.
+        events (EventLog): The log the engine's events are emitted to.
+            Defaults to None, which drops them.
+
+    Returns:
+        engine (SimulationEngine): The engine at the end of the replay. Call
+            its close() method when done.
+    """
+    engine = SimulationEngine(workers=workers, events=events,
+                              **journal.settings)
+    for tick, action, value in journal.actions:
+        while engine.ticks < tick:
+            engine.tick()
+        apply(engine, action, value)
+    if ticks is None:
+        ticks = journal.ticks if journal.ticks is not None else engine.ticks
+    while engine.ticks < ticks:
+        engine.tick()
+    return engine
+
+
+def main(argv: list = None) -> int:
+    """ Function that replays a journal from the command line, prints the
+        final counts and the ticks per second, and optionally saves the
+        time series and the final state of the engine.
+
+    Args:
+        argv (list): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        status (int): 0 when the replay finished.
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay a journaled simulation headless.")
+    parser.add_argument("journal", help="JSON journal to replay")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--ticks", type=int,
+                        help="tick count to stop at after the last action")
+    parser.add_argument("--series", help=".csv or .npz file to save the "
+                        "time series to")
+    parser.add_argument("--state", help=".npz file to save the final state "
+                        "to")
+    arguments = parser.parse_args(argv)
+    start = time.perf_counter()
+    engine = replay(Journal.load(arguments.journal), arguments.workers,
+                    arguments.ticks)
+    seconds = time.perf_counter() - start
+    try:
+        print(f"ticks={engine.ticks} healthy={engine.healthy} "
+              f"infected={engine.infected} recovered={engine.recovered} "
+              f"ticks_per_second={engine.metrics.ticks.count / seconds:.1f}")
+        if arguments.series:
+            engine.save_series(arguments.series)
+        if arguments.state:
+            engine.save_state(arguments.state)
+    finally:
+        engine.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
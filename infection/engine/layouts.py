@@ -0,0 +1,146 @@
+""" This module defines the spawn layouts, the functions that draw the
+    positions of many new individuals at once, and the spawn_positions
+    function that picks one of them by name.
+"""
+from __future__ import annotations
+from infection.engine.spatial_index import GridIndex
+import numpy as np
+
+LAYOUTS = ("uniform", "clustered", "poisson_disk")
+MAX_ROUNDS = 64
+
+
+def uniform_positions(random: np.random.Generator, number: int,
+                      area: tuple[float, float, float, float]
+                      ) -> tuple[np.ndarray, np.ndarray]:
+    """ Function that draws positions uniformly distributed over the area.
+
+    Args:
+        random (np.random.Generator): The source of random numbers.
+        number (int): The number of positions to draw.
+        area (tuple[float, float, float, float]): The (x_min, y_min, x_max,
+            y_max) limits of the positions.
+
+    Returns:
+        x (np.ndarray): The positions in the 'x' axis.
+        y (np.ndarray): The positions in the 'y' axis.
+    """
+    x_min, y_min, x_max, y_max = area
+    return (random.uniform(x_min, x_max, number),
+            random.uniform(y_min, y_max, number))
+
+
+def clustered_positions(random: np.random.Generator, number: int,
+                        area: tuple[float, float, float, float],
+                        clusters: int = 5, spread: float = None
+                        ) -> tuple[np.ndarray, np.ndarray]:
+    """ Function that draws positions in Gaussian blobs around cluster
+        centers spread uniformly over the area. Every position picks a
+        random cluster, and the positions that fall outside of the area are
+        clipped to its edge.
+
+    Args:
+        random (np.random.Generator): The source of random numbers.
+        number (int): The number of positions to draw.
+        area (tuple[float, float, float, float]): The (x_min, y_min, x_max,
+            y_max) limits of the positions.
+        clusters (int): The number of clusters. Defaults to 5.
+        spread (float): The standard deviation of every blob. Defaults to 5%
+            of the smaller side of the area.
+
+    Returns:
+        x (np.ndarray): The positions in the 'x' axis.
+        y (np.ndarray): The positions in the 'y' axis.
+    """
+    x_min, y_min, x_max, y_max = area
+    if spread is None:
+        spread = .05 * min(x_max - x_min, y_max - y_min)
+    center_x, center_y = uniform_positions(random, clusters, area)
+    cluster = random.integers(0, clusters, number)
+    x = random.normal(center_x[cluster], spread)
+    y = random.normal(center_y[cluster], spread)
+    return np.clip(x, x_min, x_max), np.clip(y, y_min, y_max)
+
+
+def poisson_disk_positions(random: np.random.Generator, number: int,
+                           area: tuple[float, float, float, float],
+                           radius: float) -> tuple[np.ndarray, np.ndarray]:
+    """ Function that draws positions with no two of them within radius of
+        each other, by throwing darts in rounds. Every round draws a batch of
+        uniform candidates, drops the ones within radius of an accepted
+        position with a GridIndex, drops the ones within radius of an earlier
+        candidate of the same batch, and accepts the rest. The size of the
+        batch follows the acceptance rate of the previous round, so it takes
+        a few rounds even when the area is nearly full.
+
+    Args:
+        random (np.random.Generator): The source of random numbers.
+        number (int): The number of positions to draw.
+        area (tuple[float, float, float, float]): The (x_min, y_min, x_max,
+            y_max) limits of the positions.
+        radius (float): The minimum distance between two positions.
+
+    Returns:
+        x (np.ndarray): The positions in the 'x' axis.
+        y (np.ndarray): The positions in the 'y' axis.
+
+    Raises:
+        ValueError: If the area can't fit "number" positions after
+            MAX_ROUNDS rounds.
+    """
+    x, y = np.empty(0), np.empty(0)
+    acceptance = .5
+    for _ in range(MAX_ROUNDS):
+        missing = number - len(x)
+        if missing <= 0:
+            break
+        candidates = int(min(missing / acceptance, 16 * number)) + 1
+        candidate_x, candidate_y = uniform_positions(random, candidates,
+                                                     area)
+        accepted = GridIndex(radius).build(x, y, np.arange(len(x)))
+        keep = accepted.count_neighbors(candidate_x, candidate_y, radius) == 0
+        candidate_x, candidate_y = candidate_x[keep], candidate_y[keep]
+        batch = GridIndex(radius).build(candidate_x, candidate_y,
+                                        np.arange(len(candidate_x)))
+        queries, earlier = batch.pairs(candidate_x, candidate_y, radius)
+        keep = np.ones(len(candidate_x), dtype=bool)
+        keep[queries[earlier < queries]] = False
+        acceptance = max(np.count_nonzero(keep) / candidates, 1 / 16)
+        x = np.concatenate((x, candidate_x[keep][:missing]))
+        y = np.concatenate((y, candidate_y[keep][:missing]))
+    if len(x) < number:
+        raise ValueError(f"Can't fit {number} individuals {radius} apart")
+    return x, y
+
+
+def spawn_positions(layout: str, random: np.random.Generator, number: int,
+                    area: tuple[float, float, float, float], **options
+                    ) -> tuple[np.ndarray, np.ndarray]:
+    """ Function that draws "number" positions with the given layout.
+
+    Args:
+        layout (str): The name of the layout: "uniform", "clustered" or
+            "poisson_disk".
+        random (np.random.Generator): The source of random numbers.
+        number (int): The number of positions to draw.
+        area (tuple[float, float, float, float]): The (x_min, y_min, x_max,
+            y_max) limits of the positions.
+        **options: The options of the layout, like "clusters" and "spread"
+            for "clustered" or "radius" for "poisson_disk".
+
+    Returns:
+        x (np.ndarray): The positions in the 'x' axis.
+        y (np.ndarray): The positions in the 'y' axis.
+
+    Raises:
+        ValueError: If the layout is unknown.
+    """
+    match layout:
+        case "uniform":
+            return uniform_positions(random, number, area)
+        case "clustered":
+            return clustered_positions(random, number, area, **options)
+        case "poisson_disk":
+            return poisson_disk_positions(random, number, area, **options)
+        case _:
+            raise ValueError(f"Unknown spawn layout: {layout}")
@@ -0,0 +1,223 @@
+""" This module defines the Histogram and Metrics classes, which keep the
+    durations of the latest ticks and frames of a simulation and turn them
+    into rates, quantiles and the Prometheus text exposition format.
+"""
+from __future__ import annotations
+import time
+import numpy as np
+
+WINDOW = 1024
+FRAME_BUDGET = 1.0 / 60.0
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+           1.0, 2.5)
+
+
+class Histogram:
+    """ This is the definition of the Histogram class. Every observation is
+        a duration in seconds. The last "window" durations, and the moments
+        they ended, are kept in preallocated ring buffers for the rate and
+        the quantiles, and every observation since the start is added to the
+        cumulative BUCKETS counts, the sum and the count of a Prometheus
+        histogram.
+
+    Args:
+        window (int): The number of latest observations kept. Defaults to
+            WINDOW.
+
+    Attributes:
+        count: Integer with the number of observations since the start.
+        total: Float with the sum of every observation, in seconds.
+        buckets: Integer array with the number of observations that are
+            less than or equal to each of BUCKETS, and then all of them.
+        latest: Float array with the last "window" observations, oldest
+            first.
+    """
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self._durations = np.zeros(window)
+        self._stamps = np.zeros(window)
+        self._count = 0
+        self._total = 0.0
+        self._buckets = np.zeros(len(BUCKETS) + 1, dtype=np.int64)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def buckets(self) -> np.ndarray:
+        return np.cumsum(self._buckets)
+
+    @property
+    def latest(self) -> np.ndarray:
+        window = len(self._durations)
+        if self._count < window:
+            return self._durations[:self._count].copy()
+        return np.roll(self._durations, -(self._count % window))
+
+    def observe(self, seconds: float, stamp: float = None) -> None:
+        """ Method that adds a duration to the histogram.
+
+        Args:
+            seconds (float): The duration.
+            stamp (float): The time.perf_counter() when it ended. Defaults
+                to now.
+        """
+        if stamp is None:
+            stamp = time.perf_counter()
+        slot = self._count % len(self._durations)
+        self._durations[slot] = seconds
+        self._stamps[slot] = stamp
+        self._count += 1
+        self._total += seconds
+        self._buckets[np.searchsorted(BUCKETS, seconds)] += 1
+
+    def quantile(self, q: float) -> float:
+        """ Method that returns a quantile of the latest durations.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            seconds (float): The quantile, or 0.0 without observations.
+        """
+        latest = self._durations[:min(self._count, len(self._durations))]
+        return float(np.quantile(latest, q)) if len(latest) else 0.0
+
+    def rate(self) -> float:
+        """ Method that returns how many observations ended per second,
+            between the oldest and the newest of the latest ones.
+
+        Returns:
+            rate (float): The observations per second, or 0.0 with less than
+                two of them.
+        """
+        kept = min(self._count, len(self._stamps))
+        if kept < 2:
+            return 0.0
+        newest = self._stamps[(self._count - 1) % len(self._stamps)]
+        oldest = self._stamps[(self._count - kept) % len(self._stamps)]
+        return (kept - 1) / (newest - oldest) if newest > oldest else 0.0
+
+    def prometheus(self, name: str, description: str) -> list:
+        """ Method that writes the histogram in the Prometheus text
+            exposition format.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The HELP text of the metric.
+
+        Returns:
+            lines (list): The lines of the metric.
+        """
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+        for bound, count in zip(BUCKETS + ("+Inf",), self.buckets):
+            lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+        lines.append(f"{name}_sum {self.total}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class Metrics:
+    """ This is the definition of the Metrics class. It keeps a Histogram of
+        the tick durations, recorded by the engine, and one of the frame
+        durations, recorded by the App, and counts the dropped frames: the
+        frame budgets that went by without a new frame.
+
+    Args:
+        window (int): The number of latest ticks and frames kept. Defaults
+            to WINDOW.
+        frame_budget (float): The seconds between two frames. Defaults to
+            FRAME_BUDGET.
+
+    Attributes:
+        ticks: Histogram with the duration of every tick.
+        frames: Histogram with the duration of every frame.
+        dropped_frames: Integer with the number of dropped frames.
+        frame_budget: Float with the seconds between two frames.
+    """
+
+    def __init__(self, window: int = WINDOW,
+                 frame_budget: float = FRAME_BUDGET) -> None:
+        self._ticks = Histogram(window)
+        self._frames = Histogram(window)
+        self._dropped_frames = 0
+        self._frame_budget = frame_budget
+
+    @property
+    def ticks(self) -> Histogram:
+        return self._ticks
+
+    @property
+    def frames(self) -> Histogram:
+        return self._frames
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    @property
+    def frame_budget(self) -> float:
+        return self._frame_budget
+
+    def record_tick(self, seconds: float) -> None:
+        """ Method that records the duration of a tick.
+
+        Args:
+            seconds (float): The duration of the tick.
+        """
+        self.ticks.observe(seconds)
+
+    def record_frame(self, seconds: float) -> None:
+        """ Method that records the time between two frames, and the frames
+            dropped in between.
+
+        Args:
+            seconds (float): The seconds since the last frame.
+        """
+        self.frames.observe(seconds)
+        self._dropped_frames += max(
+            int(seconds / self.frame_budget + .5) - 1, 0)
+
+    def snapshot(self) -> dict:
+        """ Method that summarizes the latest ticks and frames.
+
+        Returns:
+            snapshot (dict): The ticks per second, the mean frame time, the
+                p50 and p99 tick durations in seconds, and the dropped
+                frames.
+        """
+        frames = self.frames.latest
+        return {"ticks_per_second": self.ticks.rate(),
+                "frame_time": float(frames.mean()) if len(frames) else 0.0,
+                "tick_p50": self.ticks.quantile(.5),
+                "tick_p99": self.ticks.quantile(.99),
+                "dropped_frames": self.dropped_frames}
+
+    def prometheus(self, gauges: dict) -> str:
+        """ Method that writes the histograms, the dropped frames, the
+            latest ticks per second and the given gauges in the Prometheus
+            text exposition format.
+
+        Args:
+            gauges (dict): Extra gauge values, like the number of agents, by
+                metric name.
+
+        Returns:
+            text (str): The metrics, one per line.
+        """
+        lines = self.ticks.prometheus("infection_tick_duration_seconds",
+                                      "Duration of a simulation tick.")
+        lines += self.frames.prometheus("infection_frame_duration_seconds",
+                                        "Time between two rendered frames.")
+        lines += ["# HELP infection_dropped_frames_total Frames dropped.",
+                  "# TYPE infection_dropped_frames_total counter",
+                  f"infection_dropped_frames_total {self.dropped_frames}"]
+        gauges = {"infection_ticks_per_second": self.ticks.rate(), **gauges}
+        for name, value in gauges.items():
+            lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,123 @@
+""" This module defines the MetricsServer class, a small HTTP server that
+    publishes the metrics of a SimulationEngine in the Prometheus text
+    exposition format, so a headless run can be watched live.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infection.engine.simulation_engine import SimulationEngine
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9464
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """ This is the definition of the MetricsHandler class. It inherits from
+        the BaseHTTPRequestHandler class, answers GET /metrics with the
+        metrics of the server's engine, and any other path with a 404.
+    """
+
+    def do_GET(self) -> None:
+        """ Method that answers a GET request.
+        """
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.metrics_server.exposition().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """ Method that keeps the scrapes out of the standard error.
+        """
+
+
+class MetricsServer:
+    """ This is the definition of the MetricsServer class. It serves the
+        tick and frame histograms of the engine's Metrics, plus the agent
+        counts, from a background thread. It only listens on the local
+        machine by default.
+
+    Args:
+        engine (SimulationEngine): The engine to publish.
+        host (str): The address to listen on. Defaults to METRICS_HOST.
+        port (int): The port to listen on, or 0 for any free port. Defaults
+            to METRICS_PORT.
+
+    Attributes:
+        engine: The SimulationEngine being published.
+        port: Integer with the port the server listens on, once started.
+        url: String with the URL of the metrics, once started.
+        running: Boolean that is True while the server runs.
+    """
+
+    def __init__(self, engine: SimulationEngine, host: str = METRICS_HOST,
+                 port: int = METRICS_PORT) -> None:
+        self._engine = engine
+        self._address = (host, port)
+        self._server = None
+        self._thread = None
+
+    @property
+    def engine(self) -> SimulationEngine:
+        return self._engine
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._address[0]}:{self.port}/metrics"
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def exposition(self) -> str:
+        """ Method that writes the current metrics of the engine.
+
+        Returns:
+            text (str): The metrics in the Prometheus text format.
+        """
+        engine = self.engine
+        return engine.metrics.prometheus({
+            "infection_agents": len(engine.population),
+            "infection_healthy": engine.healthy,
+            "infection_infected": engine.infected,
+            "infection_recovered": engine.recovered,
+            "infection_ticks": engine.ticks})
+
+    def start(self) -> MetricsServer:
+        """ Method that starts serving from a background thread, if it isn't
+            running.
+
+        Returns:
+            self (MetricsServer): The running server.
+        """
+        if self.running:
+            return self
+        self._server = ThreadingHTTPServer(self._address, MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.metrics_server = self
+        self._thread = Thread(target=self._server.serve_forever,
+                              name="MetricsServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """ Method that stops the server and releases its port.
+        """
+        if not self.running:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
@@ -0,0 +1,40 @@
+""" This module defines the move function, the batched movement kernel that
+    advances the whole population one step with NumPy array operations.
+"""
+from __future__ import annotations
+from infection.decorators.instrumentation import instrumented
+import numpy as np
+
+
+@instrumented("movement")
+def move(x: np.ndarray, y: np.ndarray, direction_x: np.ndarray,
+         direction_y: np.ndarray, speed: np.ndarray,
+         bounds: tuple[float, float, float, float], size: float) -> None:
+    """ Function that moves every individual one step in its direction, in
+        place, and makes the ones that crossed an edge of the arena "bounce"
+        by inverting the component of their direction that points out of the
+        arena. Only directions pointing outwards are inverted, so an
+        individual that is still outside after bouncing keeps moving back
+        in. The arrays can have any shape, as long as all of them match.
+
+    Args:
+        x (np.ndarray): The positions in the 'x' axis. Updated in place.
+        y (np.ndarray): The positions in the 'y' axis. Updated in place.
+        direction_x (np.ndarray): The directions in the 'x' axis. Updated
+            in place.
+        direction_y (np.ndarray): The directions in the 'y' axis. Updated
+            in place.
+        speed (np.ndarray): The speeds.
+        bounds (tuple[float, float, float, float]): The (x_min, y_min,
+            x_max, y_max) limits of the arena.
+        size (float): The size of an individual.
+    """
+    x_min, y_min, x_max, y_max = bounds
+    x += direction_x * speed
+    y += direction_y * speed
+    np.negative(direction_x, out=direction_x,
+                where=(((x < x_min) & (direction_x < 0)) |
+                       ((x + size > x_max) & (direction_x > 0))))
+    np.negative(direction_y, out=direction_y,
+                where=(((y < y_min) & (direction_y < 0)) |
+                       ((y + size > y_max) & (direction_y > 0))))
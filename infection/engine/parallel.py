@@ -0,0 +1,275 @@
+""" This module defines the SharedPopulation class, a Population whose columns
+    live in shared memory, and the ProcessPool class, which steps the
+    infection and the movement of a SharedPopulation in worker processes.
+    Workers attach to the columns by name, read the current frame and write
+    their results straight into the next one, so no individual is ever
+    copied between processes.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from infection.engine import epidemic, movement
+from infection.engine.population import Population
+from infection.engine.random_streams import RandomStreams
+from infection.engine.spatial_index import create_index
+import numpy as np
+
+_segments = {}
+
+
+class SharedPopulation(Population):
+    """ This is the definition of the SharedPopulation class. It stores every
+        column in its own shared memory block, so worker processes can read
+        and write the population in place. When a column grows, the old
+        block is unlinked right away and closed with close().
+
+    Args:
+        capacity (int): The number of individuals the arrays can hold before
+            they need to grow. Defaults to 1024.
+
+    Attributes:
+        blocks: Dictionary with the (shared memory name, dtype, capacity) of
+            every column, by column name. It is all a worker needs to attach
+            to the population.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._blocks = {}
+        self._retired = []
+        super().__init__(capacity)
+
+    @property
+    def blocks(self) -> dict:
+        return {name: (self._blocks[name].name, array.dtype.str,
+                       array.shape[1])
+                for name, array in self._arrays.items()}
+
+    def allocate(self, name: str, capacity: int,
+                 dtype: np.dtype) -> np.ndarray:
+        """ Method that allocates a zeroed array for a column in a new shared
+            memory block, retiring the block the column used before.
+
+        Args:
+            name (str): The name of the column.
+            capacity (int): The number of values each frame must hold.
+            dtype (np.dtype): The data type of the column.
+
+        Returns:
+            array (np.ndarray): The new array, with shape (2, capacity),
+                backed by shared memory.
+        """
+        block = SharedMemory(create=True,
+                             size=2 * capacity * np.dtype(dtype).itemsize)
+        if name in self._blocks:
+            self._blocks[name].unlink()
+            self._retired.append(self._blocks[name])
+        self._blocks[name] = block
+        array = np.ndarray((2, capacity), dtype, buffer=block.buf)
+        array[:] = 0
+        return array
+
+    def close(self) -> None:
+        """ Method that releases the shared memory of the population. The
+            population can't be used after it is closed.
+        """
+        self._arrays = {}
+        self._size = 0
+        for block in self._retired:
+            try:
+                block.close()
+            except BufferError:
+                pass
+        for block in self._blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                pass
+            block.unlink()
+        self._retired = []
+        self._blocks = {}
+
+
+def attach(blocks: dict, size: int, frame: int) -> tuple[dict, dict]:
+    """ Function that attaches a worker to the shared memory blocks of a
+        SharedPopulation. The blocks stay attached between calls, and the
+        ones the population no longer uses are closed.
+
+    Args:
+        blocks (dict): The blocks of the population, from
+            SharedPopulation.blocks.
+        size (int): The number of individuals in the population.
+        frame (int): The current frame of the population.
+
+    Returns:
+        current (dict): A view of the used part of every column in the
+            current frame, by column name.
+        following (dict): A view of the used part of every column in the
+            next frame, by column name.
+    """
+    names = {block_name for block_name, _, _ in blocks.values()}
+    for block_name in list(_segments):
+        if block_name not in names:
+            _segments.pop(block_name).close()
+    current, following = {}, {}
+    for name, (block_name, dtype, capacity) in blocks.items():
+        if block_name not in _segments:
+            _segments[block_name] = SharedMemory(name=block_name)
+        array = np.ndarray((2, capacity), dtype,
+                           buffer=_segments[block_name].buf)
+        current[name] = array[frame, :size]
+        following[name] = array[1 - frame, :size]
+    return current, following
+
+
+def step_chunk(blocks: dict, size: int, frame: int,
+               strip: tuple[float, float], halo: np.ndarray, radius: float,
+               backend: str, bounds: tuple[float, float, float, float],
+               streams: RandomStreams, tick: int,
+               durations: tuple[int, int] = (epidemic.MAX_TIME_INFECTED,
+                                             epidemic.MAX_COOLDOWN)
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """ Function that steps, in a worker, the individuals in a vertical strip
+        of the arena: epidemic.infection_step updates their infection status
+        and then the movement kernel moves them, both in the next frame. The
+        strip owns the individuals with x0 <= x < x1 in the current frame,
+        and only writes to them. The "halo" holds every infected individual
+        that can be within radius of the strip, including the ones owned by
+        the neighbor strips, so the counts match a search over the whole
+        arena.
+
+    Args:
+        blocks (dict): The blocks of the population.
+        size (int): The number of individuals in the population.
+        frame (int): The current frame of the population.
+        strip (tuple[float, float]): The (x0, x1) limits of the strip.
+        halo (np.ndarray): The indices of the infected individuals within
+            radius of the strip.
+        radius (float): The infection radius, which is also the size of an
+            individual.
+        backend (str): The spatial index backend.
+        bounds (tuple[float, float, float, float]): The (x_min, y_min,
+            x_max, y_max) limits of the arena.
+        streams (RandomStreams): The random streams of the simulation.
+        tick (int): The tick number.
+        durations (tuple[int, int]): The cycles an individual stays
+            infected and the cycles of a cooldown. Defaults to
+            (MAX_TIME_INFECTED, MAX_COOLDOWN).
+
+    Returns:
+        infected (np.ndarray): The indices of the individuals that got
+            infected.
+        recovered (np.ndarray): The indices of the individuals that
+            recovered.
+    """
+    current, following = attach(blocks, size, frame)
+    x0, x1 = strip
+    owned = np.flatnonzero((current["x"] >= x0) & (current["x"] < x1))
+    spatial_index = create_index(backend, radius).build(
+        current["x"][halo], current["y"][halo], halo)
+    result = epidemic.infection_step(
+        current, following, owned, spatial_index, radius, backend,
+        streams.tick_uniforms(tick, owned, size), "auto", *durations)
+    names = ("x", "y", "direction_x", "direction_y", "speed")
+    moving = [following[name][owned] for name in names]
+    movement.move(*moving, bounds, radius)
+    for name, column in zip(names, moving):
+        following[name][owned] = column
+    return result
+
+
+class ProcessPool:
+    """ This is the definition of the ProcessPool class. It steps a
+        SharedPopulation with a pool of worker processes, one strip of the
+        arena each. The workers read the current frame and write the next
+        one, so no worker reads a value another one is writing, and the
+        infection and the movement of a tick run in a single phase. The
+        counters are merged once, from the results of every worker.
+
+    Args:
+        workers (int): The number of worker processes.
+
+    Attributes:
+        workers: Integer with the number of worker processes.
+        executor: The ProcessPoolExecutor that runs the workers.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._workers = workers
+        self._executor = ProcessPoolExecutor(workers)
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        return self._executor
+
+    def strips(self, x: np.ndarray) -> list[tuple[float, float]]:
+        """ Method that splits the arena into one vertical strip per worker,
+            with about the same number of individuals in each one. The first
+            and last strips are open, so every individual belongs to exactly
+            one strip.
+
+        Args:
+            x (np.ndarray): The positions of the population in the 'x' axis.
+
+        Returns:
+            strips (list[tuple[float, float]]): The (x0, x1) limits of every
+                strip.
+        """
+        edges = np.quantile(x, np.linspace(0, 1, self.workers + 1))
+        edges[0], edges[-1] = -np.inf, np.inf
+        return list(zip(edges[:-1], edges[1:]))
+
+    def step(self, population: SharedPopulation, infected: np.ndarray,
+             radius: float, backend: str,
+             bounds: tuple[float, float, float, float],
+             streams: RandomStreams, tick: int,
+             durations: tuple[int, int] = (epidemic.MAX_TIME_INFECTED,
+                                           epidemic.MAX_COOLDOWN)
+             ) -> tuple[np.ndarray, np.ndarray]:
+        """ Method that steps the population one tick in the workers, one
+            strip of the arena each, and merges their results. The workers
+            write the next frame of the population, which the caller swaps
+            in afterwards.
+
+        Args:
+            population (SharedPopulation): The population to step.
+            infected (np.ndarray): The indices of the individuals that were
+                infected at the start of the tick.
+            radius (float): The infection radius, which is also the size of
+                an individual.
+            backend (str): The spatial index backend.
+            bounds (tuple[float, float, float, float]): The (x_min, y_min,
+                x_max, y_max) limits of the arena.
+            streams (RandomStreams): The random streams of the simulation.
+            tick (int): The tick number.
+            durations (tuple[int, int]): The cycles an individual stays
+                infected and the cycles of a cooldown. Defaults to
+                (MAX_TIME_INFECTED, MAX_COOLDOWN).
+
+        Returns:
+            infected (np.ndarray): The indices of the individuals that got
+                infected.
+            recovered (np.ndarray): The indices of the individuals that
+                recovered.
+        """
+        if len(population) == 0:
+            return np.empty(0, np.intp), np.empty(0, np.intp)
+        blocks, size = population.blocks, len(population)
+        infected_x = population.x[infected]
+        futures = [self.executor.submit(
+            step_chunk, blocks, size, population.frame, (x0, x1),
+            infected[(infected_x >= x0 - radius) &
+                     (infected_x <= x1 + radius)],
+            radius, backend, bounds, streams, tick, durations)
+            for x0, x1 in self.strips(population.x)]
+        results = [future.result() for future in futures]
+        return (np.concatenate([result[0] for result in results]),
+                np.concatenate([result[1] for result in results]))
+
+    def close(self) -> None:
+        """ Method that shuts the worker processes down.
+        """
+        self.executor.shutdown()
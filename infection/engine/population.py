@@ -0,0 +1,405 @@
+""" This module defines the Population class, a struct-of-arrays store that
+    keeps every attribute of the individuals in its own NumPy column, and the
+    AgentView class used to access a single individual when needed.
+"""
+from __future__ import annotations
+import numpy as np
+
+STATUS_HEALTHY = 0
+STATUS_INFECTED = 1
+STATUS_NAMES = ("healthy", "infected")
+COLUMNS = {
+    "x": np.float64,
+    "y": np.float64,
+    "direction_x": np.float64,
+    "direction_y": np.float64,
+    "speed": np.float64,
+    "status": np.int8,
+    "time_infected": np.int32,
+    "cooldown": np.int32,
+    "infection_probability": np.float64,
+    "recovered": np.bool_,
+}
+
+
+class Population:
+    """ This is the definition of the Population class. Instead of one object
+        per individual, it stores each attribute of the whole population in a
+        NumPy array, so the simulation can update every individual with array
+        operations. The arrays are preallocated and doubled when they run out
+        of room, and every column property returns a view of the used part of
+        its array, so writing to it updates the population.
+
+        Every column holds two frames of the population. A tick reads the
+        current frame and writes the next one, then swaps them, so no update
+        of the tick can see another update of the same tick and the result
+        does not depend on the order in which the individuals, or the chunks
+        of individuals, are updated.
+
+    Args:
+        capacity (int): The number of individuals the arrays can hold before
+            they need to grow. Defaults to 1024.
+
+    Attributes:
+        size: Integer with the number of individuals in the population.
+        capacity: Integer with the number of individuals the arrays can hold.
+        frame: Integer with the row of the arrays that holds the current
+            frame, 0 or 1.
+        columns: Dictionary with a view of every column in the current
+            frame, by column name.
+        next_columns: Dictionary with a view of every column in the next
+            frame, by column name.
+        x: Float array with the position of each individual in the 'x' axis.
+        y: Float array with the position of each individual in the 'y' axis.
+        direction_x: Float array with the direction in the 'x' axis.
+        direction_y: Float array with the direction in the 'y' axis.
+        speed: Float array with the speed of each individual.
+        status: Integer array with the infection status code of each
+            individual: STATUS_HEALTHY or STATUS_INFECTED.
+        time_infected: Integer array that tracks during how many cycles each
+            individual has been infected.
+        cooldown: Integer array that tracks how many cycles are left until
+            the infection evaluations restart for each individual.
+        infection_probability: Float array with the probability of each
+            individual to get infected on contact.
+        recovered: Boolean array that is True for the individuals that have
+            recovered from an infection and can no longer get infected.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._frame = 0
+        self._arrays = {name: self.allocate(name, max(capacity, 1), dtype)
+                        for name, dtype in COLUMNS.items()}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> AgentView:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("population index out of range")
+        return AgentView(self, index)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield AgentView(self, index)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._arrays["x"].shape[1]
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def columns(self) -> dict:
+        return {name: self.column(name) for name in self._arrays}
+
+    @property
+    def next_columns(self) -> dict:
+        return {name: self.column(name, 1 - self._frame)
+                for name in self._arrays}
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.column("x")
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.column("y")
+
+    @property
+    def direction_x(self) -> np.ndarray:
+        return self.column("direction_x")
+
+    @property
+    def direction_y(self) -> np.ndarray:
+        return self.column("direction_y")
+
+    @property
+    def speed(self) -> np.ndarray:
+        return self.column("speed")
+
+    @property
+    def status(self) -> np.ndarray:
+        return self.column("status")
+
+    @property
+    def time_infected(self) -> np.ndarray:
+        return self.column("time_infected")
+
+    @property
+    def cooldown(self) -> np.ndarray:
+        return self.column("cooldown")
+
+    @property
+    def infection_probability(self) -> np.ndarray:
+        return self.column("infection_probability")
+
+    @property
+    def recovered(self) -> np.ndarray:
+        return self.column("recovered")
+
+    def column(self, name: str, frame: int = None) -> np.ndarray:
+        """ Method that returns a view of the used part of a column in a
+            frame.
+
+        Args:
+            name (str): The name of the column.
+            frame (int): The frame to view. Defaults to the current frame.
+
+        Returns:
+            column (np.ndarray): The view of the column.
+        """
+        if frame is None:
+            frame = self._frame
+        return self._arrays[name][frame, :self._size]
+
+    def allocate(self, name: str, capacity: int,
+                 dtype: np.dtype) -> np.ndarray:
+        """ Method that allocates a zeroed array for a column, with one row
+            per frame. Subclasses override it to store the columns somewhere
+            else, like in shared memory.
+
+        Args:
+            name (str): The name of the column.
+            capacity (int): The number of values each frame must hold.
+            dtype (np.dtype): The data type of the column.
+
+        Returns:
+            array (np.ndarray): The new array, with shape (2, capacity).
+        """
+        return np.zeros((2, capacity), dtype)
+
+    def reserve(self, capacity: int) -> None:
+        """ Method that grows every column so it can hold at least
+            "capacity" individuals, doubling the current capacity to keep
+            the number of reallocations low.
+
+        Args:
+            capacity (int): The number of individuals the arrays need to
+                hold.
+        """
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, 2 * self.capacity)
+        for name, array in self._arrays.items():
+            grown = self.allocate(name, new_capacity, array.dtype)
+            grown[:, :self._size] = array[:, :self._size]
+            self._arrays[name] = grown
+
+    def add(self, x: np.ndarray, y: np.ndarray, direction_x: np.ndarray,
+            direction_y: np.ndarray, speed: np.ndarray, status: int,
+            infection_probability: float = 0.0) -> np.ndarray:
+        """ Method that appends new individuals to the population. Every
+            argument can be a scalar or an array with one value per new
+            individual. The timers start at 0 and the individuals start as
+            not recovered.
+
+        Args:
+            x (np.ndarray): The positions in the 'x' axis.
+            y (np.ndarray): The positions in the 'y' axis.
+            direction_x (np.ndarray): The directions in the 'x' axis.
+            direction_y (np.ndarray): The directions in the 'y' axis.
+            speed (np.ndarray): The speeds.
+            status (int): The infection status code.
+            infection_probability (float): The infection probabilities.
+                Defaults to 0.
+
+        Returns:
+            indices (np.ndarray): The indices of the new individuals.
+        """
+        values = np.broadcast_arrays(x, y, direction_x, direction_y, speed,
+                                     status, infection_probability)
+        number = values[0].size
+        start = self._size
+        self.reserve(start + number)
+        names = ("x", "y", "direction_x", "direction_y", "speed", "status",
+                 "infection_probability")
+        for name, value in zip(names, values):
+            self._arrays[name][self._frame, start:start + number] = (
+                value.ravel())
+        for name in ("time_infected", "cooldown", "recovered"):
+            self._arrays[name][self._frame, start:start + number] = 0
+        self._size = start + number
+        return np.arange(start, start + number)
+
+    def swap(self) -> None:
+        """ Method that makes the next frame the current one, at the end of
+            a tick. The columns and the column properties return views of
+            the new current frame afterwards.
+        """
+        self._frame = 1 - self._frame
+
+    def clear(self) -> None:
+        """ Method that removes every individual from the population. The
+            arrays keep their capacity to be reused.
+        """
+        self._size = 0
+
+    def load(self, columns: dict) -> None:
+        """ Method that replaces the individuals of the population with the
+            given columns, written into the current frame with one array
+            copy per column, like when a snapshot is restored.
+
+        Args:
+            columns (dict): An array with one value per individual for
+                every name in COLUMNS.
+        """
+        size = len(columns["x"])
+        self.clear()
+        self.reserve(size)
+        for name in COLUMNS:
+            self._arrays[name][self._frame, :size] = columns[name]
+        self._size = size
+
+
+class AgentView:
+    """ This is the definition of the AgentView class. It gives access to a
+        single individual of a Population through its index, reading and
+        writing the population's columns. It is only created when a single
+        individual is needed, for example to draw it.
+
+    Args:
+        population (Population): The population that stores the individual.
+        index (int): The index of the individual in the population.
+
+    Attributes:
+        population: The population that stores the individual.
+        index: The index of the individual in the population.
+        x, y, pos, direction_x, direction_y, direction, speed, time_infected,
+        cooldown, infection_probability and recovered: The individual's
+            values in the population's columns.
+        status: String with the infection status name of the individual:
+            "healthy" or "infected".
+    """
+
+    def __init__(self, population: Population, index: int) -> None:
+        self._population = population
+        self._index = index
+
+    @property
+    def population(self) -> Population:
+        return self._population
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def x(self) -> float:
+        return float(self._population.x[self._index])
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self._population.x[self._index] = x
+
+    @property
+    def y(self) -> float:
+        return float(self._population.y[self._index])
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self._population.y[self._index] = y
+
+    @property
+    def pos(self) -> tuple[float, float]:
+        return (self.x, self.y)
+
+    @pos.setter
+    def pos(self, pos: tuple[float, float]) -> None:
+        self.x, self.y = pos
+
+    @property
+    def direction_x(self) -> float:
+        return float(self._population.direction_x[self._index])
+
+    @direction_x.setter
+    def direction_x(self, direction_x: float) -> None:
+        self._population.direction_x[self._index] = direction_x
+
+    @property
+    def direction_y(self) -> float:
+        return float(self._population.direction_y[self._index])
+
+    @direction_y.setter
+    def direction_y(self, direction_y: float) -> None:
+        self._population.direction_y[self._index] = direction_y
+
+    @property
+    def direction(self) -> tuple[float, float]:
+        return (self.direction_x, self.direction_y)
+
+    @direction.setter
+    def direction(self, direction: tuple[float, float]) -> None:
+        self.direction_x, self.direction_y = direction
+
+    @property
+    def speed(self) -> float:
+        return float(self._population.speed[self._index])
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self._population.speed[self._index] = speed
+
+    @property
+    def status(self) -> str:
+        return STATUS_NAMES[self._population.status[self._index]]
+
+    @status.setter
+    def status(self, status: str) -> None:
+        self._population.status[self._index] = STATUS_NAMES.index(status)
+
+    @property
+    def time_infected(self) -> int:
+        return int(self._population.time_infected[self._index])
+
+    @time_infected.setter
+    def time_infected(self, time_infected: int) -> None:
+        self._population.time_infected[self._index] = time_infected
+
+    @property
+    def cooldown(self) -> int:
+        return int(self._population.cooldown[self._index])
+
+    @cooldown.setter
+    def cooldown(self, cooldown: int) -> None:
+        self._population.cooldown[self._index] = cooldown
+
+    @property
+    def infection_probability(self) -> float:
+        return float(self._population.infection_probability[self._index])
+
+    @infection_probability.setter
+    def infection_probability(self, infection_probability: float) -> None:
+        self._population.infection_probability[self._index] = (
+            infection_probability)
+
+    @property
+    def recovered(self) -> bool:
+        return bool(self._population.recovered[self._index])
+
+    @recovered.setter
+    def recovered(self, recovered: bool) -> None:
+        self._population.recovered[self._index] = recovered
+
+    def distance(self, coord: tuple[float, float]) -> float:
+        """ This is a simple formula to calculate the euclidean distance
+            between the individual's current coordinate (self.pos) and a
+            second coordinate (coord) in the arena.
+
+        Args:
+            coord (tuple[float, float]): The position of the second
+                individual to measure the distance.
+
+        Returns:
+            float: The distance between the two individuals.
+        """
+        return float(np.hypot(self.x - coord[0], self.y - coord[1]))
@@ -0,0 +1,124 @@
+""" This module defines the RandomStreams class, the source of every random
+    number in a simulation. All of them come from one seed, so a run can be
+    reproduced, and the numbers of a tick come from independent child
+    streams, so they don't depend on how the population is split between
+    chunks or worker processes.
+"""
+from __future__ import annotations
+import numpy as np
+
+RANDOM_BLOCK = 4096
+SPAWN_KEY = 0
+TICK_KEY = 1
+CHAIN_KEY = 2
+
+
+class RandomStreams:
+    """ This is the definition of the RandomStreams class. It turns a seed
+        into a numpy.random.SeedSequence and spawns independent child streams
+        from it: one Generator for everything outside of a tick, like spawn
+        positions, directions and speeds, and one stream per tick and block
+        of RANDOM_BLOCK individuals for the draws of the tick. Since a block
+        always gets the same numbers no matter which chunk asks for them, a
+        tick gives bit-identical results serially, in chunks or in worker
+        processes.
+
+    Args:
+        seed (int): The seed of the simulation. Defaults to None, which
+            takes a fresh seed from the operating system.
+
+    Attributes:
+        seed: Integer with the seed in use. When no seed was given, it is
+            the one taken from the operating system, so the run can still be
+            reproduced.
+        generator: The numpy.random.Generator for the random numbers outside
+            of a tick.
+        state: Dictionary with the state of the generator, which can be
+            saved and set back to continue its numbers from there. The tick
+            streams need no state, since they only depend on the seed.
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        self._seed = np.random.SeedSequence(seed).entropy
+        self._generator = np.random.Generator(np.random.PCG64(
+            np.random.SeedSequence(self._seed, spawn_key=(SPAWN_KEY,))))
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def generator(self) -> np.random.Generator:
+        return self._generator
+
+    @property
+    def state(self) -> dict:
+        return self._generator.bit_generator.state
+
+    @state.setter
+    def state(self, state: dict) -> None:
+        self._generator.bit_generator.state = state
+
+    def block_generator(self, tick: int, block: int) -> np.random.Generator:
+        """ Method that creates the child stream of a block of individuals in
+            a tick.
+
+        Args:
+            tick (int): The tick number.
+            block (int): The block number, the index of an individual
+                divided by RANDOM_BLOCK.
+
+        Returns:
+            generator (np.random.Generator): The generator of the block.
+        """
+        return np.random.Generator(np.random.PCG64(np.random.SeedSequence(
+            self._seed, spawn_key=(TICK_KEY, tick, block))))
+
+    def tick_uniforms(self, tick: int, owned: np.ndarray,
+                      size: int) -> np.ndarray:
+        """ Method that returns the uniform random numbers of a tick for the
+            "owned" individuals: one row for the infection draw, one for the
+            speed after recovering and one for the speed after getting
+            infected. Only the blocks that hold owned individuals are drawn.
+
+        Args:
+            tick (int): The tick number.
+            owned (np.ndarray): The sorted indices of the individuals.
+            size (int): The number of individuals in the population.
+
+        Returns:
+            uniforms (np.ndarray): Float array with shape (3, len(owned)),
+                with numbers in [0, 1).
+        """
+        uniforms = np.empty((3, len(owned)))
+        if len(owned) == 0:
+            return uniforms
+        blocks = np.arange(owned[0] // RANDOM_BLOCK,
+                           owned[-1] // RANDOM_BLOCK + 1)
+        edges = np.searchsorted(owned, blocks * RANDOM_BLOCK)
+        edges = np.append(edges, len(owned))
+        for block, start, stop in zip(blocks, edges[:-1], edges[1:]):
+            if start == stop:
+                continue
+            first = block * RANDOM_BLOCK
+            values = self.block_generator(tick, block).random(
+                (3, min(RANDOM_BLOCK, size - first)))
+            uniforms[:, start:stop] = values[:, owned[start:stop] - first]
+        return uniforms
+
+    def chain_uniforms(self, tick: int, number: int) -> np.ndarray:
+        """ Method that returns the uniform random numbers that pick the
+            infector of each individual infected in a tick, from a child
+            stream of its own, so recording the transmission chains doesn't
+            change any other number of the run.
+
+        Args:
+            tick (int): The tick number.
+            number (int): The number of individuals infected in the tick.
+
+        Returns:
+            uniforms (np.ndarray): Float array with "number" numbers in
+                [0, 1).
+        """
+        return np.random.Generator(np.random.PCG64(np.random.SeedSequence(
+            self._seed, spawn_key=(CHAIN_KEY, tick)))).random(number)
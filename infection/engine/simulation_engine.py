@@ -0,0 +1,928 @@
+""" This module defines the SimulationEngine class and all of its properties
+    and methods. The engine holds the whole epidemic model (population,
+    spatial index, counters and the tick) in pure Python, so it can be
+    stepped on a headless machine without a window, a Clock or any widget.
+"""
+from __future__ import annotations
+from infection.decorators.debugging_decorator import debugging_decorator
+from infection.decorators.instrumentation import instrumented
+from infection.engine import epidemic, movement
+from infection.engine.epidemic import HEALTHY_SPEED, INFECTED_SPEED
+from infection.engine.events import DEBUG, INFO, EventLog
+from infection.engine.layouts import spawn_positions
+from infection.engine.metrics import Metrics
+from infection.engine.parallel import ProcessPool, SharedPopulation
+from infection.engine.random_streams import RandomStreams
+from infection.engine.population import (
+    COLUMNS, Population, STATUS_HEALTHY, STATUS_INFECTED
+)
+from infection.engine.spatial_index import SpatialIndex, create_index
+from infection.engine.time_series import TimeSeries
+from infection.engine.transmissions import UNKNOWN, TransmissionChains
+from threading import Lock
+import json
+import numpy as np
+import time
+
+lock = Lock()
+DIRECTION_MAGNITUDE = 4
+MAX_COOLDOWN = epidemic.MAX_COOLDOWN
+MAX_TIME_INFECTED = epidemic.MAX_TIME_INFECTED
+SNAPSHOT_VERSION = 1
+
+
+class SimulationEngine:
+    """ This is the definition of the SimulationEngine class. It owns the
+        population and steps it one tick at a time. It does not import Kivy;
+        the Simulation App only renders its state.
+
+    Args:
+        width (float): The width of the arena. Defaults to 800.
+        height (float): The height of the arena. Defaults to 600.
+        individual_size (float): The size of an individual in the arena.
+            Defaults to 3.5% of the height.
+        infection_probability (float): The infection probability given to
+            new healthy individuals. Defaults to 0.2.
+        index_backend (str): The spatial index used for the neighbor search,
+            "grid" or "quadtree". Defaults to "grid".
+        workers (int): The number of worker processes that step the
+            population. With more than one, the population is stored in
+            shared memory and each tick runs in a ProcessPool. Defaults to
+            1, which steps the population in this process.
+        seed (int): The seed of every random number in the simulation.
+            Defaults to None, which takes a fresh seed from the operating
+            system.
+        events (EventLog): The log the engine's events are emitted to.
+            Defaults to None, which drops them.
+        max_time_infected (int): The number of ticks an individual stays
+            infected before it recovers. Defaults to MAX_TIME_INFECTED.
+        max_cooldown (int): The number of ticks an individual that had
+            contact with an infected one but did not get infected waits
+            before its infection is evaluated again. Defaults to
+            MAX_COOLDOWN.
+
+    Attributes:
+        spatial_index: A SpatialIndex structure that contains the positions
+            of the infected individuals in the simulation for fast neighbor
+            search. It is rebuilt on every tick.
+        quadtree: Alias of spatial_index, kept from when the quadtree was
+            the only backend.
+        index_backend: String with the name of the spatial index backend.
+        population: Population store with the columns of all the
+            individuals in the simulation.
+        healthy: Integer that keeps the count of the healthy individuals
+            in the simulation.
+        infected: Integer that keeps the count of the infected individuals
+            in the simulation.
+        recovered: Integer that keeps the count of the healthy individuals
+            that recovered from an infection.
+        infection_probability: Float that stores the current infection
+            probability value.
+        individual_size: The size of an individual in the arena. It also
+            determines how close a healthy individual needs to be to an
+            infected one to get infected.
+        bounds: Tuple with the (x_min, y_min, x_max, y_max) limits of the
+            arena the individuals move in.
+        max_time_infected: Integer with the number of ticks an individual
+            stays infected.
+        max_cooldown: Integer with the number of ticks of a cooldown.
+        durations: Tuple with max_time_infected and max_cooldown, as the
+            kernels take them.
+        ticks: Integer that counts how many ticks have been simulated.
+        pool: The ProcessPool that steps the population, or None when it
+            is stepped in this process.
+        streams: The RandomStreams that every random number in the
+            simulation comes from.
+        seed: Integer with the seed in use, which reproduces the run even
+            when no seed was given.
+        new_infections: Integer with the number of individuals that got
+            infected in the last tick.
+        new_recoveries: Integer with the number of individuals that
+            recovered in the last tick.
+        series: The TimeSeries with the counts recorded on every tick.
+        metrics: The Metrics with the duration of every tick.
+        events: The EventLog the engine's events are emitted to.
+        transmissions: The TransmissionChains with the infector, infectee
+            and tick of every infection, and the tick of every recovery.
+    """
+
+    def __init__(self, width: float = 800, height: float = 600,
+                 individual_size: float = None,
+                 infection_probability: float = 0.2,
+                 index_backend: str = "grid", workers: int = 1,
+                 seed: int = None, events: EventLog = None,
+                 max_time_infected: int = MAX_TIME_INFECTED,
+                 max_cooldown: int = MAX_COOLDOWN) -> None:
+        self._bounds = (0, 0, width, height)
+        if workers > 1:
+            self._population = SharedPopulation()
+            self._pool = ProcessPool(workers)
+        else:
+            self._population = Population()
+            self._pool = None
+        self._healthy = 0
+        self._infected = 0
+        self._recovered = 0
+        self._series = TimeSeries()
+        self._transmissions = TransmissionChains()
+        self._metrics = Metrics()
+        self._events = EventLog() if events is None else events
+        self._pending_infections = 0
+        self._pending_recoveries = 0
+        self._new_infections = 0
+        self._new_recoveries = 0
+        self._infection_probability = infection_probability
+        if individual_size is None:
+            individual_size = height * .035
+        self._individual_size = individual_size
+        self._max_time_infected = max_time_infected
+        self._max_cooldown = max_cooldown
+        self._ticks = 0
+        self._index_backend = index_backend
+        self._seed = seed
+        self._streams = RandomStreams(seed)
+        self._spatial_index = self.build_index()
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        return self._spatial_index
+
+    @spatial_index.setter
+    def spatial_index(self, spatial_index: SpatialIndex) -> None:
+        self._spatial_index = spatial_index
+
+    @property
+    def quadtree(self) -> SpatialIndex:
+        return self.spatial_index
+
+    @quadtree.setter
+    def quadtree(self, quadtree: SpatialIndex) -> None:
+        self.spatial_index = quadtree
+
+    @property
+    def index_backend(self) -> str:
+        return self._index_backend
+
+    @index_backend.setter
+    def index_backend(self, index_backend: str) -> None:
+        self._index_backend = index_backend
+        self.build_index()
+
+    @property
+    def infected(self) -> int:
+        return self._infected
+
+    @infected.setter
+    def infected(self, infected_number: int) -> None:
+        self._infected = infected_number
+
+    @infected.deleter
+    def infected(self) -> None:
+        self._infected = 0
+
+    @property
+    def healthy(self) -> int:
+        return self._healthy
+
+    @healthy.setter
+    def healthy(self, healthy_number: int) -> None:
+        self._healthy = healthy_number
+
+    @healthy.deleter
+    def healthy(self) -> None:
+        self._healthy = 0
+
+    @property
+    def recovered(self) -> int:
+        return self._recovered
+
+    @recovered.setter
+    def recovered(self, recovered_number: int) -> None:
+        self._recovered = recovered_number
+
+    @recovered.deleter
+    def recovered(self) -> None:
+        self._recovered = 0
+
+    @property
+    def series(self) -> TimeSeries:
+        return self._series
+
+    @property
+    def transmissions(self) -> TransmissionChains:
+        return self._transmissions
+
+    @property
+    def metrics(self) -> Metrics:
+        return self._metrics
+
+    @property
+    def events(self) -> EventLog:
+        return self._events
+
+    @property
+    def infection_probability(self) -> float:
+        return self._infection_probability
+
+    @infection_probability.setter
+    def infection_probability(self, infection_probability: float) -> None:
+        self._infection_probability = infection_probability
+
+    @property
+    def population(self) -> Population:
+        return self._population
+
+    @population.setter
+    def population(self, population: Population) -> None:
+        self._population = population
+
+    @population.deleter
+    def population(self) -> None:
+        self._population.clear()
+
+    @property
+    def individual_size(self) -> float:
+        return self._individual_size
+
+    @individual_size.setter
+    def individual_size(self, individual_size: float) -> None:
+        self._individual_size = individual_size
+
+    @property
+    def max_time_infected(self) -> int:
+        return self._max_time_infected
+
+    @max_time_infected.setter
+    def max_time_infected(self, max_time_infected: int) -> None:
+        self._max_time_infected = max_time_infected
+
+    @property
+    def max_cooldown(self) -> int:
+        return self._max_cooldown
+
+    @max_cooldown.setter
+    def max_cooldown(self, max_cooldown: int) -> None:
+        self._max_cooldown = max_cooldown
+
+    @property
+    def durations(self) -> tuple[int, int]:
+        return self.max_time_infected, self.max_cooldown
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, bounds: tuple[float, float, float, float]) -> None:
+        self._bounds = tuple(bounds)
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @ticks.setter
+    def ticks(self, ticks: int) -> None:
+        self._ticks = ticks
+
+    @ticks.deleter
+    def ticks(self) -> None:
+        self._ticks = 0
+
+    @property
+    def pool(self) -> ProcessPool:
+        return self._pool
+
+    @property
+    def streams(self) -> RandomStreams:
+        return self._streams
+
+    @streams.setter
+    def streams(self, streams: RandomStreams) -> None:
+        self._streams = streams
+
+    @property
+    def seed(self) -> int:
+        return self.streams.seed
+
+    @property
+    def new_infections(self) -> int:
+        return self._new_infections
+
+    @property
+    def new_recoveries(self) -> int:
+        return self._new_recoveries
+
+    @debugging_decorator
+    def safe_sum_healthy(self, number: int) -> int:
+        """ Method that safely increases or decreases the healthy individual
+            count, using "with lock" to avoid race condition.
+
+        Args:
+            number (int): The number of healthy individuals to
+            increase or decrease.
+
+        Returns:
+            self.healthy (int): The final count of healthy individuals.
+        """
+        with lock:
+            self.healthy += number
+        return self.healthy
+
+    @debugging_decorator
+    def safe_sum_infected(self, number: int) -> int:
+        """ Method that safely increases or decreases the infected individual
+            count, using "with lock" to avoid race condition.
+
+        Args:
+            number (int): The number of infected individuals to
+            increase or decrease.
+
+        Returns:
+            self.infected (int): The final count of infected individuals.
+        """
+        with lock:
+            self.infected += number
+        return self.infected
+
+    @debugging_decorator
+    def reset(self, seed: int = None) -> Population:
+        """ Method that resets the population, the counters and the tick
+            count to their initial values, and forgets the recorded time
+            series and transmission chains. The random streams restart from
+            the given seed, or else from the seed given to the engine, or
+            from a fresh seed if none was given. The seed in use afterwards
+            is in self.seed, so the reset can be repeated.
+
+        Args:
+            seed (int): The seed to restart the random streams from.
+                Defaults to None, which uses the seed given to the engine.
+
+        Returns:
+            self.population (Population): An empty population after the
+                individuals were deleted.
+        """
+        del self.population
+        del self.healthy
+        del self.infected
+        del self.recovered
+        del self.ticks
+        self.series.clear()
+        self.transmissions.clear()
+        self._pending_infections = 0
+        self._pending_recoveries = 0
+        self._new_infections = 0
+        self._new_recoveries = 0
+        self.streams = RandomStreams(self._seed if seed is None else seed)
+        self.events.emit(INFO, "reset", seed=str(self.seed))
+        return self.population
+
+    def spawn(self, number: int, status: int, min_speed: float,
+              max_speed: float, infection_probability: float = 0.0,
+              layout: str = "uniform", **options) -> np.ndarray:
+        """ Method that adds "number" individuals in one shot, at random
+            positions inside the arena bounds drawn with the given layout,
+            with random directions and random speeds between min_speed and
+            max_speed. Every value is drawn for all the individuals at once.
+
+        Args:
+            number (int): The number of individuals to add.
+            status (int): The infection status code of the new individuals.
+            min_speed (float): The minimum speed of the individuals.
+            max_speed (float): The maximum speed of the individuals.
+            infection_probability (float): The infection probability of the
+                new individuals. Defaults to 0.
+            layout (str): The spawn layout of the positions: "uniform",
+                "clustered" or "poisson_disk". Defaults to "uniform".
+            **options: The options of the layout. The "radius" of
+                "poisson_disk" defaults to the individual size, so the new
+                individuals don't overlap.
+
+        Returns:
+            indices (np.ndarray): The indices of the new individuals in the
+                population.
+        """
+        random = self.streams.generator
+        x_min, y_min, x_max, y_max = self.bounds
+        if layout == "poisson_disk":
+            options.setdefault("radius", self.individual_size)
+        x, y = spawn_positions(
+            layout, random, number,
+            (x_min, y_min, x_max - self.individual_size,
+             y_max - self.individual_size), **options)
+        angle = np.radians(random.integers(0, 361, number))
+        return self.population.add(
+            x, y,
+            DIRECTION_MAGNITUDE * np.cos(angle),
+            DIRECTION_MAGNITUDE * np.sin(angle),
+            random.uniform(min_speed, max_speed, number),
+            status, infection_probability)
+
+    @debugging_decorator
+    def add_healthy(self, number: int, layout: str = "uniform",
+                    **options) -> int:
+        """ Method that adds new healthy individuals to the simulation. The
+            number of individuals added is determined by the provided "number"
+            argument, and all of them are spawned in one shot.
+
+        Args:
+            number (int): The number of healthy individuals to add to the
+            simulation.
+            layout (str): The spawn layout of the positions: "uniform",
+                "clustered" or "poisson_disk". Defaults to "uniform".
+            **options: The options of the layout.
+
+        Returns:
+            self.healthy (int): The final count of healthy individuals.
+        """
+        self.spawn(number, STATUS_HEALTHY, *HEALTHY_SPEED,
+                   self.infection_probability, layout, **options)
+        self.safe_sum_healthy(number)
+        self.events.emit(INFO, "spawn", status="healthy", number=number,
+                         layout=layout, tick=self.ticks,
+                         infection_probability=self.infection_probability)
+        return self.healthy
+
+    @debugging_decorator
+    def add_infected(self, number: int, layout: str = "uniform",
+                     **options) -> int:
+        """ Method that adds new infected individuals to the simulation. The
+            number of individuals added is determined by the provided "number"
+            argument, and all of them are spawned in one shot.
+
+        Args:
+            number (int): The number of infected individuals to add to the
+            simulation.
+            layout (str): The spawn layout of the positions: "uniform",
+                "clustered" or "poisson_disk". Defaults to "uniform".
+            **options: The options of the layout.
+
+        Returns:
+            self.infected (int): The final count of infected individuals.
+        """
+        indices = self.spawn(number, STATUS_INFECTED, *INFECTED_SPEED, 0.0,
+                             layout, **options)
+        self.transmissions.record_infections(
+            np.full(number, UNKNOWN), indices, self.ticks)
+        self.safe_sum_infected(number)
+        self.events.emit(INFO, "spawn", status="infected", number=number,
+                         layout=layout, tick=self.ticks)
+        return self.infected
+
+    @instrumented("index")
+    def build_index(self) -> SpatialIndex:
+        """ Method that rebuilds the spatial index with the current position
+            of the infected individuals in the population. Healthy and
+            recovered individuals are left out, since the only question the
+            index answers is how many infected individuals are near a
+            position. The data of each indexed point is the index of the
+            individual in the population.
+
+        Returns:
+            self.spatial_index (SpatialIndex): The rebuilt spatial index.
+        """
+        population = self.population
+        infected = np.flatnonzero(population.status == STATUS_INFECTED)
+        self.spatial_index = create_index(
+            self.index_backend, self.individual_size).build(
+                population.x[infected], population.y[infected], infected)
+        return self.spatial_index
+
+    @debugging_decorator
+    def count_infected_neighbors(self, index: int,
+                                 spatial_index: SpatialIndex) -> int:
+        """ Method that searches the spatial_index to find the number of
+            infected individuals within the infection radius of the
+            individual at "index", not counting the individual itself, and
+            returns the count in the infected_neighbor_count variable.
+
+        Args:
+            index (int): The index of the individual in the population.
+            spatial_index (SpatialIndex): A spatial index that contains the
+                positions of the infected individuals in the simulation for
+                fast neighbor search.
+        Returns:
+            infected_neighbor_count (int): The number of infected individuals
+                within the infection radius.
+        """
+        neighbors = spatial_index.neighbors(
+            self.population.x[index], self.population.y[index],
+            self.individual_size)
+        infected_neighbor_count = len(neighbors)
+        return infected_neighbor_count
+
+    def infected_neighbor_counts(self, spatial_index: SpatialIndex,
+                                 query: np.ndarray = None,
+                                 direction: str = "auto") -> np.ndarray:
+        """ Method that counts, for the whole population at once, the
+            infected individuals within the infection radius of each
+            susceptible individual, with a single bulk query. See
+            epidemic.count_infected_neighbors for the query directions.
+
+        Args:
+            spatial_index (SpatialIndex): A spatial index that contains the
+                positions of the infected individuals in the simulation for
+                fast neighbor search.
+            query (np.ndarray): Optional boolean array that selects the
+                individuals to count neighbors for. Defaults to the healthy
+                individuals that have not recovered.
+            direction (str): The side that queries: "susceptible",
+                "infected" or "auto". Defaults to "auto".
+
+        Returns:
+            counts (np.ndarray): Integer array with the number of infected
+                neighbors of each individual in the population. It is 0 for
+                the individuals that were not queried.
+        """
+        population = self.population
+        if query is None:
+            query = ((population.status == STATUS_HEALTHY) &
+                     ~population.recovered)
+        queried = np.flatnonzero(query)
+        counts = np.zeros(len(population), dtype=np.intp)
+        counts[queried] = epidemic.count_infected_neighbors(
+            population.x, population.y, queried, spatial_index,
+            self.individual_size, self.index_backend, direction)
+        return counts
+
+    def draw_infections(self, indices: np.ndarray,
+                        infected_neighbor_counts: np.ndarray) -> np.ndarray:
+        """ Method that randomly calculates, with one vectorized draw, which
+            of the individuals at "indices" get infected. Each contact with
+            an infected neighbor infects with the individual's
+            infection_probability p, so an individual with k infected
+            neighbors gets infected with probability 1 - (1 - p) ** k, the
+            same as drawing k contacts and checking if any of them infected
+            it.
+
+        Args:
+            indices (np.ndarray): The indices of the individuals in the
+                population.
+            infected_neighbor_counts (np.ndarray): The number of infected
+                individuals within the infection radius of each individual.
+
+        Returns:
+            infected (np.ndarray): Boolean array that is True for the
+                individuals that get infected.
+        """
+        return epidemic.draw_infections(
+            self.population.infection_probability[indices],
+            infected_neighbor_counts,
+            self.streams.generator.random(len(indices)))
+
+    @debugging_decorator
+    def evaluate_infection(self, index: int,
+                           spatial_index: SpatialIndex) -> tuple[int, int]:
+        """ Method that calls the count_infected_neighbors method and if
+            there's one or more infected neighbors, draw_infections is used
+            to randomly calculate if the individual should get infected based
+            on its infection_probability and the number of infected
+            neighbors.
+
+        Args:
+            index (int): The index of the individual in the population.
+            spatial_index (SpatialIndex): A spatial index that contains the
+                positions of the infected individuals in the simulation for
+                fast neighbor search.
+
+        Returns:
+            infected (int): 0 if not infected, 1 if infected.
+            infected_neighbor_count: The number of infected individuals
+                within the infection radius.
+        """
+        infected_neighbor_count = self.count_infected_neighbors(
+            index, spatial_index)
+        if infected_neighbor_count > 0:
+            infected = int(self.draw_infections(
+                np.array([index]), np.array([infected_neighbor_count]))[0])
+            return infected, infected_neighbor_count
+        return 0, infected_neighbor_count
+
+    @debugging_decorator
+    def sick(self, index: int) -> None:
+        """ Method to set the properties of the individual at "index" when it
+            gets sick.
+
+        Args:
+            index (int): The index of the individual in the population.
+        """
+        self.population.status[index] = STATUS_INFECTED
+        self.transmissions.record_infections([UNKNOWN], [index], self.ticks)
+        self.count_transitions(1, 0)
+        self.reduce_counters()
+        self.population.speed[index] = self.streams.generator.uniform(
+            *INFECTED_SPEED)
+        self.events.emit(DEBUG, "infected", index=int(index),
+                         tick=self.ticks)
+
+    @debugging_decorator
+    def recover(self, index: int) -> None:
+        """ Method to set the properties of the individual at "index" when it
+            recovers.
+
+        Args:
+            index (int): The index of the individual in the population.
+        """
+        self.population.recovered[index] = True
+        self.population.status[index] = STATUS_HEALTHY
+        self.transmissions.record_recoveries([index], self.ticks)
+        self.count_transitions(0, 1)
+        self.reduce_counters()
+        self.population.speed[index] = self.streams.generator.uniform(
+            *HEALTHY_SPEED)
+        self.events.emit(DEBUG, "recovered", index=int(index),
+                         tick=self.ticks)
+
+    @debugging_decorator
+    def infection(self, spatial_index: SpatialIndex) -> None:
+        """ Method that controls the infection status of every individual
+            with the epidemic.infection_step kernel, which reads the current
+            frame of the population and writes the next one, swapped in at
+            the end. Recovered individuals
+            are ignored. Individuals in cooldown only decrease their
+            cooldown. Infected individuals recover after max_time_infected
+            cycles. The infected neighbors of the rest of the healthy
+            individuals are counted with one bulk query to the provided
+            spatial_index, and the ones with one or more infected neighbors
+            either get infected or start a cooldown of max_cooldown cycles if
+            they had contact but did not get infected.
+
+        Args:
+            spatial_index (SpatialIndex): A spatial index that contains the
+                positions of the infected individuals in the arena for fast
+                neighbor search.
+        """
+        population = self.population
+        owned = np.arange(len(population))
+        infected, recovered = epidemic.infection_step(
+            population.columns, population.next_columns, owned,
+            spatial_index, self.individual_size, self.index_backend,
+            self.streams.tick_uniforms(self.ticks, owned, len(population)),
+            "auto", *self.durations)
+        self.trace(infected, recovered, spatial_index)
+        population.swap()
+        self.merge_infection(infected, recovered)
+        self.reduce_counters()
+
+    def trace(self, infected: np.ndarray, recovered: np.ndarray,
+              spatial_index: SpatialIndex) -> None:
+        """ Method that records the transmissions and recoveries of a tick
+            in the transmission chains. It runs before the frames are
+            swapped, so the infector of every infectee is picked among its
+            infected neighbors at the positions the infection was drawn at.
+            The infectees are sorted first, and the picks come from the
+            chain stream of the tick, so the chains are the same no matter
+            how the tick was split between workers.
+
+        Args:
+            infected (np.ndarray): The indices of the individuals that got
+                infected.
+            recovered (np.ndarray): The indices of the individuals that
+                recovered.
+            spatial_index (SpatialIndex): The spatial index of the infected
+                individuals the infections were drawn with.
+        """
+        infected = np.sort(infected)
+        infectors = epidemic.attribute_infections(
+            self.population.x, self.population.y, infected, spatial_index,
+            self.individual_size,
+            self.streams.chain_uniforms(self.ticks, len(infected)))
+        self.transmissions.record_infections(infectors, infected, self.ticks)
+        self.transmissions.record_recoveries(recovered, self.ticks)
+
+    def count_transitions(self, infections: int, recoveries: int) -> None:
+        """ Method that adds state transitions to the accumulators of the
+            current tick. It only touches plain integers owned by the tick,
+            so it takes no lock; the counters are updated once from the
+            accumulators by reduce_counters().
+
+        Args:
+            infections (int): The number of individuals that got infected.
+            recoveries (int): The number of individuals that recovered.
+        """
+        self._pending_infections += infections
+        self._pending_recoveries += recoveries
+
+    def reduce_counters(self) -> tuple[int, int]:
+        """ Method that applies the accumulated transitions to the healthy
+            and infected counters in one step, at the end of a tick, and
+            starts new accumulators. The reduced numbers are kept in
+            new_infections and new_recoveries.
+
+        Returns:
+            transitions (tuple[int, int]): The number of individuals that
+                got infected and that recovered since the last reduction.
+        """
+        infections = self._pending_infections
+        recoveries = self._pending_recoveries
+        change = infections - recoveries
+        if change:
+            self.infected += change
+            self.healthy -= change
+        self.recovered += recoveries
+        self._new_infections = infections
+        self._new_recoveries = recoveries
+        self._pending_infections = 0
+        self._pending_recoveries = 0
+        return infections, recoveries
+
+    def merge_infection(self, infected: np.ndarray,
+                        recovered: np.ndarray) -> None:
+        """ Method that adds the individuals that got infected and recovered
+            during a tick, in this process or in every worker, to the
+            accumulators of the tick, and emits them as events: their
+            number at the "info" level and every individual at the "debug"
+            level.
+
+        Args:
+            infected (np.ndarray): The indices of the individuals that got
+                infected.
+            recovered (np.ndarray): The indices of the individuals that
+                recovered.
+        """
+        self.count_transitions(len(infected), len(recovered))
+        if len(infected) or len(recovered):
+            self.events.emit(INFO, "transitions", tick=self.ticks,
+                             infected=len(infected),
+                             recovered=len(recovered))
+        if self.events.enabled_for(DEBUG):
+            for index in infected.tolist():
+                self.events.emit(DEBUG, "infected", index=index,
+                                 tick=self.ticks)
+            for index in recovered.tolist():
+                self.events.emit(DEBUG, "recovered", index=index,
+                                 tick=self.ticks)
+
+    def move(self) -> None:
+        """ Method that moves every individual across the arena one step
+            with the batched movement kernel. Individuals at the edge of the
+            arena "bounce" against it.
+        """
+        population = self.population
+        movement.move(population.x, population.y, population.direction_x,
+                      population.direction_y, population.speed, self.bounds,
+                      self.individual_size)
+
+    def tick(self) -> int:
+        """ Method that advances the simulation one step. The spatial index
+            is rebuilt, the infection status of every individual is updated
+            and then every individual is moved. Every update reads the
+            current frame of the population and writes the next one, which
+            is swapped in at the end, so the result of a tick does not depend
+            on the order of the updates. With a pool, the updates run in the
+            worker processes. The transitions of every worker are added to
+            the accumulators of the tick, which are reduced into the
+            counters once at the end. The duration of the tick is recorded
+            in the metrics.
+
+        Returns:
+            self.ticks (int): The number of ticks simulated so far.
+        """
+        start = time.perf_counter()
+        population = self.population
+        self.build_index()
+        if self.pool is None:
+            following = population.next_columns
+            owned = np.arange(len(population))
+            infected, recovered = epidemic.infection_step(
+                population.columns, following, owned, self.spatial_index,
+                self.individual_size, self.index_backend,
+                self.streams.tick_uniforms(self.ticks, owned,
+                                           len(population)),
+                "auto", *self.durations)
+            movement.move(following["x"], following["y"],
+                          following["direction_x"],
+                          following["direction_y"], following["speed"],
+                          self.bounds, self.individual_size)
+        else:
+            infected, recovered = self.pool.step(
+                population, self.spatial_index.data, self.individual_size,
+                self.index_backend, self.bounds, self.streams, self.ticks,
+                self.durations)
+        self.trace(infected, recovered, self.spatial_index)
+        population.swap()
+        self.merge_infection(infected, recovered)
+        self.reduce_counters()
+        self.ticks += 1
+        self.record()
+        self.metrics.record_tick(time.perf_counter() - start)
+        return self.ticks
+
+    def record(self) -> None:
+        """ Method that appends the current counts and the transitions of
+            the last tick to the time series.
+        """
+        self.series.record(self.ticks, self.healthy - self.recovered,
+                           self.infected, self.recovered,
+                           self.new_infections, self.new_recoveries)
+
+    def save_series(self, path: str) -> None:
+        """ Method that exports the time series recorded so far to a
+            ".csv" or ".npz" file.
+
+        Args:
+            path (str): The path of the file. Its suffix selects the format.
+        """
+        self.series.save(path)
+
+    def save_state(self, path: str, compress: bool = True) -> None:
+        """ Method that checkpoints the complete state of the simulation to
+            a single .npz file: the current frame of every population column
+            (positions, directions, speeds, statuses, timers, cooldowns,
+            infection probabilities and recovered flags), the counters and
+            the tick count, the parameters and the infection durations, the
+            seed and the state of the spawn generator, the time series and
+            the transmission chains.
+            The tick streams need no state, since they only depend on the
+            seed and the tick. Every column is one array of the file, so
+            saving and restoring cost one array copy per column. Metrics and
+            events are not part of the state.
+
+        Args:
+            path (str): The path of the file.
+            compress (bool): True to compress the arrays, False to store
+                them as they are, which is faster to write and read.
+                Defaults to True.
+        """
+        columns = {f"population_{name}": column
+                   for name, column in self.population.columns.items()}
+        savez = np.savez_compressed if compress else np.savez
+        savez(path, version=SNAPSHOT_VERSION,
+              counters=np.array([self.healthy, self.infected,
+                                 self.recovered, self.ticks,
+                                 self.new_infections, self.new_recoveries],
+                                dtype=np.int64),
+              infection_probability=self.infection_probability,
+              individual_size=self.individual_size,
+              durations=np.array(self.durations, dtype=np.int64),
+              bounds=np.array(self.bounds, dtype=np.float64),
+              index_backend=self.index_backend,
+              seed=str(self.seed),
+              generator=json.dumps(self.streams.state),
+              series=self.series.data,
+              infections=self.transmissions.infections,
+              recoveries=self.transmissions.recoveries, **columns)
+
+    @debugging_decorator
+    def load_state(self, path: str) -> int:
+        """ Method that resumes the simulation from a file written by
+            save_state, replacing the population, the counters, the
+            parameters, the random streams, the time series and the
+            transmission chains. The engine keeps its pool, metrics and
+            event log, and the spatial index is rebuilt, so the next ticks
+            give the same results they gave in the saved run.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            self.ticks (int): The tick count the simulation resumes from.
+
+        Raises:
+            ValueError: If the file was written by an unknown snapshot
+                version.
+        """
+        with np.load(path) as snapshot:
+            version = int(snapshot["version"])
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unknown snapshot version: {version}")
+            self.population.load({name: snapshot[f"population_{name}"]
+                                  for name in COLUMNS})
+            (self.healthy, self.infected, self.recovered, self.ticks,
+             self._new_infections, self._new_recoveries) = (
+                snapshot["counters"].tolist())
+            self.infection_probability = float(
+                snapshot["infection_probability"])
+            self.individual_size = float(snapshot["individual_size"])
+            self.max_time_infected, self.max_cooldown = (
+                snapshot["durations"].tolist())
+            self.bounds = snapshot["bounds"].tolist()
+            self._index_backend = str(snapshot["index_backend"])
+            self._seed = int(str(snapshot["seed"]))
+            self.streams = RandomStreams(self._seed)
+            self.streams.state = json.loads(str(snapshot["generator"]))
+            self.series.load(snapshot["series"])
+            self.transmissions.load(snapshot["infections"],
+                                    snapshot["recoveries"])
+        self._pending_infections = 0
+        self._pending_recoveries = 0
+        self.build_index()
+        self.events.emit(INFO, "resume", tick=self.ticks,
+                         individuals=len(self.population))
+        return self.ticks
+
+    def close(self) -> None:
+        """ Method that writes the queued events and stops the event log's
+            writer thread, then shuts the worker processes down and releases
+            the shared memory of the population, when the engine has a pool.
+
+        Raises:
+            OSError: If the event log could not open or write its sink. The
+                worker processes are shut down anyway.
+        """
+        try:
+            self.events.close()
+        finally:
+            if self.pool is not None:
+                self.pool.close()
+                self.population.close()
+                self._pool = None
@@ -0,0 +1,430 @@
+""" This module defines the SpatialIndex abstract class, and its
+    QuadTreeIndex and GridIndex subclasses, the neighbor search backends of
+    the SimulationEngine, and the create_index function to select one of
+    them by name.
+"""
+from __future__ import annotations
+from quads import QuadTree, BoundingBox
+from abc import ABC, abstractmethod
+import numpy as np
+
+INDEX_BACKENDS = ("quadtree", "grid")
+DIGIT_BITS = 16
+
+
+class SpatialIndex(ABC):
+    """ This is the definition of the SpatialIndex abstract class. An index
+        is built from a snapshot of the positions and a data value of a set
+        of points, and then answers which of those points are near a given
+        position. The snapshot is copied, so the points can keep changing
+        after the index was built.
+
+    Attributes:
+        x: Float array with the position of the indexed points in the 'x'
+            axis.
+        y: Float array with the position of the indexed points in the 'y'
+            axis.
+        data: Array with the data value of each indexed point, like its
+            infection status code.
+    """
+
+    def __init__(self) -> None:
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._data = np.empty(0)
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    def build(self, x: np.ndarray, y: np.ndarray,
+              data: np.ndarray) -> SpatialIndex:
+        """ Method that replaces the indexed points with a copy of the
+            provided positions and data values.
+
+        Args:
+            x (np.ndarray): The positions of the points in the 'x' axis.
+            y (np.ndarray): The positions of the points in the 'y' axis.
+            data (np.ndarray): The data value of each point.
+
+        Returns:
+            self (SpatialIndex): The index, to allow chaining.
+        """
+        self._x = np.array(x, dtype=np.float64)
+        self._y = np.array(y, dtype=np.float64)
+        self._data = np.array(data)
+        self.build_structure()
+        return self
+
+    @abstractmethod
+    def build_structure(self) -> None:
+        """ Abstract method that builds the backend's search structure from
+            the x and y arrays.
+        """
+        pass
+
+    @abstractmethod
+    def candidates(self, x: float, y: float, radius: float) -> np.ndarray:
+        """ Abstract method that returns the ids of, at least, every indexed
+            point inside the square of side 2 * radius centered at (x, y).
+            It may return points farther away, which neighbors filters out.
+        """
+        pass
+
+    def neighbors(self, x: float, y: float, radius: float) -> np.ndarray:
+        """ Method that returns the ids of the indexed points whose distance
+            to (x, y) is greater than 0 and less than or equal to radius, so
+            a point is never its own neighbor.
+
+        Args:
+            x (float): The position of the query in the 'x' axis.
+            y (float): The position of the query in the 'y' axis.
+            radius (float): The search radius.
+
+        Returns:
+            ids (np.ndarray): The ids of the neighbor points.
+        """
+        ids = self.candidates(x, y, radius)
+        distance = np.hypot(self._x[ids] - x, self._y[ids] - y)
+        return ids[(distance > 0) & (distance <= radius)]
+
+    def pairs(self, x: np.ndarray, y: np.ndarray,
+              radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """ Method that finds, for a whole array of query positions at once,
+            every pair of query and indexed point whose distance is greater
+            than 0 and less than or equal to radius. This implementation
+            runs one neighbors search per query; backends that can search in
+            bulk override it.
+
+        Args:
+            x (np.ndarray): The positions of the queries in the 'x' axis.
+            y (np.ndarray): The positions of the queries in the 'y' axis.
+            radius (float): The search radius.
+
+        Returns:
+            queries (np.ndarray): The index in x and y of the query of each
+                pair.
+            ids (np.ndarray): The id of the indexed point of each pair.
+        """
+        neighbors = [self.neighbors(query_x, query_y, radius)
+                     for query_x, query_y in zip(np.asarray(x).tolist(),
+                                                 np.asarray(y).tolist())]
+        counts = [len(ids) for ids in neighbors]
+        if not neighbors:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        return (np.repeat(np.arange(len(neighbors)), counts),
+                np.concatenate(neighbors).astype(np.intp))
+
+    def count_neighbors(self, x: np.ndarray, y: np.ndarray, radius: float,
+                        mask: np.ndarray = None) -> np.ndarray:
+        """ Method that counts, for a whole array of query positions at once,
+            the indexed points within radius of each query.
+
+        Args:
+            x (np.ndarray): The positions of the queries in the 'x' axis.
+            y (np.ndarray): The positions of the queries in the 'y' axis.
+            radius (float): The search radius.
+            mask (np.ndarray): Optional boolean array with one value per
+                indexed point. When provided, only the points where it is
+                True are counted.
+
+        Returns:
+            counts (np.ndarray): The number of neighbors of each query.
+        """
+        queries, ids = self.pairs(x, y, radius)
+        if mask is not None:
+            queries = queries[mask[ids]]
+        return np.bincount(queries, minlength=len(x))
+
+
+class QuadTreeIndex(SpatialIndex):
+    """ This is the definition of the QuadTreeIndex class. It inherits from
+        the SpatialIndex abstract class, and stores the points in a
+        quads.QuadTree with the id of each point as its data.
+
+    Attributes:
+        quadtree: The QuadTree structure with the indexed points.
+    """
+
+    def __init__(self) -> None:
+        super(QuadTreeIndex, self).__init__()
+        self._quadtree = QuadTree((0, 0), 1, 1)
+
+    @property
+    def quadtree(self) -> QuadTree:
+        return self._quadtree
+
+    def build_structure(self) -> None:
+        """ Method that inserts every point, one at a time, in a new
+            QuadTree large enough to contain all of them.
+        """
+        if len(self._x):
+            x_min, x_max = self._x.min(), self._x.max()
+            y_min, y_max = self._y.min(), self._y.max()
+        else:
+            x_min = x_max = y_min = y_max = 0.0
+        self._quadtree = QuadTree(
+            ((x_min + x_max) / 2, (y_min + y_max) / 2),
+            x_max - x_min + 2, y_max - y_min + 2)
+        for point_id, point in enumerate(zip(self._x.tolist(),
+                                             self._y.tolist())):
+            self._quadtree.insert(point, data=point_id)
+
+    def candidates(self, x: float, y: float, radius: float) -> np.ndarray:
+        """ Method that returns the ids of the points inside the bounding
+            box of side 2 * radius centered at (x, y).
+
+        Args:
+            x (float): The position of the query in the 'x' axis.
+            y (float): The position of the query in the 'y' axis.
+            radius (float): The search radius.
+
+        Returns:
+            ids (np.ndarray): The ids of the candidate points.
+        """
+        points = self._quadtree.within_bb(
+            BoundingBox(x - radius, y - radius, x + radius, y + radius))
+        return np.fromiter((point.data for point in points), dtype=np.intp,
+                           count=len(points))
+
+
+class GridIndex(SpatialIndex):
+    """ This is the definition of the GridIndex class. It inherits from the
+        SpatialIndex abstract class, and hashes the points into a uniform
+        grid of square cells. The grid is rebuilt with a counting sort: a
+        bincount of the cell ids gives the number of points per cell, its
+        prefix sum gives where each cell starts, and counting_order() lists
+        the points cell by cell. That takes time linear in the number of
+        points plus the number of cells, and the cells are those of the
+        bounding box of the points, so a sparse, very wide arena costs more
+        than its number of points suggests. With a cell size equal to the
+        search radius, a query only needs to look at the 3x3 cells around
+        it.
+
+    Args:
+        cell_size (float): The side of each cell of the grid.
+
+    Attributes:
+        cell_size: Float with the side of each cell of the grid.
+        shape: Tuple with the number of columns and rows of the grid.
+        origin: Tuple with the position of the lower left corner of the
+            grid.
+        order: Array with the ids of the points sorted by cell.
+        cell_start: Array with the position in order where the points of
+            each cell start. The points of cell c are
+            order[cell_start[c]:cell_start[c + 1]].
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        super(GridIndex, self).__init__()
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than 0")
+        self._cell_size = float(cell_size)
+        self._shape = (1, 1)
+        self._origin = (0.0, 0.0)
+        self._order = np.empty(0, dtype=np.intp)
+        self._cell_start = np.zeros(2, dtype=np.intp)
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._shape
+
+    @property
+    def origin(self) -> tuple[float, float]:
+        return self._origin
+
+    @property
+    def order(self) -> np.ndarray:
+        return self._order
+
+    @property
+    def cell_start(self) -> np.ndarray:
+        return self._cell_start
+
+    def cell_coordinates(self, x: np.ndarray,
+                         y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """ Method that returns the column and row of the cells that contain
+            the provided positions. Positions outside the grid get column or
+            row numbers outside of it.
+
+        Args:
+            x (np.ndarray): The positions in the 'x' axis.
+            y (np.ndarray): The positions in the 'y' axis.
+
+        Returns:
+            column (np.ndarray): The column of each position.
+            row (np.ndarray): The row of each position.
+        """
+        column = np.floor((np.asarray(x) - self._origin[0]) /
+                          self._cell_size).astype(np.intp)
+        row = np.floor((np.asarray(y) - self._origin[1]) /
+                       self._cell_size).astype(np.intp)
+        return column, row
+
+    def build_structure(self) -> None:
+        """ Method that hashes every point into its cell and builds the
+            order and cell_start arrays.
+        """
+        if len(self._x):
+            self._origin = (float(self._x.min()), float(self._y.min()))
+            columns = int((self._x.max() - self._origin[0]) //
+                          self._cell_size) + 1
+            rows = int((self._y.max() - self._origin[1]) //
+                       self._cell_size) + 1
+        else:
+            self._origin = (0.0, 0.0)
+            columns = rows = 1
+        self._shape = (columns, rows)
+        column, row = self.cell_coordinates(self._x, self._y)
+        cell = row * columns + column
+        counts = np.bincount(cell, minlength=columns * rows)
+        self._cell_start = np.zeros(columns * rows + 1, dtype=np.intp)
+        np.cumsum(counts, out=self._cell_start[1:])
+        self._order = counting_order(cell, columns * rows)
+
+    def candidates(self, x: float, y: float, radius: float) -> np.ndarray:
+        """ Method that returns the ids of the points in the cells that
+            overlap the bounding box of side 2 * radius centered at (x, y).
+            That is the 3x3 block of cells around (x, y) when the radius is
+            not larger than the cell size.
+
+        Args:
+            x (float): The position of the query in the 'x' axis.
+            y (float): The position of the query in the 'y' axis.
+            radius (float): The search radius.
+
+        Returns:
+            ids (np.ndarray): The ids of the candidate points.
+        """
+        columns, rows = self._shape
+        first_column, first_row = self.cell_coordinates(x - radius,
+                                                        y - radius)
+        last_column, last_row = self.cell_coordinates(x + radius, y + radius)
+        first_column, last_column = max(first_column, 0), min(last_column,
+                                                              columns - 1)
+        first_row, last_row = max(first_row, 0), min(last_row, rows - 1)
+        if first_column > last_column or first_row > last_row:
+            return np.empty(0, dtype=np.intp)
+        slices = []
+        for row in range(first_row, last_row + 1):
+            start = self._cell_start[row * columns + first_column]
+            end = self._cell_start[row * columns + last_column + 1]
+            slices.append(self._order[start:end])
+        return np.concatenate(slices)
+
+    def pairs(self, x: np.ndarray, y: np.ndarray,
+              radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """ Method that finds, for a whole array of query positions at once,
+            every pair of query and indexed point whose distance is greater
+            than 0 and less than or equal to radius. Instead of one search
+            per query, it handles one row offset of the block of cells
+            around the queries at a time: each query reads one contiguous
+            range of order per row, and all the ranges are expanded into
+            candidate pairs with array operations before filtering them by
+            distance.
+
+        Args:
+            x (np.ndarray): The positions of the queries in the 'x' axis.
+            y (np.ndarray): The positions of the queries in the 'y' axis.
+            radius (float): The search radius.
+
+        Returns:
+            queries (np.ndarray): The index in x and y of the query of each
+                pair.
+            ids (np.ndarray): The id of the indexed point of each pair.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        columns, rows = self._shape
+        reach = int(np.ceil(radius / self._cell_size))
+        column, row = self.cell_coordinates(x, y)
+        first_column = np.clip(column - reach, 0, columns - 1)
+        last_column = np.clip(column + reach, 0, columns - 1)
+        inside = (column + reach >= 0) & (column - reach < columns)
+        all_queries, all_ids = [], []
+        for offset in range(-reach, reach + 1):
+            query_row = row + offset
+            valid = inside & (query_row >= 0) & (query_row < rows)
+            queries = np.flatnonzero(valid)
+            start = self._cell_start[query_row[queries] * columns +
+                                     first_column[queries]]
+            end = self._cell_start[query_row[queries] * columns +
+                                   last_column[queries] + 1]
+            counts = end - start
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            queries = np.repeat(queries, counts)
+            range_start = np.repeat(start - np.cumsum(counts) + counts,
+                                    counts)
+            ids = self._order[np.arange(total) + range_start]
+            distance = np.hypot(self._x[ids] - x[queries],
+                                self._y[ids] - y[queries])
+            near = (distance > 0) & (distance <= radius)
+            all_queries.append(queries[near])
+            all_ids.append(ids[near])
+        if not all_queries:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        return np.concatenate(all_queries), np.concatenate(all_ids)
+
+
+def counting_order(keys: np.ndarray, size: int) -> np.ndarray:
+    """ Function that returns the indices that sort integer keys in [0, size)
+        in linear time, keeping equal keys in their original order. The
+        keys are sorted DIGIT_BITS bits at a time, from the lowest digit: a
+        stable sort of unsigned 16 bit integers is a radix sort in NumPy,
+        and every pass keeps the order of the previous ones for equal
+        digits, so a few passes sort the whole keys.
+
+    Args:
+        keys (np.ndarray): The keys to sort.
+        size (int): A bound on the keys.
+
+    Returns:
+        order (np.ndarray): The indices of the keys in sorted order.
+    """
+    keys = np.asarray(keys)
+    order = np.arange(len(keys), dtype=np.intp)
+    shift = 0
+    while shift == 0 or size > 1 << shift:
+        digits = ((keys[order] >> shift) & ((1 << DIGIT_BITS) - 1))
+        order = order[np.argsort(digits.astype(np.uint16), kind="stable")]
+        shift += DIGIT_BITS
+    return order
+
+
+def create_index(backend: str, cell_size: float) -> SpatialIndex:
+    """ Function that creates an empty spatial index of the selected
+        backend.
+
+    Args:
+        backend (str): The name of the backend, one of INDEX_BACKENDS:
+            "quadtree" or "grid".
+        cell_size (float): The cell size of the "grid" backend. Ignored by
+            the "quadtree" backend.
+
+    Returns:
+        index (SpatialIndex): The new spatial index.
+    """
+    match backend:
+        case "quadtree":
+            return QuadTreeIndex()
+        case "grid":
+            return GridIndex(cell_size)
+        case _:
+            raise ValueError(f"Unknown spatial index backend: {backend}")
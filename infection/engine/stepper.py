@@ -0,0 +1,165 @@
+""" This module defines the Stepper class, which advances a SimulationEngine
+    in fixed ticks that are independent of how often the simulation is
+    drawn, either from a render loop or from a background thread.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infection.engine.simulation_engine import SimulationEngine
+from threading import Event, Lock, Thread
+import time
+
+TICK_RATE = 60.0
+MAX_TICKS_PER_FRAME = 8
+TURBO_BUDGET = 1.0 / 30.0
+
+
+class Stepper:
+    """ This is the definition of the Stepper class. The engine advances one
+        tick every 1 / tick_rate seconds of elapsed time, no matter how many
+        frames are drawn in that time: advance() runs the ticks that are due
+        since the last call, several per frame if needed, and start() runs
+        them from a background thread instead. In turbo mode, the ticks run
+        back to back as fast as the CPU allows. Every tick runs while holding
+        the lock, so other threads can take it to read or change the engine
+        between ticks.
+
+    Args:
+        engine (SimulationEngine): The engine to advance.
+        tick_rate (float): The number of ticks per second. Defaults to
+            TICK_RATE.
+        max_ticks_per_frame (int): The maximum number of ticks run by one
+            advance() call or to catch up in the background thread. Time
+            beyond it is dropped, so a slow machine runs slower instead of
+            falling further behind. Defaults to MAX_TICKS_PER_FRAME.
+
+    Attributes:
+        engine: The SimulationEngine being advanced.
+        tick_rate: Float with the number of ticks per second.
+        max_ticks_per_frame: Integer with the maximum number of ticks run to
+            catch up at once.
+        turbo: Boolean that is True when the ticks run as fast as possible.
+        lock: The Lock held during every tick.
+        running: Boolean that is True while the background thread runs.
+    """
+
+    def __init__(self, engine: SimulationEngine, tick_rate: float = TICK_RATE,
+                 max_ticks_per_frame: int = MAX_TICKS_PER_FRAME) -> None:
+        self._engine = engine
+        self._tick_rate = tick_rate
+        self._max_ticks_per_frame = max_ticks_per_frame
+        self._turbo = False
+        self._lock = Lock()
+        self._accumulator = 0.0
+        self._thread = None
+        self._stopping = Event()
+
+    @property
+    def engine(self) -> SimulationEngine:
+        return self._engine
+
+    @property
+    def tick_rate(self) -> float:
+        return self._tick_rate
+
+    @tick_rate.setter
+    def tick_rate(self, tick_rate: float) -> None:
+        self._tick_rate = tick_rate
+
+    @property
+    def max_ticks_per_frame(self) -> int:
+        return self._max_ticks_per_frame
+
+    @property
+    def turbo(self) -> bool:
+        return self._turbo
+
+    @turbo.setter
+    def turbo(self, turbo: bool) -> None:
+        self._turbo = turbo
+
+    @property
+    def lock(self) -> Lock:
+        return self._lock
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def step(self) -> int:
+        """ Method that runs one tick while holding the lock.
+
+        Returns:
+            ticks (int): The number of ticks simulated so far.
+        """
+        with self.lock:
+            return self.engine.tick()
+
+    def advance(self, dt: float) -> int:
+        """ Method that runs the ticks that are due after "dt" more seconds.
+            Leftover time is kept for the next call. In turbo mode, ticks
+            run back to back for TURBO_BUDGET seconds instead.
+
+        Args:
+            dt (float): The seconds elapsed since the last call.
+
+        Returns:
+            ticks (int): The number of ticks run.
+        """
+        if self.turbo:
+            ticks = 0
+            deadline = time.perf_counter() + TURBO_BUDGET
+            while time.perf_counter() < deadline:
+                self.step()
+                ticks += 1
+            return ticks
+        self._accumulator += dt
+        ticks = min(int(self._accumulator * self.tick_rate),
+                    self.max_ticks_per_frame)
+        self._accumulator -= ticks / self.tick_rate
+        if ticks == self.max_ticks_per_frame:
+            self._accumulator %= 1 / self.tick_rate
+        for _ in range(ticks):
+            self.step()
+        return ticks
+
+    def run(self) -> None:
+        """ Method that runs in the background thread: it runs one tick every
+            1 / tick_rate seconds, or back to back in turbo mode, until
+            stop() is called. In turbo mode it yields after every tick, so
+            a thread waiting for the lock gets it.
+        """
+        deadline = time.perf_counter()
+        while not self._stopping.is_set():
+            if self.turbo:
+                self.step()
+                time.sleep(0)
+                deadline = time.perf_counter()
+                continue
+            wait = deadline - time.perf_counter()
+            if wait > 0:
+                self._stopping.wait(wait)
+                continue
+            self.step()
+            deadline = max(deadline + 1 / self.tick_rate,
+                           time.perf_counter() -
+                           self.max_ticks_per_frame / self.tick_rate)
+
+    def start(self) -> None:
+        """ Method that starts the background thread, if it isn't running.
+        """
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = Thread(target=self.run, name="Stepper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """ Method that stops the background thread and waits for it to
+            finish its tick.
+        """
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
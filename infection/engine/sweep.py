@@ -0,0 +1,207 @@
+""" This module defines the functions that run a parameter sweep: many
+    headless simulations, one per parameter set and replicate seed, fanned
+    out over a pool of worker processes, with the summary of every run
+    streamed into one results table as soon as it finishes.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from infection.engine.simulation_engine import (
+    MAX_COOLDOWN, MAX_TIME_INFECTED, SimulationEngine
+)
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import numpy as np
+
+DEFAULTS = {
+    "infection_probability": .2,
+    "population": 1000,
+    "infected": 10,
+    "max_time_infected": MAX_TIME_INFECTED,
+    "max_cooldown": MAX_COOLDOWN,
+    "ticks": 5000,
+    "width": 800,
+    "height": 600,
+    "index_backend": "grid",
+}
+SUMMARY = ("peak_infected", "time_to_peak", "final_size", "attack_rate",
+           "ticks_run")
+COLUMNS = ("run", "seed") + tuple(DEFAULTS) + SUMMARY
+
+
+def grid(**values) -> list[dict]:
+    """ Function that builds the parameter sets of a full grid: one set per
+        combination of the given values.
+
+    Args:
+        **values: A list of values for each parameter, by name in DEFAULTS.
+
+    Returns:
+        parameter_sets (list[dict]): The parameter sets, with the last
+            parameter changing fastest.
+
+    Raises:
+        ValueError: If a name is not one of DEFAULTS.
+    """
+    for name in values:
+        if name not in DEFAULTS:
+            raise ValueError(f"Unknown sweep parameter: {name}")
+    names = list(values)
+    return [dict(zip(names, combination))
+            for combination in itertools.product(*values.values())]
+
+
+def summarize(engine: SimulationEngine, population: int) -> dict:
+    """ Function that summarizes the epidemic curve of a run from the time
+        series of its engine.
+
+    Args:
+        engine (SimulationEngine): The engine after the run.
+        population (int): The number of individuals in the run.
+
+    Returns:
+        summary (dict): The peak number of infected individuals, the first
+            tick it was reached at, the number of individuals that were
+            ever infected, that number over the population, and the number
+            of ticks run.
+    """
+    infected = engine.series.columns["infected"]
+    peak = int(np.argmax(infected)) if len(infected) else 0
+    final_size = population - (engine.healthy - engine.recovered)
+    return {"peak_infected": int(infected[peak]) if len(infected) else 0,
+            "time_to_peak": int(engine.series.columns["tick"][peak])
+            if len(infected) else 0,
+            "final_size": final_size,
+            "attack_rate": final_size / population if population else 0.0,
+            "ticks_run": engine.ticks}
+
+
+def simulate(parameters: dict, seed: int) -> dict:
+    """ Function that runs one simulation of the sweep in this process. The
+        population is spawned with "infected" of its individuals infected,
+        and the run stops after "ticks" ticks or as soon as nobody is
+        infected, since nothing can change after that.
+
+    Args:
+        parameters (dict): The parameters of the run, by name in DEFAULTS.
+            The missing ones take their default.
+        seed (int): The seed of the run.
+
+    Returns:
+        summary (dict): The parameters, the seed and the summary of the run.
+    """
+    parameters = {**DEFAULTS, **parameters}
+    engine = SimulationEngine(
+        width=parameters["width"], height=parameters["height"],
+        infection_probability=parameters["infection_probability"],
+        index_backend=parameters["index_backend"], seed=seed,
+        max_time_infected=parameters["max_time_infected"],
+        max_cooldown=parameters["max_cooldown"])
+    infected = min(parameters["infected"], parameters["population"])
+    engine.add_healthy(parameters["population"] - infected)
+    engine.add_infected(infected)
+    while engine.ticks < parameters["ticks"] and engine.infected:
+        engine.tick()
+    engine.close()
+    return {"seed": seed, **parameters,
+            **summarize(engine, parameters["population"])}
+
+
+def sweep(parameter_sets: list[dict], seeds: list[int],
+          workers: int = None):
+    """ Function that runs every parameter set with every seed in a pool of
+        worker processes, and yields the summary of every run as soon as it
+        finishes, so the results can be written while the sweep runs.
+
+    Args:
+        parameter_sets (list[dict]): The parameter sets.
+        seeds (list[int]): The replicate seeds of every parameter set.
+        workers (int): The number of worker processes. Defaults to the
+            number of CPUs. With 1, the runs are simulated in this process,
+            in order.
+
+    Yields:
+        summary (dict): The summary of a run, with its "run" number, in the
+            order the runs finish.
+    """
+    runs = list(itertools.product(parameter_sets, seeds))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for run, (parameters, seed) in enumerate(runs):
+            yield {"run": run, **simulate(parameters, seed)}
+        return
+    with ProcessPoolExecutor(min(workers, len(runs) or 1)) as executor:
+        futures = {executor.submit(simulate, parameters, seed): run
+                   for run, (parameters, seed) in enumerate(runs)}
+        for future in as_completed(futures):
+            yield {"run": futures[future], **future.result()}
+
+
+def write_table(summaries, file) -> int:
+    """ Function that writes run summaries as CSV rows with a header row,
+        flushing every row as it arrives.
+
+    Args:
+        summaries: An iterable of run summaries, like the one returned by
+            sweep().
+        file: A writable text file.
+
+    Returns:
+        rows (int): The number of rows written.
+    """
+    writer = csv.DictWriter(file, COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    rows = 0
+    for summary in summaries:
+        writer.writerow(summary)
+        file.flush()
+        rows += 1
+    return rows
+
+
+def main(argv: list = None) -> int:
+    """ Function that runs a sweep from the command line, over the full grid
+        of the given values or over the parameter sets of a JSON file, and
+        streams the results table to standard output or to a CSV file.
+
+    Args:
+        argv (list): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        status (int): 0 when the sweep finished.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run a parameter sweep of headless simulations.")
+    for name, default in DEFAULTS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", nargs="+",
+                            type=type(default), default=[default])
+    parser.add_argument("--sets", help="JSON file with a list of parameter "
+                        "sets, used instead of the grid")
+    parser.add_argument("--replicates", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first replicate")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--output", help="CSV file to write the table to")
+    arguments = parser.parse_args(argv)
+    if arguments.sets:
+        with open(arguments.sets) as sets:
+            parameter_sets = json.load(sets)
+    else:
+        parameter_sets = grid(**{name: getattr(arguments, name)
+                                 for name in DEFAULTS})
+    seeds = list(range(arguments.seed, arguments.seed + arguments.replicates))
+    summaries = sweep(parameter_sets, seeds, arguments.workers)
+    if arguments.output:
+        with open(arguments.output, "w", newline="") as output:
+            write_table(summaries, output)
+    else:
+        write_table(summaries, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+""" This module defines the TimeSeries class, which records the counts of a
+    simulation on every tick into a preallocated NumPy buffer and exports
+    them as CSV or .npz files.
+"""
+from __future__ import annotations
+from pathlib import Path
+import numpy as np
+
+SERIES = ("tick", "susceptible", "infected", "recovered", "new_infections",
+          "new_recoveries")
+CHUNK = 4096
+
+
+class TimeSeries:
+    """ This is the definition of the TimeSeries class. Every record is a row
+        of a two-dimensional integer array with one column per name in
+        SERIES. The array is preallocated in chunks of CHUNK rows, and grows
+        by another chunk only when it runs out of room, so recording a tick
+        is a single row assignment.
+
+    Args:
+        chunk (int): The number of rows added every time the buffer grows.
+            Defaults to CHUNK.
+
+    Attributes:
+        size: Integer with the number of recorded ticks.
+        capacity: Integer with the number of rows the buffer can hold.
+        data: Integer array with shape (size, len(SERIES)) that holds the
+            recorded rows.
+        columns: Dictionary with a view of every recorded column, by name.
+    """
+
+    def __init__(self, chunk: int = CHUNK) -> None:
+        self._chunk = max(chunk, 1)
+        self._size = 0
+        self._buffer = np.zeros((self._chunk, len(SERIES)), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.shape[0]
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._buffer[:self._size]
+
+    @property
+    def columns(self) -> dict:
+        return {name: self.data[:, number]
+                for number, name in enumerate(SERIES)}
+
+    def record(self, tick: int, susceptible: int, infected: int,
+               recovered: int, new_infections: int,
+               new_recoveries: int) -> None:
+        """ Method that appends the counts of a tick, growing the buffer by
+            one chunk if it is full.
+
+        Args:
+            tick (int): The tick number.
+            susceptible (int): The number of healthy individuals that have
+                not recovered.
+            infected (int): The number of infected individuals.
+            recovered (int): The number of recovered individuals.
+            new_infections (int): The number of individuals that got
+                infected in the tick.
+            new_recoveries (int): The number of individuals that recovered
+                in the tick.
+        """
+        if self._size == self.capacity:
+            self._buffer = np.concatenate((self._buffer, np.zeros(
+                (self._chunk, len(SERIES)), dtype=np.int64)))
+        self._buffer[self._size] = (tick, susceptible, infected, recovered,
+                                    new_infections, new_recoveries)
+        self._size += 1
+
+    def clear(self) -> None:
+        """ Method that forgets every record, keeping the buffer.
+        """
+        self._size = 0
+
+    def load(self, data: np.ndarray) -> None:
+        """ Method that replaces the records with the given rows, like when
+            a snapshot is restored.
+
+        Args:
+            data (np.ndarray): Integer array with shape (n, len(SERIES)).
+        """
+        size = len(data)
+        if size > self.capacity:
+            chunks = -(-size // self._chunk)
+            self._buffer = np.zeros((chunks * self._chunk, len(SERIES)),
+                                    dtype=np.int64)
+        self._buffer[:size] = data
+        self._size = size
+
+    def to_csv(self, path: str) -> None:
+        """ Method that writes the records to a CSV file, with a header row
+            with the names in SERIES.
+
+        Args:
+            path (str): The path of the file.
+        """
+        np.savetxt(path, self.data, fmt="%d", delimiter=",",
+                   header=",".join(SERIES), comments="")
+
+    def to_npz(self, path: str) -> None:
+        """ Method that writes the records to a compressed .npz file, with
+            one array per name in SERIES.
+
+        Args:
+            path (str): The path of the file.
+        """
+        np.savez_compressed(path, **self.columns)
+
+    def save(self, path: str) -> None:
+        """ Method that writes the records in the format given by the suffix
+            of "path", ".csv" or ".npz".
+
+        Args:
+            path (str): The path of the file.
+
+        Raises:
+            ValueError: If the suffix is not ".csv" or ".npz".
+        """
+        match Path(path).suffix:
+            case ".csv":
+                self.to_csv(path)
+            case ".npz":
+                self.to_npz(path)
+            case suffix:
+                raise ValueError(f"Unknown time series format: {suffix}")
@@ -0,0 +1,197 @@
+""" This module defines the TransmissionChains class, which records who
+    infected whom, and when, in compact integer arrays, and answers the
+    transmission tree, secondary case and reproduction number queries with
+    array operations.
+"""
+from __future__ import annotations
+import numpy as np
+
+UNKNOWN = -1
+CAPACITY = 1024
+
+
+class TransmissionChains:
+    """ This is the definition of the TransmissionChains class. Every
+        infection is a row of an int32 array with the infector, the infectee
+        and the tick, and every recovery is a row of another one with the
+        individual and the tick. Infections without a known infector, like
+        the individuals added already infected, have UNKNOWN as infector.
+        The arrays are preallocated and doubled when they run out of room,
+        so recording a tick is one slice assignment per array.
+
+    Args:
+        capacity (int): The number of rows the arrays can hold before they
+            need to grow. Defaults to CAPACITY.
+
+    Attributes:
+        infections: Integer array with shape (n, 3) with the infector,
+            infectee and tick of every infection.
+        recoveries: Integer array with shape (n, 2) with the individual and
+            tick of every recovery.
+    """
+
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        self._infections = np.zeros((max(capacity, 1), 3), dtype=np.int32)
+        self._recoveries = np.zeros((max(capacity, 1), 2), dtype=np.int32)
+        self._infection_count = 0
+        self._recovery_count = 0
+
+    def __len__(self) -> int:
+        return self._infection_count
+
+    @property
+    def infections(self) -> np.ndarray:
+        return self._infections[:self._infection_count]
+
+    @property
+    def recoveries(self) -> np.ndarray:
+        return self._recoveries[:self._recovery_count]
+
+    @staticmethod
+    def append(array: np.ndarray, count: int,
+               rows: np.ndarray) -> np.ndarray:
+        """ Method that writes rows after the first "count" rows of an
+            array, doubling the array until they fit.
+
+        Args:
+            array (np.ndarray): The array.
+            count (int): The number of rows in use.
+            rows (np.ndarray): The rows to write.
+
+        Returns:
+            array (np.ndarray): The array, or a bigger copy of it.
+        """
+        capacity = len(array)
+        while count + len(rows) > capacity:
+            capacity *= 2
+        if capacity != len(array):
+            grown = np.zeros((capacity, array.shape[1]), dtype=array.dtype)
+            grown[:count] = array[:count]
+            array = grown
+        array[count:count + len(rows)] = rows
+        return array
+
+    def record_infections(self, infectors: np.ndarray,
+                          infectees: np.ndarray, tick: int) -> None:
+        """ Method that records the infections of a tick.
+
+        Args:
+            infectors (np.ndarray): The individual that infected each
+                infectee, or UNKNOWN.
+            infectees (np.ndarray): The individuals that got infected.
+            tick (int): The tick number.
+        """
+        rows = np.column_stack((infectors, infectees,
+                                np.full(len(infectees), tick)))
+        self._infections = self.append(self._infections,
+                                       self._infection_count, rows)
+        self._infection_count += len(rows)
+
+    def record_recoveries(self, individuals: np.ndarray, tick: int) -> None:
+        """ Method that records the recoveries of a tick.
+
+        Args:
+            individuals (np.ndarray): The individuals that recovered.
+            tick (int): The tick number.
+        """
+        rows = np.column_stack((individuals,
+                                np.full(len(individuals), tick)))
+        self._recoveries = self.append(self._recoveries,
+                                       self._recovery_count, rows)
+        self._recovery_count += len(rows)
+
+    def clear(self) -> None:
+        """ Method that forgets every record, keeping the arrays.
+        """
+        self._infection_count = 0
+        self._recovery_count = 0
+
+    def load(self, infections: np.ndarray, recoveries: np.ndarray) -> None:
+        """ Method that replaces the records with the given rows, like when
+            a snapshot is restored.
+
+        Args:
+            infections (np.ndarray): Integer array with shape (n, 3) with
+                the infector, infectee and tick of every infection.
+            recoveries (np.ndarray): Integer array with shape (n, 2) with
+                the individual and tick of every recovery.
+        """
+        self.clear()
+        self._infections = self.append(self._infections, 0, infections)
+        self._recoveries = self.append(self._recoveries, 0, recoveries)
+        self._infection_count = len(infections)
+        self._recovery_count = len(recoveries)
+
+    def tree(self, size: int) -> np.ndarray:
+        """ Method that returns the transmission tree as the infector of
+            every individual.
+
+        Args:
+            size (int): The number of individuals in the population.
+
+        Returns:
+            infectors (np.ndarray): The infector of each individual, or
+                UNKNOWN for the ones that were never infected or have no
+                known infector.
+        """
+        infectors = np.full(size, UNKNOWN, dtype=np.int32)
+        infections = self.infections
+        infectors[infections[:, 1]] = infections[:, 0]
+        return infectors
+
+    def infectees(self, infector: int) -> np.ndarray:
+        """ Method that returns the individuals infected by an individual.
+
+        Args:
+            infector (int): The index of the individual.
+
+        Returns:
+            infectees (np.ndarray): The individuals it infected, in the
+                order they got infected.
+        """
+        infections = self.infections
+        return infections[infections[:, 0] == infector, 1]
+
+    def secondary_cases(self, size: int) -> np.ndarray:
+        """ Method that counts the individuals infected by each individual.
+
+        Args:
+            size (int): The number of individuals in the population.
+
+        Returns:
+            counts (np.ndarray): The number of secondary cases of each
+                individual.
+        """
+        infectors = self.infections[:, 0]
+        return np.bincount(infectors[infectors != UNKNOWN], minlength=size)
+
+    def effective_r(self, ticks: int, window: int = 100) -> np.ndarray:
+        """ Method that estimates a running effective reproduction number:
+            for every tick, the mean number of secondary cases of the
+            individuals that got infected in the last "window" ticks. The
+            latest values grow as their cohort goes on infecting, so they
+            are only final once that cohort recovered. Infections recorded
+            at or after "ticks" belong to no cohort and are left out.
+
+        Args:
+            ticks (int): The number of ticks to estimate, from 0.
+            window (int): The number of ticks of every cohort. Defaults to
+                100.
+
+        Returns:
+            r (np.ndarray): Float array with the estimate of each tick, or
+                NaN for the ticks without infections in their window.
+        """
+        infections = self.infections
+        size = int(max(infections[:, :2].max(initial=-1) + 1, 0))
+        cohort_rows = (infections[:, 2] >= 0) & (infections[:, 2] < ticks)
+        secondary = self.secondary_cases(size)[infections[cohort_rows, 1]]
+        tick = infections[cohort_rows, 2]
+        cases = np.cumsum(np.bincount(tick, weights=secondary,
+                                      minlength=ticks)[:ticks])
+        cohort = np.cumsum(np.bincount(tick, minlength=ticks)[:ticks])
+        cases[window:] = cases[window:] - cases[:-window].copy()
+        cohort[window:] = cohort[window:] - cohort[:-window].copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(cohort > 0, cases / np.maximum(cohort, 1),
+                            np.nan)
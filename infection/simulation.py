@@ -1,49 +1,81 @@
 """ This module defines the Simulation class and all of its properties
-    and methods. This is the main class that controls the simulation.
+    and methods. This is the Kivy front-end of the simulation: the model
+    itself lives in the SimulationEngine, and this class only renders it.
 """
 from __future__ import annotations
-from quads import QuadTree
+from infection.engine.events import EventLog
+from infection.engine.journal import Journal
+from infection.engine.population import Population
+from infection.engine.spatial_index import SpatialIndex
 from infection.decorators.debugging_decorator import debugging_decorator
+from infection.engine.simulation_engine import SimulationEngine
+from infection.engine.stepper import Stepper
 from infection.util.menu_bottom import MenuBottom
 from infection.util.menu_right import MenuRight
-from infection.util.individual import HealthyIndividual, InfectedIndividual
-from infection.util.circular_button import CircularButton
-from threading import enumerate, Lock
-from concurrent.futures import ThreadPoolExecutor
-from random import randint, uniform
+from infection.util.performance_hud import PerformanceHud
+from infection.util.population_renderer import PopulationRenderer
 from kivy.uix.anchorlayout import AnchorLayout
 from kivy.uix.boxlayout import BoxLayout
 from kivy.app import App
-from kivy.vector import Vector
 from kivy.clock import Clock
 from kivy.core.window import Window
-import logging
+import time
 
-lock = Lock()
-logging.basicConfig(level=10, format="%(threadName)s:%(message)s")
+TURBO_RENDER_RATE = 4.0
+LABEL_REFRESH_RATE = 4.0
 
 
 class Simulation(App):
     """ This is the definition of the Simulation class. It inherits from the
         App Kivy class.
 
+    Args:
+        seed (int): The seed of the engine's random numbers. Defaults to
+            None, which takes a fresh seed from the operating system.
+        series_path (str): The ".csv" or ".npz" file the engine's time
+            series is exported to when the App stops. Defaults to None,
+            which doesn't export it.
+        log_path (str): The JSON-lines file the engine's events are written
+            to. Defaults to None, which doesn't write them.
+        log_level (str): The lowest level of the events written: "debug",
+            "info" or "warning". Defaults to "info".
+        journal_path (str): The JSON file the journal of the user's actions
+            is saved to when the App stops, to replay the run headless.
+            Defaults to None, which doesn't save it.
+
     Attributes:
-        thread_pool: A ThreadPoolExecutor instance to spawn new threads
-            as required for the simulation, with a maximum of 4 workers.
-        threads: Integer that keeps the count of the spawned threads.
-        quadtree: A QuadTree structure that contains the positions of all the
-            individuals in the simulation for fast neighbor search.
-        population: List of all the Individuals in the simulation.
-        healthy: Integer that keeps the count of the healthy individuals
+        engine: A SimulationEngine instance that holds the population, the
+            spatial index and the counters, and advances the simulation.
+        journal: The Journal with the engine's settings and seed, and every
+            action the user took with the tick it was taken at.
+        stepper: A Stepper that advances the engine in fixed ticks, from the
+            Clock or from a background thread once the App is running.
+        turbo: Boolean that is True when the stepper runs as many ticks as
+            the CPU allows, and the canvas is only redrawn TURBO_RENDER_RATE
+            times per second.
+        hud: The PerformanceHud that shows the engine's metrics over the
+            arena while the HUD ToggleButton is down. It is created in
+            build().
+        renderer: The PopulationRenderer that draws the whole population in
+            the canvas with a few batched instructions. It is created in
+            build().
+        spatial_index: The engine's SpatialIndex structure that contains the
+            positions of the infected individuals in the simulation for fast
+            neighbor search.
+        quadtree: Alias of spatial_index, kept from when the quadtree was
+            the only backend.
+        population: The engine's Population store with all the individuals
+            in the simulation.
+        healthy: Integer with the engine's count of the healthy individuals
             in the simulation.
-        infected: Integer that keeps the count of the infected individuals
+        infected: Integer with the engine's count of the infected individuals
             in the simulation.
-        infection_probability: Float that stores the current infection
-            probability value. Initialized to 0.2.
+        infection_probability: Float that stores the engine's current
+            infection probability value. Initialized to 0.2.
         individual_size: The size of an individual in the canvas. It also
             determines how close a healthy individual needs to be to an
-            infected one to get infected. Ignored in the InfectedIndividual
-            class. Initialized to Window.size[1] * .035.
+            infected one to get infected. Initialized to
+            Window.size[1] * .035.
         healthy_color: The color of a healthy individual in the canvas.
             Initialized to the rgba value of blue.
         infected_color: The color of an infected individual in the canvas.
@@ -52,100 +84,98 @@ class Simulation(App):
             Initialized to the rgba value of green.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, seed: int = None, series_path: str = None,
+                 log_path: str = None, log_level: str = "info",
+                 journal_path: str = None, **kwargs):
         super(Simulation, self).__init__(**kwargs)
-        self._thread_pool = ThreadPoolExecutor(
-            max_workers=4)
-        self._threads = len(enumerate())
-        self._quadtree = QuadTree((0, 0), Window.size[0], Window.size[1])
-        self._population = []
-        self._healthy = 0
-        self._infected = 0
-        self._infection_probability = 0.2
-        self._individual_size = Window.size[1] * .035
+        self._engine = SimulationEngine(
+            width=Window.size[0],
+            height=Window.size[1],
+            individual_size=Window.size[1] * .035,
+            seed=seed,
+            events=EventLog(log_path, log_level))
+        self._stepper = Stepper(self._engine)
+        self._journal = Journal.from_engine(self._engine)
+        self._series_path = series_path
+        self._journal_path = journal_path
+        self._last_render = 0.0
+        self._last_labels = 0.0
+        self._hud = None
+        self._renderer = None
         self._healthy_color = [0, .3, .7, 1]
         self._infected_color = [.85, .07, .23, 1]
         self._recovered_color = [0, .5, 0, 1]
 
     @property
-    def quadtree(self) -> QuadTree:
-        return self._quadtree
+    def engine(self) -> SimulationEngine:
+        return self._engine
 
-    @quadtree.setter
-    def quadtree(self, quadtree: QuadTree) -> None:
-        self._quadtree = quadtree
+    @engine.setter
+    def engine(self, engine: SimulationEngine) -> None:
+        self._engine = engine
 
     @property
-    def thread_pool(self) -> ThreadPoolExecutor:
-        return self._thread_pool
+    def stepper(self) -> Stepper:
+        return self._stepper
 
-    @thread_pool.setter
-    def thread_pool(self, thread_pool: ThreadPoolExecutor) -> None:
-        self._thread_pool = thread_pool
+    @property
+    def journal(self) -> Journal:
+        return self._journal
 
     @property
-    def infected(self) -> int:
-        return self._infected
+    def turbo(self) -> bool:
+        return self.stepper.turbo
 
-    @infected.setter
-    def infected(self, infected_number: int) -> None:
-        self._infected = infected_number
+    @turbo.setter
+    def turbo(self, turbo: bool) -> None:
+        self.stepper.turbo = turbo
 
-    @infected.deleter
-    def infected(self) -> None:
-        self._infected = 0
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        return self.engine.spatial_index
 
     @property
-    def healthy(self) -> int:
-        return self._healthy
+    def quadtree(self) -> SpatialIndex:
+        return self.engine.quadtree
 
-    @healthy.setter
-    def healthy(self, healthy_number: int) -> None:
-        self._healthy = healthy_number
+    @property
+    def infected(self) -> int:
+        return self.engine.infected
 
-    @healthy.deleter
-    def healthy(self) -> None:
-        self._healthy = 0
+    @property
+    def healthy(self) -> int:
+        return self.engine.healthy
 
     @property
     def infection_probability(self) -> float:
-        return self._infection_probability
+        return self.engine.infection_probability
 
     @infection_probability.setter
     def infection_probability(self, infection_probability: float) -> None:
-        self._infection_probability = infection_probability
+        if infection_probability != self.engine.infection_probability:
+            self.journal.record(self.engine.ticks, "infection_probability",
+                                infection_probability)
+        self.engine.infection_probability = infection_probability
 
     @property
-    def threads(self) -> int:
-        return self._threads
-
-    @threads.setter
-    def threads(self, threads: int) -> None:
-        self._threads = threads
-
-    @threads.deleter
-    def threads(self) -> None:
-        self._threads = 0
+    def hud(self) -> PerformanceHud:
+        return self._hud
 
     @property
-    def population(self) -> list:
-        return self._population
+    def population(self) -> Population:
+        return self.engine.population
 
-    @population.setter
-    def population(self, population: list) -> None:
-        self._population = population
+    @property
+    def renderer(self) -> PopulationRenderer:
+        return self._renderer
 
-    @population.deleter
-    def population(self) -> None:
-        self._population = []
+    @renderer.setter
+    def renderer(self, renderer: PopulationRenderer) -> None:
+        self._renderer = renderer
 
     @property
-    def individual_size(self) -> int:
-        return self._individual_size
-
-    @individual_size.setter
-    def individual_size(self, individual_size: int) -> None:
-        self._individual_size = individual_size
+    def individual_size(self) -> float:
+        return self.engine.individual_size
 
     @property
     def healthy_color(self) -> list:
@@ -173,9 +203,9 @@ class Simulation(App):
 
     @debugging_decorator
     def safe_sum_healthy(self, number: int) -> int:
-        """ Method that safely increases or decreases the healthy individual
-            count, using "with lock" to avoid race condition. It also updates
-            the value of the healthy individual count Label in the menu_bottom.
+        """ Method that safely increases or decreases the engine's healthy
+            individual count. The Label in the menu_bottom is updated on the
+            next render.
 
         Args:
             number (int): The number of healthy individuals to
@@ -184,17 +214,13 @@ class Simulation(App):
         Returns:
             self.healthy (int): The final count of healthy individuals.
         """
-        with lock:
-            self.healthy += number
-            self.menu_bottom.lbl_value_healthy.text = str(
-                int(self.menu_bottom.lbl_value_healthy.text) + number)
-        return self.healthy
+        return self.engine.safe_sum_healthy(number)
 
     @debugging_decorator
     def safe_sum_infected(self, number: int) -> int:
-        """ Method that safely increases or decreases the infected individual
-            count, using "with lock" to avoid race condition. It also updates
-            the value of the infected individual count Label in the menu_bottom
+        """ Method that safely increases or decreases the engine's infected
+            individual count. The Label in the menu_bottom is updated on the
+            next render.
 
         Args:
             number (int): The number of infected individuals to
@@ -203,42 +229,31 @@ class Simulation(App):
         Returns:
             self.infected (int): The final count of infected individuals.
         """
-        with lock:
-            self.infected += number
-            self.menu_bottom.lbl_value_infected.text = str(
-                int(
-                    self.menu_bottom.lbl_value_infected.text) + number)
-        return self.infected
+        return self.engine.safe_sum_infected(number)
 
     @debugging_decorator
-    def reset_population(self, *largs) -> list:
+    def reset_population(self, *largs) -> Population:
         """ Method that resets all the simulation's properties to their
-            initial states and values.
+            initial states and values, and journals the reset with the seed
+            the engine restarted from, which is a fresh one when the engine
+            was created without a seed.
 
         Returns:
-            self.population (list): An empty list after the population
-                was deleted.
+            self.population (Population): An empty population after the
+                individuals were deleted.
         """
-        self.menu_bottom.lbl_value_population.text = "0"
-        self.menu_bottom.lbl_value_healthy.text = "0"
-        self.menu_bottom.lbl_value_infected.text = "0"
-        self.thread_pool.shutdown()
-        self.thread_pool = ThreadPoolExecutor(
-            max_workers=4)
-        del self.threads
-        del self.population
-        del self.healthy
-        del self.infected
-        self.layout.clear_widgets()
-        self.layout.canvas.clear()
-        self.layout.add_widget(self.menu_right)
+        with self.stepper.lock:
+            ticks = self.engine.ticks
+            self.engine.reset()
+            self.journal.record(ticks, "reset", self.engine.seed)
+        self.render(labels=True)
         return self.population
 
     @debugging_decorator
     def add_healthy(self, number: int, *largs) -> int:
         """ Method that adds new healthy individuals to the simulation. The
             number of individuals added is determined by the provided "number"
-            argument.
+            argument. The action is journaled with the current tick.
 
         Args:
             number (int): The number of healthy individuals to add to the
@@ -247,37 +262,17 @@ class Simulation(App):
         Returns:
             self.healthy (int): The final count of healthy individuals.
         """
-        self.menu_bottom.lbl_value_population.text = str(
-            int(self.menu_bottom.lbl_value_population.text) + number)
-        self.safe_sum_healthy(number)
-        with self.layout.canvas:
-            for x in range(number):
-                coordinate = (uniform(
-                    0, self.layout.width -
-                    self.menu_right.width - self.individual_size),
-                    uniform(self.menu_bottom.height, self.layout.height))
-                healthy_individual = HealthyIndividual(
-                    self, self.infection_probability)
-                circular_button = CircularButton(
-                    size=(self.individual_size, self.individual_size),
-                    pos=coordinate,
-                    text="",
-                    color=self.healthy_color,
-                    simulation=self,
-                    individual=healthy_individual)
-                logging.info(f"New healthy individual with \
-{circular_button.individual.infection_probability} infection probability.")
-                circular_button.speed = uniform(0.3, 0.7)
-                circular_button.direction = Vector(4, 0).rotate(
-                    randint(0, 360))
-                self.population.append(circular_button)
-                return self.healthy
+        with self.stepper.lock:
+            self.journal.record(self.engine.ticks, "add_healthy", number)
+            self.engine.add_healthy(number)
+        self.render(labels=True)
+        return self.healthy
 
     @debugging_decorator
     def add_infected(self, number: int, *largs) -> int:
         """ Method that adds new infected individuals to the simulation. The
             number of individuals added is determined by the provided "number"
-            argument.
+            argument. The action is journaled with the current tick.
 
         Args:
             number (int): The number of infected individuals to add to the
@@ -286,63 +281,76 @@ class Simulation(App):
         Returns:
             self.infected (int): The final count of infected individuals.
         """
-        self.menu_bottom.lbl_value_population.text = str(
-            int(self.menu_bottom.lbl_value_population.text) + number)
-        self.safe_sum_infected(number)
-        with self.layout.canvas:
-            for x in range(number):
-                coordinate = (uniform(
-                    0, self.layout.width -
-                    self.menu_right.width - self.individual_size),
-                    uniform(self.menu_bottom.height, self.layout.height))
-                infected_individual = InfectedIndividual(simulation=self)
-                circular_button = CircularButton(
-                    size=(self.individual_size, self.individual_size),
-                    pos=coordinate,
-                    text="",
-                    color=self.infected_color,
-                    simulation=self,
-                    individual=infected_individual)
-                logging.info("New infected individual.")
-                circular_button.speed = uniform(0.2, 0.5)
-                circular_button.direction = Vector(4, 0).rotate(
-                    randint(0, 360))
-                self.population.append(circular_button)
-                return self.infected
+        with self.stepper.lock:
+            self.journal.record(self.engine.ticks, "add_infected", number)
+            self.engine.add_infected(number)
+        self.render(labels=True)
+        return self.infected
+
+    def on_layout_size(self, *largs) -> None:
+        """ Method bound to the size of the layout and the menus that keeps
+            the engine's arena bounds in sync with the area of the canvas
+            that is not covered by the menus. Bounds that would leave no room
+            for an individual, as happens before the first layout pass, are
+            ignored. The bounds change between two ticks and is journaled,
+            since it changes how the individuals move.
+        """
+        bounds = (0, self.menu_bottom.height,
+                  self.root.width - self.menu_right.width, self.root.height)
+        if (bounds[2] - bounds[0] > self.individual_size and
+                bounds[3] - bounds[1] > self.individual_size and
+                bounds != self.engine.bounds):
+            with self.stepper.lock:
+                self.journal.record(self.engine.ticks, "bounds", bounds)
+                self.engine.bounds = bounds
+
+    def render(self, labels: bool = False) -> None:
+        """ Method that draws the engine's current state: the renderer
+            rebuilds its buffers from the population's columns, and the
+            menu_bottom Labels are refreshed with the engine's counters, at
+            most LABEL_REFRESH_RATE times per second, like the HUD when it
+            is shown. The epidemic curve
+            appends the ticks recorded since the last render. The stepper's
+            lock is held, so no tick runs while drawing and the counters
+            match the drawn population.
+
+        Args:
+            labels (bool): True to refresh the Labels right away, after a
+                change made by the user. Defaults to False.
+        """
+        with self.stepper.lock:
+            self.renderer.refresh()
+            counts = (len(self.population), self.healthy, self.infected)
+            self.menu_bottom.epidemic_curve.refresh(self.engine.series,
+                                                    counts[0])
+        self._last_render = time.perf_counter()
+        if (labels or self._last_render - self._last_labels >=
+                1 / LABEL_REFRESH_RATE):
+            self.menu_bottom.refresh(*counts)
+            if self.hud.parent is not None:
+                self.hud.refresh(self.engine.metrics.snapshot(), counts[0])
+                self.hud.pos = (self.engine.bounds[0],
+                                self.engine.bounds[3] - self.hud.height)
+            self._last_labels = self._last_render
 
     def update(self, dt: float) -> None:
-        """ Kivy method used to update the simulation on each cycle.
-            It uses the thread pool in self.thread_pool to spawn threads to
-            control the infection state and movement of each individual in
-            the simulation.
-            To control the infection state, the "infection" method of each
-            Individual is invoked in a thread, providing it the button
-            containing the individual, and a quadtree with the positions of
-            all the individuals.
-            To control the movement, the "move" method of each Individual is
-            invoked in a thread, providing an instance of the main simulation
-            so the individual can calculate its position in the canvas and
-            determine when it has to change direction.
+        """ Kivy method used to update the simulation on each cycle. Unless
+            the stepper's background thread is running, the stepper runs the
+            ticks that are due after "dt" seconds, so the simulation speed
+            doesn't depend on the frame rate. The new state is then rendered,
+            at most TURBO_RENDER_RATE times per second in turbo mode. The
+            frame time is recorded in the engine's metrics.
 
         Args:
             dt (Float): Internal Kivy property used to update the app on each
             cycle.
         """
-        self.quadtree = QuadTree(
-            (0, 0), 2 * Window.size[0], 2 * Window.size[1])
-        for circle in self.population:
-            self.quadtree.insert(circle.pos, data=circle.individual.status)
-        executor = self.thread_pool
-        for i in range(0, len(self.population)):
-            executor.submit(
-                self.population[i].individual.infection(
-                    self.population[i],
-                    self.quadtree))
-        for individual in self.population:
-            executor.submit(individual.move(self))
-        if len(enumerate()) != self.threads:
-            self.threads = len(enumerate())
-            logging.info(f"Threads: {self.threads}")
+        self.engine.metrics.record_frame(dt)
+        if not self.stepper.running:
+            self.stepper.advance(dt)
+        if (not self.turbo or time.perf_counter() - self._last_render >=
+                1 / TURBO_RENDER_RATE):
+            self.render()
 
     def build(self) -> BoxLayout:
         """ Kivy method that initializes and integrates all the components of
@@ -359,7 +367,60 @@ class Simulation(App):
                                     size_hint=(.1, .7))
         self.layout.add_widget(self.menu_right)
         self.menu_bottom = MenuBottom(self, size_hint=(1, 0.2))
+        self.renderer = PopulationRenderer(self)
+        self._hud = PerformanceHud()
+        self.layout.canvas.add(self.renderer)
         self.root.add_widget(self.layout)
         self.root.add_widget(self.menu_bottom)
+        for widget in (self.layout, self.menu_right, self.menu_bottom):
+            widget.bind(size=self.on_layout_size)
         Clock.schedule_interval(self.update, 1.0 / 60.0)
         return self.root
+
+    def on_start(self) -> None:
+        """ Kivy method called when the App starts running, that starts the
+            stepper's background thread.
+        """
+        self.stepper.start()
+
+    def on_stop(self) -> None:
+        """ Kivy method called when the App stops, that stops the stepper's
+            background thread, exports the engine's time series if a
+            series_path was given, saves the journal with the final tick
+            count if a journal_path was given and releases the engine's
+            workers.
+        """
+        self.stepper.stop()
+        if self._series_path is not None:
+            self.engine.save_series(self._series_path)
+        self.journal.ticks = self.engine.ticks
+        if self._journal_path is not None:
+            self.journal.save(self._journal_path)
+        self.engine.close()
+
+    def toggle_turbo(self, instance, state: str) -> None:
+        """ Method bound to the state of the turbo ToggleButton in the
+            menu_right, that turns the turbo mode on while it is pressed.
+
+        Args:
+            instance (kivy.uix.togglebutton.ToggleButton): The turbo
+                ToggleButton's instance.
+            state (str): The state of the ToggleButton: "down" or "normal".
+        """
+        self.turbo = state == "down"
+
+    def toggle_hud(self, instance, state: str) -> None:
+        """ Method bound to the state of the HUD ToggleButton in the
+            menu_right, that shows the PerformanceHud over the window while
+            it is pressed.
+
+        Args:
+            instance (kivy.uix.togglebutton.ToggleButton): The HUD
+                ToggleButton's instance.
+            state (str): The state of the ToggleButton: "down" or "normal".
+        """
+        if state == "down" and self.hud.parent is None:
+            Window.add_widget(self.hud)
+            self.render(labels=True)
+        elif state != "down" and self.hud.parent is not None:
+            self.hud.parent.remove_widget(self.hud)
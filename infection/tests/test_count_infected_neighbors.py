@@ -1,5 +1,5 @@
 """ This module contains the unit tests for the count_infected_neighbors method
-    from the Individual class.
+    from the SimulationEngine class.
 """
 import pytest
 from infection.simulation import Simulation
@@ -32,12 +32,9 @@ def test_count_infected_neighbors_two(simulation_instance: Simulation) -> None:
     simulation.population[1].pos = (0, simulation.individual_size)
     simulation.add_infected(1)
     simulation.population[2].pos = (0, simulation.individual_size)
-    for circle in simulation.population:
-        simulation.quadtree.insert(circle.pos, data=circle.individual.status)
-    healthy_individual = simulation.population[0].individual
-    infected_neighbor_count = healthy_individual.count_infected_neighbors(
-        simulation.population[0],
-        simulation.quadtree)
+    simulation.engine.build_index()
+    infected_neighbor_count = simulation.engine.count_infected_neighbors(
+        0, simulation.spatial_index)
 
     assert infected_neighbor_count == 2
 
@@ -58,11 +55,8 @@ def test_count_infected_neighbors_zero(
     simulation.population[1].pos = (0, simulation.individual_size)
     simulation.add_healthy(1)
     simulation.population[2].pos = (0, simulation.individual_size)
-    for circle in simulation.population:
-        simulation.quadtree.insert(circle.pos, data=circle.individual.status)
-    healthy_individual = simulation.population[0].individual
-    infected_neighbor_count = healthy_individual.count_infected_neighbors(
-        simulation.population[0],
-        simulation.quadtree)
+    simulation.engine.build_index()
+    infected_neighbor_count = simulation.engine.count_infected_neighbors(
+        0, simulation.spatial_index)
 
     assert infected_neighbor_count == 0
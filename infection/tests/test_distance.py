@@ -1,5 +1,5 @@
 """ This module contains the unit tests for the distance method from
-    the CircularButton class.
+    the AgentView class.
 """
 import pytest
 from infection.simulation import Simulation
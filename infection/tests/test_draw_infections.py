@@ -0,0 +1,59 @@
+""" This module contains the unit tests for the draw_infections method from
+    the SimulationEngine class.
+"""
+import pytest
+import numpy as np
+from infection.engine.population import STATUS_HEALTHY
+from infection.engine.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class
+            with 20000 healthy individuals with 0.2 infection probability.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              seed=11)
+    engine.population.add(0, 0, 0, 0, 0.5, STATUS_HEALTHY,
+                          np.full(20000, 0.2))
+    return engine
+
+
+def test_draw_infections_probability(
+        engine_instance: SimulationEngine) -> None:
+    """ This method will test if draw_infections() infects individuals with
+        3 infected neighbors with probability 1 - (1 - 0.2) ** 3.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    indices = np.arange(20000)
+    infected = engine_instance.draw_infections(indices, np.full(20000, 3))
+
+    assert infected.mean() == pytest.approx(1 - 0.8 ** 3, abs=0.02)
+
+
+def test_draw_infections_limits(engine_instance: SimulationEngine) -> None:
+    """ This method will test if draw_infections() never infects individuals
+        with no infected neighbors or with 0 infection probability, and
+        always infects individuals with 1.0 infection probability.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    population = engine_instance.population
+    population.infection_probability[:100] = 0.0
+    population.infection_probability[100:200] = 1.0
+    counts = np.full(300, 2)
+    counts[200:] = 0
+    infected = engine_instance.draw_infections(np.arange(300), counts)
+
+    assert not infected[:100].any()
+    assert infected[100:200].all()
+    assert not infected[200:].any()
@@ -0,0 +1,116 @@
+""" This module contains the unit tests for the Ensemble and EnsembleSeries
+    classes.
+"""
+import numpy as np
+import pytest
+from infection.engine.ensemble import CURVES, Ensemble, EnsembleSeries
+from infection.engine.population import STATUS_HEALTHY, STATUS_INFECTED
+
+
+@pytest.fixture
+def ensemble_instance() -> Ensemble:
+    """ This is a pytest.fixture method to provide a small ensemble of
+        crowded replicates.
+
+    Returns:
+        ensemble (Ensemble): An instance of the ensemble class.
+    """
+    return Ensemble(12, 150, infected=3, width=150, height=150,
+                    individual_size=8, infection_probability=.6,
+                    max_time_infected=20, max_cooldown=5, seed=9)
+
+
+def test_ensemble_counts(ensemble_instance: Ensemble) -> None:
+    """ This method will test if the S/I/R counts of every replicate match
+        the columns of its individuals while it runs.
+
+    Args:
+        ensemble_instance (Ensemble): An instance of the ensemble class.
+    """
+    ensemble = ensemble_instance
+    assert ensemble.run(15) == 15
+    columns = ensemble.columns
+    assert columns["x"].shape == (12, 150)
+    np.testing.assert_array_equal(
+        ensemble.infected, (columns["status"] == STATUS_INFECTED).sum(1))
+    np.testing.assert_array_equal(ensemble.recovered,
+                                  columns["recovered"].sum(1))
+    np.testing.assert_array_equal(
+        ensemble.susceptible + ensemble.infected + ensemble.recovered, 150)
+    assert ensemble.infected.sum() > 36
+    assert (columns["x"] > -5).all() and (columns["x"] < 155).all()
+
+
+def test_ensemble_replicates_are_isolated() -> None:
+    """ This method will test if the individuals of a replicate can't infect
+        the individuals of another one, even at the same positions.
+    """
+    ensemble = Ensemble(2, 20, infected=1, width=100, height=100,
+                        individual_size=10, infection_probability=1.0,
+                        seed=2)
+    columns = ensemble.columns
+    columns["x"][:] = 50 + .2 * np.arange(20)
+    columns["y"][:] = 50
+    columns["speed"][:] = 0
+    columns["status"][1] = STATUS_HEALTHY
+    ensemble.infected[1] = 0
+    ensemble.susceptible[1] = 20
+    ensemble.tick()
+    np.testing.assert_array_equal(ensemble.infected, [20, 0])
+    assert (ensemble.columns["status"][1] == STATUS_HEALTHY).all()
+
+
+def test_ensemble_seed(ensemble_instance: Ensemble) -> None:
+    """ This method will test if two ensembles with the same seed give the
+        same curves, and if a run stops once nobody is infected.
+
+    Args:
+        ensemble_instance (Ensemble): An instance of the ensemble class.
+    """
+    again = Ensemble(12, 150, infected=3, width=150, height=150,
+                     individual_size=8, infection_probability=.6,
+                     max_time_infected=20, max_cooldown=5, seed=9)
+    ensemble_instance.run(10)
+    again.run(10)
+    np.testing.assert_array_equal(ensemble_instance.series.bands,
+                                  again.series.bands)
+    short = Ensemble(4, 10, infected=10, max_time_infected=3, seed=1)
+    assert short.run(100) == 3
+    np.testing.assert_array_equal(short.recovered, 10)
+
+
+def test_ensemble_series(ensemble_instance: Ensemble, tmp_path) -> None:
+    """ This method will test if the series keeps the mean, the standard
+        deviation and the quantile bands of every tick, grows past its
+        chunk, and exports them.
+
+    Args:
+        ensemble_instance (Ensemble): An instance of the ensemble class.
+        tmp_path (Path): A temporary directory.
+    """
+    ensemble = ensemble_instance
+    ensemble.run(8)
+    series = ensemble.series
+    counts = np.column_stack((ensemble.susceptible, ensemble.infected,
+                              ensemble.recovered))
+    assert series.size == 9
+    np.testing.assert_array_equal(series.ticks, np.arange(9))
+    np.testing.assert_allclose(series.mean[-1], counts.mean(0))
+    np.testing.assert_allclose(series.std[-1], counts.std(0))
+    np.testing.assert_allclose(series.bands[-1],
+                               np.quantile(counts, series.quantiles, 0))
+    assert (np.diff(series.bands, axis=1) >= 0).all()
+    small = EnsembleSeries((.1, .9), chunk=2)
+    for tick in range(5):
+        small.record(tick, np.full((3, len(CURVES)), tick))
+    np.testing.assert_array_equal(small.mean[:, 0], np.arange(5))
+    series.save(tmp_path / "ensemble.csv")
+    header = (tmp_path / "ensemble.csv").read_text().splitlines()[0]
+    assert header.split(",")[:4] == ["tick", "susceptible_mean",
+                                     "susceptible_std", "susceptible_q05"]
+    series.save(tmp_path / "ensemble.npz")
+    with np.load(tmp_path / "ensemble.npz") as saved:
+        np.testing.assert_allclose(saved["infected_q50"],
+                                   series.bands[:, 2, 1])
+    with pytest.raises(ValueError):
+        series.save(tmp_path / "ensemble.txt")
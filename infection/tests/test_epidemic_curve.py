@@ -0,0 +1,69 @@
+""" This module contains the unit tests for the refresh method from the
+    EpidemicCurve class.
+"""
+import pytest
+from infection.simulation import Simulation
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing, with an epidemic curve 100
+        pixels wide.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation(seed=5)
+    simulation.build()
+    simulation.menu_bottom.epidemic_curve.size = (100, 50)
+    simulation.add_healthy(20)
+    simulation.add_infected(2)
+    return simulation
+
+
+def test_refresh_append(simulation_instance: Simulation) -> None:
+    """ This method will test if refresh() appends one point per new tick to
+        every Line, on top of the ones drawn before.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    curve = simulation.menu_bottom.epidemic_curve
+    for _ in range(10):
+        simulation.engine.tick()
+    simulation.render()
+    line = curve.lines["infected"]
+    before = list(line.points)
+    for _ in range(5):
+        simulation.engine.tick()
+    simulation.render()
+
+    assert len(line.points) == 2 * 15
+    assert line.points[:len(before)] == before
+    assert line.points[-1] == pytest.approx(
+        curve.y + simulation.infected * curve.height / 22)
+
+
+def test_refresh_downsample(simulation_instance: Simulation) -> None:
+    """ This method will test if refresh() doubles the stride and keeps the
+        points within the width of the widget when the series grows longer,
+        and starts over after a reset.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    curve = simulation.menu_bottom.epidemic_curve
+    for _ in range(350):
+        simulation.engine.tick()
+    simulation.render()
+    series = simulation.engine.series
+
+    assert curve.stride == 4
+    assert len(curve.samples) <= curve.width
+    assert (curve.samples[:, 1] == series.columns["infected"][::4]).all()
+    simulation.reset_population()
+    assert curve.stride == 1
+    assert curve.lines["infected"].points == []
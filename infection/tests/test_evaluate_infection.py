@@ -1,5 +1,5 @@
 """ This module contains the unit tests for the evaluate_infection method from
-    the Individual class.
+    the SimulationEngine class.
 """
 import pytest
 from infection.simulation import Simulation
@@ -32,12 +32,9 @@ def test_evaluate_infection_sick(simulation_instance: Simulation) -> None:
     simulation.population[0].pos = (0, 0)
     simulation.add_infected(1)
     simulation.population[1].pos = (0, simulation.individual_size)
-    for circle in simulation.population:
-        simulation.quadtree.insert(circle.pos, data=circle.individual.status)
-    healthy_individual = simulation.population[0].individual
-    infected, infected_neighbor_count = healthy_individual.evaluate_infection(
-        simulation.population[0],
-        simulation.quadtree)
+    simulation.engine.build_index()
+    infected, infected_neighbor_count = simulation.engine.evaluate_infection(
+        0, simulation.spatial_index)
 
     assert infected == 1
     assert infected_neighbor_count == 1
@@ -57,12 +54,9 @@ def test_evaluate_infection_healthy(simulation_instance: Simulation) -> None:
     simulation.population[0].pos = (0, 0)
     simulation.add_healthy(1)
     simulation.population[1].pos = (0, simulation.individual_size)
-    for circle in simulation.population:
-        simulation.quadtree.insert(circle.pos, data=circle.individual.status)
-    healthy_individual = simulation.population[0].individual
-    infected, infected_neighbor_count = healthy_individual.evaluate_infection(
-        simulation.population[0],
-        simulation.quadtree)
+    simulation.engine.build_index()
+    infected, infected_neighbor_count = simulation.engine.evaluate_infection(
+        0, simulation.spatial_index)
 
     assert infected == 0
     assert infected_neighbor_count == 0
@@ -0,0 +1,130 @@
+""" This module contains the unit tests for the EventLog class and the
+    events emitted by the SimulationEngine class.
+"""
+import builtins
+import io
+import json
+import pytest
+import threading
+from infection.engine.events import DEBUG, INFO, EventLog
+from infection.engine.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine_instance(tmp_path) -> SimulationEngine:
+    """ This is a pytest.fixture method to provide an engine that writes its
+        "debug" events to a JSON-lines file, with one healthy individual
+        next to an infected one.
+
+    Args:
+        tmp_path (pathlib.Path): A temporary directory given by pytest.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              infection_probability=1.0, seed=4,
+                              events=EventLog(tmp_path / "events.jsonl",
+                                              "debug"))
+    engine.add_healthy(1)
+    engine.population[0].pos = (100, 100)
+    engine.add_infected(1)
+    engine.population[1].pos = (100, 100 + engine.individual_size)
+    yield engine
+    engine.close()
+
+
+def test_engine_events(engine_instance: SimulationEngine, tmp_path) -> None:
+    """ This method will test if the spawns and the transitions of a tick
+        are written as JSON lines once the engine is closed.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+        tmp_path (pathlib.Path): A temporary directory given by pytest.
+    """
+    engine = engine_instance
+    engine.tick()
+    engine.close()
+    lines = (tmp_path / "events.jsonl").read_text().splitlines()
+    events = [json.loads(line) for line in lines]
+
+    assert [event["event"] for event in events] == [
+        "spawn", "spawn", "transitions", "infected"]
+    assert events[0]["status"] == "healthy"
+    assert events[2] == {"time": events[2]["time"], "level": "info",
+                         "event": "transitions", "tick": 0,
+                         "infected": 1, "recovered": 0}
+    assert events[3]["index"] == 0
+    assert events[3]["level"] == "debug"
+
+
+def test_event_level() -> None:
+    """ This method will test if the events below the level, or without a
+        sink, are dropped without starting the writer thread, and if
+        flush() waits for the written ones.
+    """
+    sink = io.StringIO()
+    events = EventLog(sink, "info")
+    events.emit(DEBUG, "infected", index=1)
+
+    assert not events.running
+    events.emit(INFO, "reset")
+    events.flush()
+    assert json.loads(sink.getvalue())["event"] == "reset"
+    events.close()
+    assert not events.running
+    silent = EventLog()
+    silent.emit(INFO, "reset")
+    assert not silent.running
+    with pytest.raises(ValueError):
+        EventLog(sink, "verbose")
+
+
+def test_sink_opened_by_writer(tmp_path, monkeypatch) -> None:
+    """ This method will test if the file of the sink is opened by the
+        writer thread, not by the thread that emits the first event.
+
+    Args:
+        tmp_path (pathlib.Path): A temporary directory given by pytest.
+        monkeypatch (pytest.MonkeyPatch): The pytest fixture to patch open.
+    """
+    threads = []
+
+    def recording_open(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr("infection.engine.events.open", recording_open,
+                        raising=False)
+    events = EventLog(tmp_path / "events.jsonl")
+    events.emit(INFO, "reset")
+    events.close()
+
+    assert threads == ["EventLog"]
+    assert "reset" in (tmp_path / "events.jsonl").read_text()
+
+
+def test_unopenable_sink(tmp_path) -> None:
+    """ This method will test if a sink that can't be opened stops the
+        writer thread with its error, and if emit(), flush() and close()
+        raise that error instead of queueing events or waiting forever.
+
+    Args:
+        tmp_path (pathlib.Path): A temporary directory given by pytest.
+    """
+    events = EventLog(tmp_path / "missing" / "events.jsonl")
+    events.emit(INFO, "reset")
+    with pytest.raises(FileNotFoundError):
+        events.flush()
+    assert isinstance(events.error, FileNotFoundError)
+    with pytest.raises(FileNotFoundError):
+        events.emit(INFO, "reset")
+    with pytest.raises(FileNotFoundError):
+        events.close()
+    assert not events.running
+
+    engine = SimulationEngine(events=EventLog(tmp_path / "missing" / "x"))
+    engine.reset()
+    with pytest.raises(FileNotFoundError):
+        engine.close()
@@ -0,0 +1,84 @@
+""" This module contains the unit tests for the infected_neighbor_counts
+    method from the SimulationEngine class.
+"""
+import pytest
+from infection.engine.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21)
+    return engine
+
+
+def test_infected_neighbor_counts(engine_instance: SimulationEngine) -> None:
+    """ This method will test if infected_neighbor_counts() returns the
+        number of infected neighbors of every healthy individual at once,
+        and 0 for the infected ones.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.add_healthy(3)
+    engine.add_infected(2)
+    engine.population[0].pos = (100, 100)
+    engine.population[1].pos = (300, 300)
+    engine.population[2].pos = (500, 500)
+    engine.population[3].pos = (100, 110)
+    engine.population[4].pos = (110, 100)
+    engine.build_index()
+    counts = engine.infected_neighbor_counts(engine.spatial_index)
+
+    assert counts.tolist() == [2, 0, 0, 0, 0]
+
+
+def test_infected_neighbor_counts_quadtree(
+        engine_instance: SimulationEngine) -> None:
+    """ This method will test if infected_neighbor_counts() gives the same
+        result with the quadtree backend.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.index_backend = "quadtree"
+    engine.add_healthy(2)
+    engine.add_infected(1)
+    engine.population[0].pos = (100, 100)
+    engine.population[1].pos = (100, 130)
+    engine.population[2].pos = (100, 120)
+    engine.build_index()
+    counts = engine.infected_neighbor_counts(engine.spatial_index)
+
+    assert counts.tolist() == [1, 1, 0]
+
+
+def test_infected_neighbor_counts_directions(
+        engine_instance: SimulationEngine) -> None:
+    """ This method will test if querying from the susceptible side and from
+        the infected side gives the same counts.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.add_healthy(300)
+    engine.add_infected(100)
+    engine.build_index()
+    from_susceptible = engine.infected_neighbor_counts(
+        engine.spatial_index, direction="susceptible")
+    from_infected = engine.infected_neighbor_counts(
+        engine.spatial_index, direction="infected")
+
+    assert len(engine.spatial_index) == 100
+    assert from_susceptible.tolist() == from_infected.tolist()
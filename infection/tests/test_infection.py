@@ -1,7 +1,8 @@
 """ This module contains the unit tests for the infection method from
-    the Individual class.
+    the SimulationEngine class.
 """
 import pytest
+from infection.engine.simulation_engine import MAX_TIME_INFECTED
 from infection.simulation import Simulation
 
 
@@ -32,14 +33,13 @@ def test_infection_sick(simulation_instance: Simulation) -> None:
     simulation.population[0].pos = (0, 0)
     simulation.add_infected(1)
     simulation.population[1].pos = (0, simulation.individual_size)
-    for circle in simulation.population:
-        simulation.quadtree.insert(circle.pos, data=circle.individual.status)
-    simulation.population[0].individual.infection(
-        simulation.population[0],
-        simulation.quadtree)
+    simulation.engine.build_index()
+    simulation.engine.infection(simulation.spatial_index)
 
-    assert simulation.population[0].individual.status == "infected"
-    assert simulation.population[0].color == simulation.infected_color
+    simulation.render()
+
+    assert simulation.population[0].status == "infected"
+    assert simulation.renderer.color(0) == simulation.infected_color
 
 
 def test_infection_recover(simulation_instance: Simulation) -> None:
@@ -52,13 +52,12 @@ def test_infection_recover(simulation_instance: Simulation) -> None:
     """
     simulation = simulation_instance
     simulation.add_infected(1)
-    infected = simulation.population[0].individual
-    infected.time_infected = infected.max_time_infected - 1
-    for circle in simulation.population:
-        simulation.quadtree.insert(circle.pos, data=circle.individual.status)
-    simulation.population[0].individual.infection(
-        simulation.population[0],
-        simulation.quadtree)
+    simulation.population[0].time_infected = MAX_TIME_INFECTED - 1
+    simulation.engine.build_index()
+    simulation.engine.infection(simulation.spatial_index)
+
+    simulation.render()
 
-    assert simulation.population[0].individual.status == "healthy"
-    assert simulation.population[0].color == simulation.recovered_color
+    assert simulation.population[0].status == "healthy"
+    assert simulation.population[0].recovered
+    assert simulation.renderer.color(0) == simulation.recovered_color
@@ -0,0 +1,72 @@
+""" This module contains the unit tests for the infection_step function from
+    the epidemic module.
+"""
+import pytest
+import numpy as np
+from infection.engine.epidemic import infection_step
+from infection.engine.population import Population, STATUS_INFECTED
+from infection.engine.random_streams import RandomStreams
+from infection.engine.spatial_index import create_index
+
+
+@pytest.fixture
+def population() -> Population:
+    """ This is a pytest.fixture method to provide a crowded population with
+        some infected individuals.
+
+    Returns:
+        population (Population): A population of 400 individuals in a 100
+            by 100 area, a quarter of them infected.
+    """
+    generator = np.random.default_rng(3)
+    population = Population()
+    population.add(generator.uniform(0, 100, 400),
+                   generator.uniform(0, 100, 400), 1, 0, 0.5,
+                   (np.arange(400) % 4 == 0) * STATUS_INFECTED, 0.5)
+    return population
+
+
+def step(population: Population, chunks: list[np.ndarray]) -> dict:
+    """ Function that steps the chunks of a population in the given order,
+        with the random numbers of the same seeded streams.
+
+    Args:
+        population (Population): The population to step.
+        chunks (list[np.ndarray]): The indices of the individuals in each
+            chunk.
+
+    Returns:
+        following (dict): A copy of the next frame of the population.
+    """
+    infected = np.flatnonzero(population.status == STATUS_INFECTED)
+    spatial_index = create_index("grid", 5).build(
+        population.x[infected], population.y[infected], infected)
+    streams = RandomStreams(5)
+    for chunk in chunks:
+        infection_step(population.columns, population.next_columns, chunk,
+                       spatial_index, 5, "grid",
+                       streams.tick_uniforms(0, chunk, len(population)))
+    return {name: column.copy()
+            for name, column in population.next_columns.items()}
+
+
+def test_infection_step_order(population: Population) -> None:
+    """ This method will test if stepping the chunks of a population in any
+        order writes the same next frame as stepping it whole, and leaves the
+        current frame as it was.
+
+    Args:
+        population (Population): The population to step.
+    """
+    current = {name: column.copy()
+               for name, column in population.columns.items()}
+    chunks = np.array_split(np.arange(len(population)), 4)
+    forward = step(population, chunks)
+    backward = step(population, chunks[::-1])
+    whole = step(population, [np.arange(len(population))])
+
+    for name in current:
+        assert np.array_equal(population.columns[name], current[name])
+        assert np.array_equal(forward[name], backward[name])
+        assert np.array_equal(forward[name], whole[name])
+    assert np.count_nonzero(forward["status"] == STATUS_INFECTED) > 100
@@ -0,0 +1,54 @@
+""" This module contains the unit tests for the instrumented decorator.
+"""
+import pytest
+from infection.decorators import instrumentation
+from infection.decorators.instrumentation import instrumented
+
+
+@pytest.fixture
+def timers() -> None:
+    """ This is a pytest.fixture method that resets the timers of every
+        phase before and after the test.
+    """
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+
+
+def test_instrumented_off(timers: None) -> None:
+    """ This method will test if the decorated function is returned without
+        decoration when the timers are off, so its calls are not counted.
+
+    Args:
+        timers (None): Resets the timers around the test.
+    """
+    def move() -> int:
+        return 1
+
+    assert instrumented("movement", enabled=False)(move) is move
+    move()
+    assert instrumentation.stats()["movement"]["calls"] == 0
+
+
+def test_instrumented_on(timers: None) -> None:
+    """ This method will test if every call of a timed function adds to the
+        calls and seconds of its phase, even when it raises.
+
+    Args:
+        timers (None): Resets the timers around the test.
+    """
+    @instrumented("query", enabled=True)
+    def query(fail: bool) -> int:
+        if fail:
+            raise RuntimeError("query failed")
+        return 2
+
+    assert query(False) == 2
+    with pytest.raises(RuntimeError):
+        query(True)
+    stats = instrumentation.stats()
+    assert stats["query"]["calls"] == 2
+    assert stats["query"]["seconds"] > 0
+    assert stats["index"] == {"calls": 0, "seconds": 0.0}
+    with pytest.raises(ValueError):
+        instrumented("unknown")
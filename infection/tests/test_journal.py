@@ -0,0 +1,138 @@
+""" This module contains the unit tests for the Journal class and the replay
+    function, and for the journaling of the actions of the Simulation class.
+"""
+import numpy as np
+import pytest
+from infection.engine.journal import Journal, main, replay
+from infection.simulation import Simulation
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide a built simulation with a
+        seed.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation(seed=17)
+    simulation.build()
+    return simulation
+
+
+def run_session(simulation: Simulation) -> None:
+    """ This method will take a few actions through the simulation's widgets
+        with ticks in between, like a user would.
+
+    Args:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation.menu_right.btn_add_healthy.dispatch("on_press")
+    simulation.add_healthy(60)
+    simulation.add_infected(3)
+    for _ in range(7):
+        simulation.stepper.step()
+    simulation.menu_bottom.sldr_infection_probability.value = 9
+    simulation.menu_right.btn_add_infected.dispatch("on_press")
+    simulation.add_healthy(40)
+    for _ in range(12):
+        simulation.stepper.step()
+    simulation.menu_right.btn_reset.dispatch("on_press")
+    simulation.add_healthy(30)
+    simulation.add_infected(2)
+    for _ in range(9):
+        simulation.stepper.step()
+    simulation.journal.ticks = simulation.engine.ticks
+
+
+def test_journal_records_actions(simulation_instance: Simulation) -> None:
+    """ This method will test if the buttons, the slider and the add methods
+        journal their actions with the tick they were taken at.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    run_session(simulation)
+    actions = [entry for entry in simulation.journal.actions
+               if entry[1] != "bounds"]
+    assert actions == [(0, "add_healthy", 1), (0, "add_healthy", 60),
+                       (0, "add_infected", 3),
+                       (7, "infection_probability", .9),
+                       (7, "add_infected", 1), (7, "add_healthy", 40),
+                       (19, "reset", 17), (0, "add_healthy", 30),
+                       (0, "add_infected", 2)]
+    assert simulation.journal.ticks == 9
+    assert simulation.journal.settings["seed"] == 17
+
+
+def test_replay(simulation_instance: Simulation, tmp_path) -> None:
+    """ This method will test if replaying a saved journal headless gives
+        the same population, counters and time series as the session.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+        tmp_path (Path): A temporary directory.
+    """
+    simulation = simulation_instance
+    run_session(simulation)
+    path = tmp_path / "journal.json"
+    simulation.journal.save(path)
+    engine = replay(Journal.load(path))
+    assert engine.ticks == simulation.engine.ticks
+    assert (engine.healthy, engine.infected, engine.recovered) == (
+        simulation.engine.healthy, simulation.engine.infected,
+        simulation.engine.recovered)
+    for name, column in simulation.population.columns.items():
+        np.testing.assert_array_equal(engine.population.columns[name],
+                                      column)
+    np.testing.assert_array_equal(engine.series.data,
+                                  simulation.engine.series.data)
+    longer = replay(Journal.load(path), ticks=20)
+    assert longer.ticks == 20
+
+
+def test_replay_without_seed(tmp_path) -> None:
+    """ This method will test if a session of a simulation created without a
+        seed, where every reset draws a fresh seed, replays the same
+        population.
+
+    Args:
+        tmp_path (Path): A temporary directory.
+    """
+    simulation = Simulation()
+    simulation.build()
+    run_session(simulation)
+    path = tmp_path / "journal.json"
+    simulation.journal.save(path)
+    engine = replay(Journal.load(path))
+    assert engine.seed == simulation.engine.seed
+    for name, column in simulation.population.columns.items():
+        np.testing.assert_array_equal(engine.population.columns[name],
+                                      column)
+
+
+def test_replay_main(simulation_instance: Simulation, tmp_path) -> None:
+    """ This method will test if the command line replays a journal and
+        saves the time series.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+        tmp_path (Path): A temporary directory.
+    """
+    simulation = simulation_instance
+    run_session(simulation)
+    path = tmp_path / "journal.json"
+    simulation.journal.save(path)
+    assert main([str(path), "--series", str(tmp_path / "series.csv")]) == 0
+    assert (tmp_path / "series.csv").exists()
+
+
+def test_journal_unknown_action() -> None:
+    """ This method will test if an unknown action is rejected.
+    """
+    journal = Journal({"width": 800, "height": 600, "individual_size": 21,
+                       "infection_probability": .2, "index_backend": "grid",
+                       "seed": 1})
+    with pytest.raises(ValueError):
+        journal.record(0, "teleport")
@@ -0,0 +1,65 @@
+""" This module contains the unit tests for the spawn layouts and the
+    spawn_positions function.
+"""
+import pytest
+import numpy as np
+from infection.engine.layouts import LAYOUTS, spawn_positions
+from infection.engine.simulation_engine import SimulationEngine
+
+AREA = (10, 20, 210, 120)
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_spawn_positions_inside(layout: str) -> None:
+    """ This method will test if every layout draws the requested number of
+        positions, all inside the area.
+
+    Args:
+        layout (str): The name of the spawn layout.
+    """
+    options = {"radius": 1} if layout == "poisson_disk" else {}
+    x, y = spawn_positions(layout, np.random.default_rng(1), 2000, AREA,
+                           **options)
+
+    assert len(x) == len(y) == 2000
+    assert np.all((x >= 10) & (x <= 210) & (y >= 20) & (y <= 120))
+
+
+def test_poisson_disk_distance() -> None:
+    """ This method will test if the poisson_disk layout keeps every pair of
+        positions at least one radius apart, and rejects more positions than
+        the area can fit.
+    """
+    random = np.random.default_rng(2)
+    x, y = spawn_positions("poisson_disk", random, 800, AREA, radius=3)
+    distance = np.hypot(x[:, None] - x, y[:, None] - y)
+    np.fill_diagonal(distance, np.inf)
+
+    assert distance.min() > 3
+    with pytest.raises(ValueError):
+        spawn_positions("poisson_disk", random, 10000, AREA, radius=3)
+
+
+def test_spawn_positions_unknown_layout() -> None:
+    """ This method will test if spawn_positions() rejects an unknown layout.
+    """
+    with pytest.raises(ValueError):
+        spawn_positions("hexagonal", np.random.default_rng(), 10, AREA)
+
+
+def test_add_healthy_layout() -> None:
+    """ This method will test if add_healthy() spawns many individuals with a
+        layout in one call, without overlaps for "poisson_disk".
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=5,
+                              seed=4)
+    engine.add_healthy(3000, layout="clustered", clusters=3)
+    engine.add_infected(1000, layout="poisson_disk")
+    x, y = engine.population.x[3000:], engine.population.y[3000:]
+    distance = np.hypot(x[:, None] - x, y[:, None] - y)
+    np.fill_diagonal(distance, np.inf)
+
+    assert len(engine.population) == 4000
+    assert engine.healthy == 3000
+    assert engine.infected == 1000
+    assert distance.min() > 5
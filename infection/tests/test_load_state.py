@@ -0,0 +1,107 @@
+""" This module contains the unit tests for the save_state and load_state
+    methods from the SimulationEngine class.
+"""
+import numpy as np
+import pytest
+from infection.engine.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide an engine with a crowded
+        population that has been running for a few ticks.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=200, height=200, individual_size=7,
+                              infection_probability=.5, seed=11)
+    engine.add_healthy(300)
+    engine.add_infected(5)
+    for _ in range(10):
+        engine.tick()
+    return engine
+
+
+def assert_same_state(engine: SimulationEngine,
+                      other: SimulationEngine) -> None:
+    """ This method will assert that two engines have the same state.
+
+    Args:
+        engine (SimulationEngine): An instance of the simulation engine class.
+        other (SimulationEngine): Another instance of the simulation engine
+            class.
+    """
+    for name, column in engine.population.columns.items():
+        np.testing.assert_array_equal(column,
+                                      other.population.columns[name])
+    assert (engine.healthy, engine.infected, engine.recovered,
+            engine.ticks) == (other.healthy, other.infected,
+                              other.recovered, other.ticks)
+    np.testing.assert_array_equal(engine.series.data, other.series.data)
+    np.testing.assert_array_equal(engine.transmissions.infections,
+                                  other.transmissions.infections)
+    np.testing.assert_array_equal(engine.transmissions.recoveries,
+                                  other.transmissions.recoveries)
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_load_state_resumes(engine_instance: SimulationEngine, tmp_path,
+                            compress: bool) -> None:
+    """ This method will test if an engine restored from a snapshot goes on
+        exactly like the engine that was saved, spawning and ticking.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+        tmp_path (Path): A temporary directory.
+        compress (bool): True to compress the snapshot.
+    """
+    path = tmp_path / "state.npz"
+    engine_instance.save_state(path, compress)
+    resumed = SimulationEngine(width=10, height=10)
+    assert resumed.load_state(path) == 10
+    assert_same_state(engine_instance, resumed)
+    assert resumed.seed == engine_instance.seed
+    assert resumed.bounds == engine_instance.bounds
+    for engine in (engine_instance, resumed):
+        engine.add_healthy(20)
+        for _ in range(15):
+            engine.tick()
+    assert_same_state(engine_instance, resumed)
+
+
+def test_load_state_in_workers(engine_instance: SimulationEngine,
+                               tmp_path) -> None:
+    """ This method will test if a snapshot saved by a serial engine resumes
+        the same run in an engine with worker processes.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+        tmp_path (Path): A temporary directory.
+    """
+    path = tmp_path / "state.npz"
+    engine_instance.save_state(path)
+    resumed = SimulationEngine(workers=2)
+    try:
+        resumed.load_state(path)
+        for engine in (engine_instance, resumed):
+            for _ in range(5):
+                engine.tick()
+        assert_same_state(engine_instance, resumed)
+    finally:
+        resumed.close()
+
+
+def test_load_state_unknown_version(tmp_path) -> None:
+    """ This method will test if a snapshot with an unknown version is
+        rejected.
+
+    Args:
+        tmp_path (Path): A temporary directory.
+    """
+    path = tmp_path / "state.npz"
+    np.savez(path, version=0)
+    with pytest.raises(ValueError):
+        SimulationEngine().load_state(path)
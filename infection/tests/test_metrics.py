@@ -0,0 +1,71 @@
+""" This module contains the unit tests for the Metrics class and the
+    MetricsServer class.
+"""
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import pytest
+from infection.engine.metrics import BUCKETS, Metrics
+from infection.engine.metrics_server import MetricsServer
+from infection.engine.simulation_engine import SimulationEngine
+
+
+def test_metrics_snapshot() -> None:
+    """ This method will test if the snapshot summarizes the recorded tick
+        durations and counts the dropped frames.
+    """
+    metrics = Metrics(window=100, frame_budget=.01)
+    for tick in range(1, 101):
+        metrics.ticks.observe(tick / 1000, stamp=tick / 50)
+    metrics.record_frame(.01)
+    metrics.record_frame(.031)
+    snapshot = metrics.snapshot()
+
+    assert snapshot["ticks_per_second"] == pytest.approx(50)
+    assert snapshot["tick_p50"] == pytest.approx(.0505)
+    assert snapshot["tick_p99"] == pytest.approx(.09901)
+    assert snapshot["frame_time"] == pytest.approx(.0205)
+    assert snapshot["dropped_frames"] == 2
+    assert metrics.ticks.buckets[-1] == 100
+    assert metrics.ticks.buckets[BUCKETS.index(.01)] == 10
+
+
+@pytest.fixture
+def server_instance() -> MetricsServer:
+    """ This is a pytest.fixture method to provide a running metrics server
+        of an engine that ticked a few times, on a free port.
+
+    Returns:
+        server (MetricsServer): An instance of the metrics server class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              seed=2)
+    engine.add_healthy(30)
+    engine.add_infected(3)
+    for _ in range(5):
+        engine.tick()
+    server = MetricsServer(engine, port=0).start()
+    yield server
+    server.close()
+
+
+def test_metrics_server(server_instance: MetricsServer) -> None:
+    """ This method will test if the server answers /metrics with the tick
+        histogram and the agent count in the Prometheus text format, and
+        any other path with a 404.
+
+    Args:
+        server_instance (MetricsServer): An instance of the metrics server
+            class.
+    """
+    with urlopen(server_instance.url) as response:
+        content_type = response.headers["Content-Type"]
+        lines = response.read().decode().splitlines()
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE infection_tick_duration_seconds histogram" in lines
+    assert 'infection_tick_duration_seconds_bucket{le="+Inf"} 5' in lines
+    assert "infection_tick_duration_seconds_count 5" in lines
+    assert "infection_agents 33" in lines
+    assert "infection_ticks 5" in lines
+    with pytest.raises(HTTPError):
+        urlopen(server_instance.url.replace("/metrics", "/other"))
@@ -1,5 +1,5 @@
 """ This module contains the unit tests for the move method from
-    the CircularButton class.
+    the SimulationEngine class.
 """
 import pytest
 from infection.simulation import Simulation
@@ -27,7 +27,28 @@ def test_move(simulation_instance: Simulation) -> None:
     """
     simulation_instance.add_healthy(1)
     original_pos = str(simulation_instance.population[0].pos)
-    simulation_instance.population[0].move(simulation_instance)
+    simulation_instance.engine.move()
     new_pos = str(simulation_instance.population[0].pos)
 
     assert original_pos != new_pos
+
+
+def test_move_bounce(simulation_instance: Simulation) -> None:
+    """ This method will test if move() inverts the direction of the
+        individuals that crossed an edge of the arena moving outwards, and
+        leaves the ones moving back in untouched.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    engine = simulation_instance.engine
+    x_min, y_min, x_max, y_max = engine.bounds
+    engine.add_healthy(2)
+    engine.population[0].pos = (x_max, y_min + 100)
+    engine.population[0].direction = (4, 0)
+    engine.population[1].pos = (x_min - 10, y_min + 100)
+    engine.population[1].direction = (4, 0)
+    engine.move()
+
+    assert engine.population[0].direction == (-4, 0)
+    assert engine.population[1].direction == (4, 0)
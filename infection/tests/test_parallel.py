@@ -0,0 +1,91 @@
+""" This module contains the unit tests for the SharedPopulation and
+    ProcessPool classes, through a SimulationEngine with worker processes.
+"""
+import pytest
+import numpy as np
+from infection.engine.population import STATUS_INFECTED
+from infection.engine.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide an engine that steps its
+        population with two worker processes, and close it after the test.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              workers=2)
+    yield engine
+    engine.close()
+
+
+def test_parallel_tick_position(engine_instance: SimulationEngine) -> None:
+    """ This method will test if the workers move every individual, after
+        the population grew past its first shared memory blocks.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine_instance.add_healthy(1500)
+    population = engine_instance.population
+    original_x, original_y = population.x.copy(), population.y.copy()
+    engine_instance.tick()
+
+    assert np.all((population.x != original_x) |
+                  (population.y != original_y))
+    assert engine_instance.ticks == 1
+
+
+def test_parallel_tick_infection(engine_instance: SimulationEngine) -> None:
+    """ This method will test if the workers infect the healthy individuals
+        next to an infected one on both sides of the border between their
+        strips, and if the merged counters match the population.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.infection_probability = 1.0
+    engine.add_healthy(2)
+    engine.population[0].pos = (390, 300)
+    engine.population[1].pos = (410, 300)
+    engine.add_infected(1)
+    engine.population[2].pos = (400, 300)
+    engine.add_healthy(10)
+    engine.population.x[3:] = np.linspace(10, 50, 10)
+    engine.population.x[3:8] = np.linspace(750, 790, 5)
+    engine.tick()
+    infected = np.count_nonzero(engine.population.status == STATUS_INFECTED)
+
+    assert engine.population[0].status == "infected"
+    assert engine.population[1].status == "infected"
+    assert engine.infected == infected == 3
+    assert engine.healthy == len(engine.population) - infected
+
+
+def test_parallel_tick_matches_serial(
+        engine_instance: SimulationEngine) -> None:
+    """ This method will test if the workers give bit-identical results to
+        an engine with the same seed that steps the population in this
+        process.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    serial = SimulationEngine(width=800, height=600, individual_size=21,
+                              seed=engine_instance.seed)
+    for engine in (serial, engine_instance):
+        engine.infection_probability = 0.5
+        engine.add_healthy(5000)
+        engine.add_infected(50)
+        for _ in range(20):
+            engine.tick()
+
+    assert serial.infected == engine_instance.infected > 50
+    for name, column in serial.population.columns.items():
+        assert np.array_equal(column, engine_instance.population.columns[name])
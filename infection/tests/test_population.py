@@ -0,0 +1,89 @@
+""" This module contains the unit tests for the Population class.
+"""
+import pytest
+import numpy as np
+from infection.engine.population import Population, STATUS_INFECTED
+
+
+@pytest.fixture
+def population_instance() -> Population:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the methods we are testing.
+
+    Returns:
+        population (Population): An instance of the population class with
+            a small initial capacity.
+    """
+    population = Population(capacity=2)
+    return population
+
+
+def test_population_add_grows(population_instance: Population) -> None:
+    """ This method will test if add() appends every new individual to the
+        columns, growing them past their initial capacity.
+
+    Args:
+        population_instance (Population): An instance of the population
+            class.
+    """
+    population_instance.add(np.arange(3), 1, 0, 0, 0.5, STATUS_INFECTED)
+    population_instance.add(np.arange(3, 5), 1, 0, 0, 0.5, STATUS_INFECTED)
+
+    assert len(population_instance) == 5
+    assert population_instance.capacity >= 5
+    assert population_instance.x.tolist() == [0, 1, 2, 3, 4]
+    assert (population_instance.status == STATUS_INFECTED).all()
+
+
+def test_population_view_writes_columns(
+        population_instance: Population) -> None:
+    """ This method will test if setting the properties of an AgentView
+        updates the population's columns.
+
+    Args:
+        population_instance (Population): An instance of the population
+            class.
+    """
+    population_instance.add(0, 0, 1, 0, 0.5, STATUS_INFECTED)
+    agent = population_instance[0]
+    agent.pos = (3, 4)
+    agent.status = "healthy"
+    agent.recovered = True
+
+    assert population_instance.x[0] == 3
+    assert population_instance.y[0] == 4
+    assert population_instance.status[0] == 0
+    assert population_instance.recovered[0]
+
+
+def test_population_clear(population_instance: Population) -> None:
+    """ This method will test if clear() removes every individual from the
+        population.
+
+    Args:
+        population_instance (Population): An instance of the population
+            class.
+    """
+    population_instance.add(np.arange(3), 1, 0, 0, 0.5, STATUS_INFECTED)
+    population_instance.clear()
+
+    assert len(population_instance) == 0
+    with pytest.raises(IndexError):
+        population_instance[0]
+
+
+def test_population_swap(population_instance: Population) -> None:
+    """ This method will test if swap() makes the values written to the next
+        frame the current ones.
+
+    Args:
+        population_instance (Population): An instance of the population
+            class.
+    """
+    population_instance.add(np.arange(3), 1, 0, 0, 0.5, STATUS_INFECTED)
+    population_instance.next_columns["x"][:] = [7, 8, 9]
+    population_instance.swap()
+
+    assert population_instance.frame == 1
+    assert population_instance.x.tolist() == [7, 8, 9]
+    assert population_instance.next_columns["x"].tolist() == [0, 1, 2]
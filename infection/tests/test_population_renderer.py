@@ -0,0 +1,59 @@
+""" This module contains the unit tests for the refresh method from the
+    PopulationRenderer class.
+"""
+import pytest
+from infection.simulation import Simulation
+from infection.util.population_renderer import MESH_CAPACITY
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation()
+    simulation.build()
+    return simulation
+
+
+def test_refresh_meshes(simulation_instance: Simulation) -> None:
+    """ This method will test if refresh() splits every infection state into
+        Meshes of up to MESH_CAPACITY individuals, with one quad each.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    simulation.engine.add_healthy(MESH_CAPACITY + 10)
+    simulation.engine.add_infected(3)
+    simulation.population.recovered[:2] = True
+    simulation.render()
+    meshes = simulation.renderer.meshes
+    quads = {state: [len(mesh.indices) // 6 for mesh in meshes[state]]
+             for state in meshes}
+
+    assert quads["healthy"] == [MESH_CAPACITY, 8]
+    assert quads["infected"] == [3]
+    assert quads["recovered"] == [2]
+    assert list(meshes["infected"][0].vertices[:2]) == pytest.approx(
+        simulation.population[-3].pos)
+
+
+def test_refresh_palette(simulation_instance: Simulation) -> None:
+    """ This method will test if refresh() draws every individual with the
+        current color of its infection state.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    simulation.add_healthy(1)
+    simulation.add_infected(1)
+    simulation.infected_color = [.5, .5, .5, 1.0]
+    simulation.render()
+
+    assert simulation.renderer.color(0) == simulation.healthy_color
+    assert simulation.renderer.color(1) == [.5, .5, .5, 1.0]
@@ -0,0 +1,35 @@
+""" This module contains the unit tests for the quadtree alias properties
+    of the SimulationEngine and Simulation classes.
+"""
+import pytest
+from infection.simulation import Simulation
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the property we are testing.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation(seed=5)
+    simulation.engine.add_infected(3)
+    return simulation
+
+
+def test_quadtree(simulation_instance: Simulation) -> None:
+    """ This method will test if the quadtree properties return the spatial
+        index of the engine, with either backend.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    engine = simulation.engine
+    engine.build_index()
+    assert simulation.quadtree is engine.spatial_index
+    assert engine.quadtree is engine.spatial_index
+    engine.index_backend = "quadtree"
+    assert simulation.quadtree is engine.spatial_index
+    assert len(simulation.quadtree) == 3
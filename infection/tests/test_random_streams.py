@@ -0,0 +1,36 @@
+""" This module contains the unit tests for the RandomStreams class.
+"""
+import numpy as np
+from infection.engine.random_streams import RANDOM_BLOCK, RandomStreams
+
+
+def test_random_streams_seed() -> None:
+    """ This method will test if two streams with the same seed give the
+        same numbers, and if a stream without a seed exposes the seed that
+        reproduces it.
+    """
+    streams = RandomStreams()
+    again = RandomStreams(streams.seed)
+
+    assert np.array_equal(streams.generator.random(10),
+                          again.generator.random(10))
+    assert not np.array_equal(RandomStreams(1).tick_uniforms(0, [0], 1),
+                              RandomStreams(2).tick_uniforms(0, [0], 1))
+
+
+def test_tick_uniforms_chunks() -> None:
+    """ This method will test if the uniforms of a tick are the same when
+        they are asked for in chunks that cross the blocks, and different
+        from one tick to the next.
+    """
+    streams = RandomStreams(3)
+    size = 3 * RANDOM_BLOCK + 10
+    owned = np.arange(size)
+    whole = streams.tick_uniforms(0, owned, size)
+    chunks = [streams.tick_uniforms(0, chunk, size)
+              for chunk in (owned[::2], owned[1::2])]
+
+    assert whole.shape == (3, size)
+    assert np.array_equal(whole[:, ::2], chunks[0])
+    assert np.array_equal(whole[:, 1::2], chunks[1])
+    assert not np.array_equal(whole, streams.tick_uniforms(1, owned, size))
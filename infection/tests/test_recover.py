@@ -1,5 +1,5 @@
 """ This module contains the unit tests for the recover method from
-    the Individual class.
+    the SimulationEngine class.
 """
 import pytest
 from infection.simulation import Simulation
@@ -19,7 +19,7 @@ def simulation_instance() -> Simulation:
 
 
 def test_recover(simulation_instance: Simulation) -> None:
-    """ This method will test if recover() sets an InfectedIndividual's
+    """ This method will test if recover() sets an infected individual's
         properties correctly to make it healthy.
 
     Args:
@@ -27,7 +27,9 @@ def test_recover(simulation_instance: Simulation) -> None:
     """
     simulation = simulation_instance
     simulation.add_infected(1)
-    simulation.population[0].individual.recover(
-        simulation.population[0])
-    assert simulation.population[0].individual.status == "healthy"
-    assert simulation.population[0].color == simulation.recovered_color
+    simulation.engine.recover(0)
+    simulation.render()
+
+    assert simulation.population[0].status == "healthy"
+    assert simulation.population[0].recovered
+    assert simulation.renderer.color(0) == simulation.recovered_color
@@ -0,0 +1,66 @@
+""" This module contains the unit tests for the reduce_counters method from
+    the SimulationEngine class.
+"""
+import pytest
+from infection.engine.simulation_engine import (
+    MAX_TIME_INFECTED, SimulationEngine
+)
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21)
+    return engine
+
+
+def test_reduce_counters(engine_instance: SimulationEngine) -> None:
+    """ This method will test if the accumulated transitions only change the
+        counters when reduce_counters() is called, all at once.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.add_healthy(5)
+    engine.add_infected(2)
+    engine.count_transitions(3, 0)
+    engine.count_transitions(1, 2)
+
+    assert engine.healthy == 5
+    assert engine.infected == 2
+    assert engine.reduce_counters() == (4, 2)
+    assert engine.healthy == 3
+    assert engine.infected == 4
+    assert engine.reduce_counters() == (0, 0)
+    assert engine.infected == 4
+
+
+def test_reduce_counters_tick(engine_instance: SimulationEngine) -> None:
+    """ This method will test if tick() reduces the transitions of the tick
+        into the counters and keeps them in new_infections and
+        new_recoveries.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.infection_probability = 1.0
+    engine.add_healthy(1)
+    engine.population[0].pos = (100, 100)
+    engine.add_infected(2)
+    engine.population[1].pos = (100, 100 + engine.individual_size)
+    engine.population[2].time_infected = MAX_TIME_INFECTED - 1
+    engine.tick()
+
+    assert engine.new_infections == 1
+    assert engine.new_recoveries == 1
+    assert engine.healthy == 1
+    assert engine.infected == 2
@@ -0,0 +1,43 @@
+""" This module contains the unit tests for the refresh method from the
+    MenuBottom class.
+"""
+import pytest
+from infection.simulation import Simulation
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation()
+    simulation.build()
+    return simulation
+
+
+def test_refresh_labels(simulation_instance: Simulation) -> None:
+    """ This method will test if adding individuals refreshes the Labels
+        right away, and if render() only refreshes them again after
+        1 / LABEL_REFRESH_RATE seconds.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    menu_bottom = simulation.menu_bottom
+    simulation.add_healthy(3)
+    simulation.add_infected(1)
+
+    assert menu_bottom.lbl_value_population.text == "4"
+    assert menu_bottom.lbl_value_healthy.text == "3"
+    assert menu_bottom.lbl_value_infected.text == "1"
+    simulation.engine.add_healthy(1)
+    simulation.render()
+    assert menu_bottom.lbl_value_population.text == "4"
+    menu_bottom.refresh(len(simulation.population), simulation.healthy,
+                        simulation.infected)
+    assert menu_bottom.lbl_value_population.text == "5"
+    assert menu_bottom.lbl_value_healthy.text == "4"
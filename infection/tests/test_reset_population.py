@@ -29,4 +29,4 @@ def test_reset_population(simulation_instance: Simulation) -> None:
     simulation_instance.add_infected(1)
     simulation_instance.reset_population()
 
-    assert simulation_instance.population == []
+    assert len(simulation_instance.population) == 0
@@ -1,5 +1,5 @@
 """ This module contains the unit tests for the sick method from
-    the Individual class.
+    the SimulationEngine class.
 """
 import pytest
 from infection.simulation import Simulation
@@ -19,7 +19,7 @@ def simulation_instance() -> Simulation:
 
 
 def test_sick(simulation_instance: Simulation) -> None:
-    """ This method will test if sick() sets a HealthyIndividual's properties
+    """ This method will test if sick() sets a healthy individual's properties
         correctly to make it infected.
 
     Args:
@@ -27,7 +27,8 @@ def test_sick(simulation_instance: Simulation) -> None:
     """
     simulation = simulation_instance
     simulation.add_healthy(1)
-    simulation.population[0].individual.sick(
-        simulation.population[0])
-    assert simulation.population[0].individual.status == "infected"
-    assert simulation.population[0].color == simulation.infected_color
+    simulation.engine.sick(0)
+    simulation.render()
+
+    assert simulation.population[0].status == "infected"
+    assert simulation.renderer.color(0) == simulation.infected_color
@@ -0,0 +1,101 @@
+""" This module contains the unit tests for the spatial index backends and
+    the create_index function.
+"""
+import pytest
+import numpy as np
+from infection.engine.spatial_index import (
+    INDEX_BACKENDS, GridIndex, counting_order, create_index
+)
+
+
+@pytest.fixture
+def points() -> tuple[np.ndarray, np.ndarray]:
+    """ This is a pytest.fixture method to provide random points to index.
+
+    Returns:
+        points (tuple[np.ndarray, np.ndarray]): The 'x' and 'y' positions
+            of 500 points in a 200 by 100 area.
+    """
+    generator = np.random.default_rng(7)
+    return generator.uniform(0, 200, 500), generator.uniform(0, 100, 500)
+
+
+@pytest.mark.parametrize("backend", INDEX_BACKENDS)
+def test_neighbors_match_brute_force(
+        backend: str, points: tuple[np.ndarray, np.ndarray]) -> None:
+    """ This method will test if neighbors() returns exactly the points
+        within the radius, excluding the query point itself, for every
+        backend.
+
+    Args:
+        backend (str): The name of the spatial index backend.
+        points (tuple[np.ndarray, np.ndarray]): The points to index.
+    """
+    x, y = points
+    radius = 10
+    index = create_index(backend, radius).build(x, y, np.zeros(len(x)))
+    for point in range(0, len(x), 25):
+        distance = np.hypot(x - x[point], y - y[point])
+        expected = np.flatnonzero((distance > 0) & (distance <= radius))
+        found = index.neighbors(x[point], y[point], radius)
+
+        assert sorted(found.tolist()) == expected.tolist()
+
+
+def test_grid_candidates_outside(
+        points: tuple[np.ndarray, np.ndarray]) -> None:
+    """ This method will test if the grid backend returns no candidates for
+        a query far away from every point.
+
+    Args:
+        points (tuple[np.ndarray, np.ndarray]): The points to index.
+    """
+    x, y = points
+    index = GridIndex(10).build(x, y, np.zeros(len(x)))
+
+    assert len(index.candidates(1000, 1000, 10)) == 0
+    assert len(index.candidates(-1000, 50, 10)) == 0
+
+
+def test_create_index_unknown_backend() -> None:
+    """ This method will test if create_index() rejects an unknown backend.
+    """
+    with pytest.raises(ValueError):
+        create_index("octree", 10)
+
+
+@pytest.mark.parametrize("backend", INDEX_BACKENDS)
+def test_count_neighbors_match_neighbors(
+        backend: str, points: tuple[np.ndarray, np.ndarray]) -> None:
+    """ This method will test if the bulk count_neighbors() gives the same
+        counts as one neighbors() search per query, for every backend, when
+        only the points selected by the mask are counted.
+
+    Args:
+        backend (str): The name of the spatial index backend.
+        points (tuple[np.ndarray, np.ndarray]): The points to index.
+    """
+    x, y = points
+    radius = 10
+    mask = np.arange(len(x)) % 3 == 0
+    index = create_index(backend, radius).build(x, y, mask)
+    counts = index.count_neighbors(x, y, radius, mask=mask)
+    expected = [np.count_nonzero(mask[index.neighbors(x[point], y[point],
+                                                      radius)])
+                for point in range(len(x))]
+
+    assert counts.tolist() == expected
+
+
+@pytest.mark.parametrize("size", [1, 1000, 70000, 2 ** 40])
+def test_counting_order(size: int) -> None:
+    """ This method will test if counting_order sorts keys like a stable
+        sort does, with keys that need one digit and several digits.
+
+    Args:
+        size (int): The bound on the keys.
+    """
+    keys = np.random.default_rng(3).integers(0, size, 2000)
+
+    assert np.array_equal(counting_order(keys, size),
+                          np.argsort(keys, kind="stable"))
@@ -0,0 +1,71 @@
+""" This module contains the unit tests for the Stepper class.
+"""
+import pytest
+import time
+from infection.engine.simulation_engine import SimulationEngine
+from infection.engine.stepper import Stepper
+
+
+@pytest.fixture
+def stepper_instance() -> Stepper:
+    """ This is a pytest.fixture method to provide a stepper of a headless
+        engine with a few individuals, at 10 ticks per second.
+
+    Returns:
+        stepper (Stepper): An instance of the stepper class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              seed=1)
+    engine.add_healthy(10)
+    stepper = Stepper(engine, tick_rate=10, max_ticks_per_frame=5)
+    yield stepper
+    stepper.stop()
+
+
+def test_advance_fixed_ticks(stepper_instance: Stepper) -> None:
+    """ This method will test if advance() runs one tick per 1 / tick_rate
+        seconds, keeping the leftover time for the next call, and drops the
+        time beyond max_ticks_per_frame.
+
+    Args:
+        stepper_instance (Stepper): An instance of the stepper class.
+    """
+    stepper = stepper_instance
+
+    assert stepper.advance(0.25) == 2
+    assert stepper.advance(0.06) == 1
+    assert stepper.advance(10) == 5
+    assert stepper.advance(0.05) == 0
+    assert stepper.engine.ticks == 8
+
+
+def test_advance_turbo(stepper_instance: Stepper) -> None:
+    """ This method will test if advance() runs more ticks than the tick
+        rate allows in turbo mode.
+
+    Args:
+        stepper_instance (Stepper): An instance of the stepper class.
+    """
+    stepper_instance.turbo = True
+
+    assert stepper_instance.advance(0.01) > 5
+
+
+def test_start_stop(stepper_instance: Stepper) -> None:
+    """ This method will test if start() advances the engine from a
+        background thread until stop() is called.
+
+    Args:
+        stepper_instance (Stepper): An instance of the stepper class.
+    """
+    stepper = stepper_instance
+    stepper.turbo = True
+    stepper.start()
+    time.sleep(0.2)
+    stepper.stop()
+    ticks = stepper.engine.ticks
+
+    assert not stepper.running
+    assert ticks > 5
+    time.sleep(0.05)
+    assert stepper.engine.ticks == ticks
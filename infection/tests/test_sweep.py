@@ -0,0 +1,94 @@
+""" This module contains the unit tests for the parameter sweep functions.
+"""
+import csv
+import io
+import pytest
+from infection.engine.sweep import (
+    COLUMNS, grid, main, simulate, sweep, write_table
+)
+
+
+@pytest.fixture
+def parameter_sets() -> list[dict]:
+    """ This is a pytest.fixture method to provide a small grid of quick
+        runs.
+
+    Returns:
+        parameter_sets (list[dict]): The parameter sets.
+    """
+    return grid(infection_probability=[.3, .9], population=[80],
+                max_time_infected=[15, 30], max_cooldown=[5],
+                ticks=[60], width=[150], height=[150])
+
+
+def test_grid(parameter_sets: list[dict]) -> None:
+    """ This method will test if grid builds every combination of values,
+        and rejects unknown parameters.
+
+    Args:
+        parameter_sets (list[dict]): The parameter sets.
+    """
+    assert len(parameter_sets) == 4
+    assert [(parameters["infection_probability"],
+             parameters["max_time_infected"])
+            for parameters in parameter_sets] == [
+        (.3, 15), (.3, 30), (.9, 15), (.9, 30)]
+    with pytest.raises(ValueError):
+        grid(speed=[1])
+
+
+def test_simulate(parameter_sets: list[dict]) -> None:
+    """ This method will test if a run is reproducible from its seed, stops
+        once nobody is infected, and summarizes its epidemic curve.
+
+    Args:
+        parameter_sets (list[dict]): The parameter sets.
+    """
+    summary = simulate(parameter_sets[2], 4)
+    assert summary == simulate(parameter_sets[2], 4)
+    assert summary["seed"] == 4
+    assert summary["peak_infected"] >= 10
+    assert 0 <= summary["time_to_peak"] <= summary["ticks_run"] <= 60
+    assert 10 <= summary["final_size"] <= 80
+    assert summary["attack_rate"] == summary["final_size"] / 80
+    short = simulate({"population": 20, "infected": 20,
+                      "max_time_infected": 3, "ticks": 100}, 1)
+    assert short["ticks_run"] == 3
+    assert short["final_size"] == 20
+
+
+def test_sweep_workers(parameter_sets: list[dict]) -> None:
+    """ This method will test if a sweep in worker processes gives the same
+        results as a sweep in this process, one per parameter set and seed.
+
+    Args:
+        parameter_sets (list[dict]): The parameter sets.
+    """
+    serial = list(sweep(parameter_sets, [1, 2], workers=1))
+    parallel = sorted(sweep(parameter_sets, [1, 2], workers=2),
+                      key=lambda summary: summary["run"])
+    assert len(serial) == 8
+    assert [summary["run"] for summary in serial] == list(range(8))
+    assert serial == parallel
+
+
+def test_write_table(parameter_sets: list[dict], tmp_path) -> None:
+    """ This method will test if the results table gets a header and one row
+        per run, from the function and from the command line.
+
+    Args:
+        parameter_sets (list[dict]): The parameter sets.
+        tmp_path (Path): A temporary directory.
+    """
+    file = io.StringIO()
+    assert write_table(sweep(parameter_sets[:1], [3], workers=1), file) == 1
+    rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+    assert tuple(rows[0]) == COLUMNS
+    assert main(["--population", "40", "--ticks", "10",
+                 "--infection-probability", ".2", ".5", "--replicates", "2",
+                 "--workers", "1", "--output",
+                 str(tmp_path / "sweep.csv")]) == 0
+    with open(tmp_path / "sweep.csv") as table:
+        rows = list(csv.DictReader(table))
+    assert len(rows) == 4
+    assert {row["infection_probability"] for row in rows} == {"0.2", "0.5"}
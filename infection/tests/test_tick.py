@@ -0,0 +1,72 @@
+""" This module contains the unit tests for the tick method from
+    the SimulationEngine class.
+"""
+import pytest
+from infection.engine.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21)
+    return engine
+
+
+def test_tick_position(engine_instance: SimulationEngine) -> None:
+    """ This method will test if tick() updates the position of the
+        individuals without any window or widget.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine_instance.add_healthy(1)
+    original_pos = engine_instance.population[0].pos
+    engine_instance.tick()
+
+    assert engine_instance.population[0].pos != original_pos
+    assert engine_instance.ticks == 1
+
+
+def test_tick_infection_sick(engine_instance: SimulationEngine) -> None:
+    """ This method will test if tick() infects a healthy individual with
+        infection probability of 1.0 when near an infected individual, and
+        updates the counters.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.infection_probability = 1.0
+    engine.add_healthy(1)
+    engine.population[0].pos = (100, 100)
+    engine.add_infected(1)
+    engine.population[1].pos = (100, 100 + engine.individual_size)
+    engine.tick()
+
+    assert engine.population[0].status == "infected"
+    assert engine.healthy == 0
+    assert engine.infected == 2
+
+
+def test_tick_add_more_than_one(engine_instance: SimulationEngine) -> None:
+    """ This method will test if add_healthy(3) actually adds three
+        individuals inside the arena bounds.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine_instance.add_healthy(3)
+    x_min, y_min, x_max, y_max = engine_instance.bounds
+
+    assert len(engine_instance.population) == 3
+    for agent in engine_instance.population:
+        assert x_min <= agent.x <= x_max
+        assert y_min <= agent.y <= y_max
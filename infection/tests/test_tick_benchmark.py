@@ -0,0 +1,71 @@
+""" This module contains the unit tests for the run and compare functions
+    from the tick_benchmark module.
+"""
+import json
+import pytest
+from infection.benchmarks.tick_benchmark import PHASES, compare, main, run
+from infection.engine.spatial_index import INDEX_BACKENDS
+
+
+@pytest.fixture
+def report() -> dict:
+    """ This is a pytest.fixture method to provide a small benchmark report,
+        with 100 individuals and 2 ticks per case.
+
+    Returns:
+        report (dict): The benchmark report.
+    """
+    return run(sizes=(100,), execution_backends={"serial": 1}, ticks=2)
+
+
+def test_run(report: dict) -> None:
+    """ This method will test if run() reports every phase of every index
+        backend, and if the report can be saved as JSON.
+
+    Args:
+        report (dict): The benchmark report.
+    """
+    assert [result["index"] for result in report["results"]] == list(
+        INDEX_BACKENDS)
+    for result in report["results"]:
+        assert result["agents"] == 100
+        assert set(result["phases"]) == set(PHASES)
+        assert all(seconds >= 0 for seconds in result["phases"].values())
+    assert json.loads(json.dumps(report)) == report
+
+
+def test_compare(report: dict) -> None:
+    """ This method will test if compare() only reports the phases that got
+        slower than the baseline by more than the threshold.
+
+    Args:
+        report (dict): The benchmark report.
+    """
+    baseline = json.loads(json.dumps(report))
+    for result in baseline["results"]:
+        result["phases"]["tick"] /= 2
+
+    assert compare(report, report) == []
+    regressions = compare(report, baseline, threshold=0.5)
+    assert [regression["phase"] for regression in regressions] == [
+        "tick"] * len(INDEX_BACKENDS)
+    assert regressions[0]["ratio"] == pytest.approx(2)
+    assert compare(report, baseline, threshold=1.5) == []
+
+
+def test_main_baseline(tmp_path) -> None:
+    """ This method will test if main() saves the report and returns 1 when
+        a phase regressed against the baseline.
+
+    Args:
+        tmp_path (pathlib.Path): A temporary directory given by pytest.
+    """
+    arguments = ["--sizes", "100", "--indexes", "grid", "--executions",
+                 "serial", "--ticks", "2"]
+    output = tmp_path / "bench.json"
+
+    assert main(arguments + ["--output", str(output)]) == 0
+    baseline = json.loads(output.read_text())
+    baseline["results"][0]["phases"]["tick"] /= 100
+    output.write_text(json.dumps(baseline))
+    assert main(arguments + ["--baseline", str(output)]) == 1
@@ -0,0 +1,89 @@
+""" This module contains the unit tests for the TimeSeries class and the
+    record method from the SimulationEngine class.
+"""
+import numpy as np
+import pytest
+from infection.engine.simulation_engine import (
+    MAX_TIME_INFECTED, SimulationEngine
+)
+from infection.engine.time_series import SERIES, TimeSeries
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide an engine with one
+        healthy individual next to an infected one that is about to
+        recover.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              infection_probability=1.0, seed=3)
+    engine.add_healthy(1)
+    engine.population[0].pos = (100, 100)
+    engine.add_infected(1)
+    engine.population[1].pos = (100, 100 + engine.individual_size)
+    engine.population[1].time_infected = MAX_TIME_INFECTED - 1
+    return engine
+
+
+def test_record_ticks(engine_instance: SimulationEngine) -> None:
+    """ This method will test if every tick records the S/I/R counts and the
+        transitions of the tick.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.tick()
+    engine.tick()
+    columns = engine.series.columns
+
+    assert list(columns["tick"]) == [1, 2]
+    assert list(columns["susceptible"]) == [0, 0]
+    assert list(columns["infected"]) == [1, 1]
+    assert list(columns["recovered"]) == [1, 1]
+    assert list(columns["new_infections"]) == [1, 0]
+    assert list(columns["new_recoveries"]) == [1, 0]
+    engine.reset()
+    assert len(engine.series) == 0
+
+
+def test_record_grows() -> None:
+    """ This method will test if the buffer grows one chunk at a time and
+        keeps the rows recorded before.
+    """
+    series = TimeSeries(chunk=4)
+    for tick in range(10):
+        series.record(tick, 10 - tick, tick, 0, 1, 0)
+
+    assert series.capacity == 12
+    assert list(series.columns["infected"]) == list(range(10))
+
+
+def test_save(engine_instance: SimulationEngine, tmp_path) -> None:
+    """ This method will test if the time series is exported to CSV and
+        .npz files with the same values, and if an unknown suffix is
+        rejected.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+        tmp_path (pathlib.Path): A temporary directory given by pytest.
+    """
+    engine = engine_instance
+    for _ in range(5):
+        engine.tick()
+    engine.save_series(tmp_path / "series.csv")
+    engine.save_series(tmp_path / "series.npz")
+    table = np.loadtxt(tmp_path / "series.csv", delimiter=",", skiprows=1,
+                       dtype=np.int64)
+    arrays = np.load(tmp_path / "series.npz")
+
+    assert (table == engine.series.data).all()
+    for number, name in enumerate(SERIES):
+        assert (arrays[name] == table[:, number]).all()
+    with pytest.raises(ValueError):
+        engine.save_series(tmp_path / "series.txt")
@@ -0,0 +1,40 @@
+""" This module contains the unit tests for the toggle_hud method from the
+    Simulation class.
+"""
+import pytest
+from infection.simulation import Simulation
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation()
+    simulation.build()
+    yield simulation
+    simulation.menu_right.btn_hud.state = "normal"
+
+
+def test_toggle_hud(simulation_instance: Simulation) -> None:
+    """ This method will test if pressing the HUD ToggleButton shows the
+        performance HUD with the engine's metrics, and hides it again.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    simulation.add_healthy(4)
+    simulation.update(1 / 60)
+    simulation.update(1 / 60)
+    simulation.menu_right.btn_hud.state = "down"
+
+    assert simulation.hud.parent is not None
+    assert simulation.engine.metrics.frames.count == 2
+    assert "4 agents" in simulation.hud.text
+    assert "dropped 0 frames" in simulation.hud.text
+    simulation.menu_right.btn_hud.state = "normal"
+    assert simulation.hud.parent is None
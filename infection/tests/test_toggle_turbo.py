@@ -0,0 +1,37 @@
+""" This module contains the unit tests for the toggle_turbo method from
+    the Simulation class.
+"""
+import pytest
+from infection.simulation import Simulation
+
+
+@pytest.fixture
+def simulation_instance() -> Simulation:
+    """ This is a pytest.fixture method to provide quick access to the class
+        that contains the method we are testing.
+
+    Returns:
+        simulation (Simulation): An instance of the simulation class.
+    """
+    simulation = Simulation()
+    simulation.build()
+    return simulation
+
+
+def test_toggle_turbo(simulation_instance: Simulation) -> None:
+    """ This method will test if pressing the turbo ToggleButton turns the
+        stepper's turbo mode on and off, and if update() then runs more than
+        one tick per frame.
+
+    Args:
+        simulation_instance (Simulation): An instance of the simulation class.
+    """
+    simulation = simulation_instance
+    simulation.add_healthy(1)
+    simulation.menu_right.btn_turbo.state = "down"
+    simulation.update(1 / 60)
+
+    assert simulation.stepper.turbo
+    assert simulation.engine.ticks > 1
+    simulation.menu_right.btn_turbo.state = "normal"
+    assert not simulation.stepper.turbo
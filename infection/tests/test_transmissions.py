@@ -0,0 +1,102 @@
+""" This module contains the unit tests for the TransmissionChains class and
+    the trace method from the SimulationEngine class.
+"""
+import numpy as np
+import pytest
+from infection.engine.simulation_engine import (
+    MAX_TIME_INFECTED, SimulationEngine
+)
+from infection.engine.transmissions import UNKNOWN, TransmissionChains
+
+
+@pytest.fixture
+def engine_instance() -> SimulationEngine:
+    """ This is a pytest.fixture method to provide an engine with one
+        healthy individual next to an infected one that is about to
+        recover.
+
+    Returns:
+        engine (SimulationEngine): An instance of the simulation engine class.
+    """
+    engine = SimulationEngine(width=800, height=600, individual_size=21,
+                              infection_probability=1.0, seed=6)
+    engine.add_healthy(1)
+    engine.population[0].pos = (100, 100)
+    engine.add_infected(1)
+    engine.population[1].pos = (100, 100 + engine.individual_size)
+    engine.population[1].time_infected = MAX_TIME_INFECTED - 1
+    return engine
+
+
+def test_trace_tick(engine_instance: SimulationEngine) -> None:
+    """ This method will test if a tick records who infected whom, and who
+        recovered, and if the tree and secondary cases follow from them.
+
+    Args:
+        engine_instance (SimulationEngine): An instance of the simulation
+            engine class.
+    """
+    engine = engine_instance
+    engine.tick()
+    chains = engine.transmissions
+
+    assert chains.infections.tolist() == [[UNKNOWN, 1, 0], [1, 0, 0]]
+    assert chains.recoveries.tolist() == [[1, 0]]
+    assert chains.tree(2).tolist() == [1, UNKNOWN]
+    assert chains.secondary_cases(2).tolist() == [0, 1]
+    assert chains.infectees(1).tolist() == [0]
+    engine.reset()
+    assert len(engine.transmissions) == 0
+
+
+def test_trace_parallel() -> None:
+    """ This method will test if the chains recorded with two worker
+        processes are the same as the ones recorded serially.
+    """
+    chains = []
+    for workers in (1, 2):
+        engine = SimulationEngine(width=400, height=300, individual_size=21,
+                                  infection_probability=.5, workers=workers,
+                                  seed=8)
+        engine.add_healthy(300)
+        engine.add_infected(10)
+        for _ in range(20):
+            engine.tick()
+        engine.close()
+        chains.append(engine.transmissions.infections.copy())
+
+    assert len(chains[0]) > 10
+    assert np.array_equal(chains[0], chains[1])
+
+
+def test_effective_r() -> None:
+    """ This method will test if effective_r() averages the secondary cases
+        of the individuals infected in the window of every tick, and if the
+        arrays grow past their capacity.
+    """
+    chains = TransmissionChains(capacity=2)
+    chains.record_infections([UNKNOWN, UNKNOWN], [0, 1], 0)
+    chains.record_infections([0, 0, 1], [2, 3, 4], 1)
+    chains.record_infections([2], [5], 3)
+    r = chains.effective_r(5, window=2)
+
+    assert len(chains) == 6
+    assert r[0] == pytest.approx(1.5)
+    assert r[1] == pytest.approx(4 / 5)
+    assert r[2] == pytest.approx(1 / 3)
+    assert r[3] == pytest.approx(0)
+    assert r[4] == pytest.approx(0)
+    assert np.isnan(chains.effective_r(8, window=2)[6])
+
+
+def test_effective_r_later_infections() -> None:
+    """ This method will test if effective_r() leaves out of the cohorts
+        the infections recorded at or after the estimated ticks.
+    """
+    chains = TransmissionChains()
+    chains.record_infections([UNKNOWN], [0], 3)
+    chains.record_infections([0], [1], 7)
+    r = chains.effective_r(5, window=2)
+
+    assert r[3] == pytest.approx(1)
+    assert r[4] == pytest.approx(1)
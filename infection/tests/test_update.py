@@ -2,6 +2,7 @@
     the Simulation class.
 """
 import pytest
+from infection.engine.simulation_engine import MAX_TIME_INFECTED
 from infection.simulation import Simulation
 
 
@@ -49,8 +50,8 @@ def test_update_infection_sick(simulation_instance: Simulation) -> None:
     simulation.population[1].pos = (0, simulation.individual_size)
     simulation.update(1.7)
 
-    assert simulation.population[0].individual.status == "infected"
-    assert simulation.population[0].color == simulation.infected_color
+    assert simulation.population[0].status == "infected"
+    assert simulation.renderer.color(0) == simulation.infected_color
 
 
 def test_update_infection_recover(simulation_instance: Simulation) -> None:
@@ -63,9 +64,8 @@ def test_update_infection_recover(simulation_instance: Simulation) -> None:
     """
     simulation = simulation_instance
     simulation.add_infected(1)
-    infected = simulation.population[0].individual
-    infected.time_infected = infected.max_time_infected - 1
+    simulation.population[0].time_infected = MAX_TIME_INFECTED - 1
     simulation.update(1.7)
 
-    assert simulation.population[0].individual.status == "healthy"
-    assert simulation.population[0].color == simulation.recovered_color
+    assert simulation.population[0].status == "healthy"
+    assert simulation.renderer.color(0) == simulation.recovered_color
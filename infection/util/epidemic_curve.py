@@ -0,0 +1,139 @@
+""" This module defines the EpidemicCurve class and all of its properties and
+    methods.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infection.simulation import Simulation
+    from infection.engine.time_series import TimeSeries
+from kivy.graphics import Color, Line
+from kivy.uix.widget import Widget
+import numpy as np
+
+CURVES = ("susceptible", "infected", "recovered")
+
+
+class EpidemicCurve(Widget):
+    """ This is the definition of the EpidemicCurve class. It inherits from
+        the Widget Kivy class, and plots the susceptible, infected and
+        recovered counts recorded in the engine's time series as one Line
+        each, one point per pixel. On every refresh, only the ticks recorded
+        since the last one are sampled and appended to the Lines. When there
+        are more points than pixels, every other point is dropped and the
+        sampling stride is doubled, so the number of points, and the cost of
+        a refresh, never grows past the width of the widget.
+
+    Args:
+        simulation: Instance of the simulation class to be able to access
+            the colors of each infection state.
+
+    Attributes:
+        simulation: To store the instance of the Simulation class.
+        lines: Dictionary with the Line instruction of each curve, by name.
+        samples: Integer array with shape (points, 3) with the susceptible,
+            infected and recovered counts of every plotted point.
+        stride: Integer with the number of ticks between two points.
+    """
+
+    def __init__(self, simulation: Simulation, **kwargs) -> None:
+        super(EpidemicCurve, self).__init__(**kwargs)
+        self._simulation = simulation
+        self._colors = {}
+        self._lines = {}
+        self._samples = np.zeros((0, len(CURVES)), dtype=np.int64)
+        self._stride = 1
+        self._population = 0
+        with self.canvas:
+            for curve in CURVES:
+                self._colors[curve] = Color(*self.palette()[curve])
+                self._lines[curve] = Line(points=[], width=1)
+        self.bind(pos=self.redraw, size=self.redraw)
+
+    @property
+    def simulation(self) -> Simulation:
+        return self._simulation
+
+    @property
+    def lines(self) -> dict:
+        return self._lines
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._samples
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    def palette(self) -> dict:
+        """ Method that returns the simulation's current color of each
+            curve.
+
+        Returns:
+            palette (dict): The rgba color of each curve, by name.
+        """
+        return {"susceptible": self.simulation.healthy_color,
+                "infected": self.simulation.infected_color,
+                "recovered": self.simulation.recovered_color}
+
+    def points(self, samples: np.ndarray, first: int) -> np.ndarray:
+        """ Method that turns samples into the (x, y) coordinates of their
+            points in the widget, one pixel apart.
+
+        Args:
+            samples (np.ndarray): The samples to plot.
+            first (int): The number of the first sample.
+
+        Returns:
+            points (np.ndarray): Float array with shape (3, len(samples), 2)
+                with the points of every curve.
+        """
+        points = np.empty((len(CURVES), len(samples), 2))
+        points[:, :, 0] = self.x + first + np.arange(len(samples))
+        points[:, :, 1] = self.y + samples.T * self.height / max(
+            self._population, 1)
+        return points
+
+    def redraw(self, *args) -> None:
+        """ Method that rebuilds every Line from the stored samples, when the
+            widget moves or is resized, or when the population, the vertical
+            scale of the plot, changes.
+        """
+        points = self.points(self._samples, 0)
+        for number, curve in enumerate(CURVES):
+            self._lines[curve].points = points[number].ravel().tolist()
+
+    def refresh(self, series: TimeSeries, population: int) -> None:
+        """ Method that appends the ticks recorded since the last refresh to
+            the Lines, sampled every "stride" ticks, and halves the points
+            when they don't fit in the width of the widget anymore.
+
+        Args:
+            series (TimeSeries): The engine's time series.
+            population (int): The total Individual population count.
+        """
+        for curve in CURVES:
+            self._colors[curve].rgba = self.palette()[curve]
+        if len(series) < len(self._samples) * self._stride:
+            self._samples = self._samples[:0]
+            self._stride = 1
+        columns = series.columns
+        first = len(self._samples)
+        rows = slice(first * self._stride, len(series), self._stride)
+        samples = np.column_stack([columns[curve][rows] for curve in CURVES])
+        self._samples = np.concatenate((self._samples, samples))
+        width = max(int(self.width), 2)
+        rescale = len(self._samples) > width or population != self._population
+        while len(self._samples) > width:
+            self._samples = self._samples[::2]
+            self._stride *= 2
+        self._population = population
+        if rescale or first == 0:
+            self.redraw()
+            return
+        if not len(samples):
+            return
+        points = self.points(samples, first)
+        for number, curve in enumerate(CURVES):
+            self._lines[curve].points.extend(points[number].ravel().tolist())
+            self._lines[curve].flag_data_update()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from infection.simulation import Simulation
+from infection.util.epidemic_curve import EpidemicCurve
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.slider import Slider
@@ -36,6 +37,8 @@ class MenuBottom(BoxLayout):
             in the menu.
         lbl_value_infected: Kivy Label that displays the infected Individual
             count.
+        epidemic_curve: EpidemicCurve widget that plots the susceptible,
+            infected and recovered counts of every tick so far.
     """
 
     def __init__(self, simulation: Simulation, **kwargs):
@@ -50,12 +53,14 @@ class MenuBottom(BoxLayout):
         self.lbl_value_healthy = Label(text='0')
         self.lbl_infected = Label(text='Infected:')
         self.lbl_value_infected = Label(text='0')
+        self.epidemic_curve = EpidemicCurve(simulation)
         self.add_widget(self.lbl_population)
         self.add_widget(self.lbl_value_population)
         self.add_widget(self.lbl_healthy)
         self.add_widget(self.lbl_value_healthy)
         self.add_widget(self.lbl_infected)
         self.add_widget(self.lbl_value_infected)
+        self.add_widget(self.epidemic_curve)
         self.add_widget(self.lbl_infection_probability)
         self.add_widget(self.sldr_infection_probability)
         self.add_widget(self.lbl_sldr_infection_probability)
@@ -76,3 +81,19 @@ class MenuBottom(BoxLayout):
         self.simulation.infection_probability = round(probality / 10, 1)
         self.lbl_sldr_infection_probability.text = str(round(
             probality / 10, 1))
+
+    def refresh(self, population: int, healthy: int, infected: int) -> None:
+        """ Method that shows the given counts in the population, healthy
+            and infected value Labels. The text of a Label is only set when
+            its count changed, so an unchanged Label is not laid out again.
+
+        Args:
+            population (int): The total Individual population count.
+            healthy (int): The healthy Individual count.
+            infected (int): The infected Individual count.
+        """
+        for label, count in ((self.lbl_value_population, population),
+                             (self.lbl_value_healthy, healthy),
+                             (self.lbl_value_infected, infected)):
+            if label.text != str(count):
+                label.text = str(count)
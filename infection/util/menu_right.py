@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from infection.simulation import Simulation
 from kivy.uix.button import Button
+from kivy.uix.togglebutton import ToggleButton
 from kivy.uix.boxlayout import BoxLayout
 from functools import partial
 from kivy.uix.popup import Popup
@@ -27,6 +28,10 @@ class MenuRight(BoxLayout):
             infected individual to the simulation.
         btn_reset: Kivy Button that allows the user to reset the
             simulation, removing all healthy and infected individuals.
+        btn_turbo: Kivy ToggleButton that runs the simulation as fast as
+            possible while it is down.
+        btn_hud: Kivy ToggleButton that shows the performance HUD while it
+            is down.
         btn_healthy_color: Kivy Button that shows the
             popup_healthy_color_picker.
         btn_cancel_healthy_color: Kivy Button that closes the
@@ -73,6 +78,10 @@ class MenuRight(BoxLayout):
                                            simulation.add_infected, 1))
         self.btn_reset = Button(text='Reset',
                                 on_press=simulation.reset_population)
+        self.btn_turbo = ToggleButton(text='Turbo')
+        self.btn_turbo.bind(state=simulation.toggle_turbo)
+        self.btn_hud = ToggleButton(text='HUD')
+        self.btn_hud.bind(state=simulation.toggle_hud)
         self.btn_healthy_color = Button(text='Healthy\n  Color',
                                         on_press=partial(
                                             self.show_color_picker,
@@ -147,6 +156,8 @@ class MenuRight(BoxLayout):
         self.add_widget(self.btn_healthy_color)
         self.add_widget(self.btn_infected_color)
         self.add_widget(self.btn_recovered_color)
+        self.add_widget(self.btn_turbo)
+        self.add_widget(self.btn_hud)
         self.add_widget(self.btn_reset)
 
     def show_color_picker(self, instance: Button, type: str) -> None:
@@ -0,0 +1,41 @@
+""" This module defines the PerformanceHud class and all of its properties
+    and methods.
+"""
+from kivy.uix.label import Label
+
+
+class PerformanceHud(Label):
+    """ This is the definition of the PerformanceHud class. It inherits from
+        the Label Kivy class, and shows the ticks per second, the frame
+        time, the p50 and p99 tick durations, the dropped frames and the
+        number of agents over the top left corner of the arena.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super(PerformanceHud, self).__init__(
+            size_hint=(None, None), halign="left", valign="top", **kwargs)
+        self.bind(texture_size=self.on_texture_size)
+
+    def on_texture_size(self, instance: Label, size: list) -> None:
+        """ Method that fits the size of the HUD to its text.
+
+        Args:
+            instance (kivy.uix.label.Label): The HUD's instance.
+            size (list): The size of the rendered text.
+        """
+        self.size = size
+
+    def refresh(self, snapshot: dict, agents: int) -> None:
+        """ Method that shows the given metrics.
+
+        Args:
+            snapshot (dict): The summary of the latest ticks and frames, from
+                Metrics.snapshot().
+            agents (int): The total Individual population count.
+        """
+        self.text = (f"{snapshot['ticks_per_second']:.0f} ticks/s\n"
+                     f"frame {snapshot['frame_time'] * 1000:.1f} ms\n"
+                     f"tick p50 {snapshot['tick_p50'] * 1000:.2f} ms\n"
+                     f"tick p99 {snapshot['tick_p99'] * 1000:.2f} ms\n"
+                     f"dropped {snapshot['dropped_frames']} frames\n"
+                     f"{agents} agents")
@@ -0,0 +1,177 @@
+""" This module defines the PopulationRenderer class and all of its properties
+    and methods.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infection.simulation import Simulation
+from infection.decorators.instrumentation import instrumented
+from kivy.graphics import Color, InstructionGroup, Mesh
+from kivy.graphics.texture import Texture
+import numpy as np
+
+STATES = ("healthy", "infected", "recovered")
+MESH_CAPACITY = 16384
+TEXTURE_SIZE = 64
+CORNERS = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float32)
+
+
+def circle_texture(size: int = TEXTURE_SIZE) -> Texture:
+    """ Function that creates a white texture with an opaque disc and a
+        transparent background, which the Color of every group tints.
+
+    Args:
+        size (int): The width and height of the texture in pixels. Defaults
+            to TEXTURE_SIZE.
+
+    Returns:
+        texture (Texture): The circle texture.
+    """
+    center = (np.arange(size) + .5) / size - .5
+    inside = np.hypot(center[:, None], center[None, :]) <= .5
+    pixels = np.full((size, size, 4), 255, dtype=np.ubyte)
+    pixels[..., 3] = inside * 255
+    texture = Texture.create(size=(size, size), colorfmt="rgba")
+    texture.blit_buffer(pixels.tobytes(), colorfmt="rgba",
+                        bufferfmt="ubyte")
+    return texture
+
+
+class PopulationRenderer(InstructionGroup):
+    """ This is the definition of the PopulationRenderer class. It inherits
+        from the InstructionGroup Kivy class, and draws the whole population
+        of the SimulationEngine with a few instructions instead of one widget
+        per individual: a Color and a list of Meshes for each infection
+        state, with one textured quad per individual. On every refresh, the
+        vertex buffers are rebuilt straight from the position, status and
+        recovered columns of the population with array operations. A Mesh
+        indexes its vertices with 16-bit numbers, so every state is split
+        into Meshes of up to MESH_CAPACITY individuals.
+
+    Args:
+        simulation: Instance of the simulation class to be able to access
+            the population and the colors of each infection state.
+
+    Attributes:
+        simulation: To store the instance of the Simulation class.
+        texture: The circle Texture every individual is drawn with.
+        colors: Dictionary with the Color instruction of each infection
+            state, by state name.
+        meshes: Dictionary with the list of Mesh instructions of each
+            infection state, by state name.
+        states: Integer array with the infection state each individual was
+            last drawn with, as an index of STATES.
+    """
+
+    def __init__(self, simulation: Simulation, **kwargs) -> None:
+        super(PopulationRenderer, self).__init__(**kwargs)
+        self._simulation = simulation
+        self._texture = circle_texture()
+        self._colors = {}
+        self._groups = {}
+        self._meshes = {}
+        self._buffers = []
+        self._states = np.empty(0, dtype=np.intp)
+        quad = np.array([0, 1, 2, 2, 3, 0], dtype=np.uint16)
+        self._indices = (quad + 4 * np.arange(
+            MESH_CAPACITY, dtype=np.uint16)[:, None]).ravel()
+        for state in STATES:
+            self._colors[state] = Color(*self.palette()[state])
+            self._groups[state] = InstructionGroup()
+            self._meshes[state] = []
+            self.add(self._colors[state])
+            self.add(self._groups[state])
+
+    @property
+    def simulation(self) -> Simulation:
+        return self._simulation
+
+    @property
+    def texture(self) -> Texture:
+        return self._texture
+
+    @property
+    def colors(self) -> dict:
+        return self._colors
+
+    @property
+    def meshes(self) -> dict:
+        return self._meshes
+
+    @property
+    def states(self) -> np.ndarray:
+        return self._states
+
+    def palette(self) -> dict:
+        """ Method that returns the simulation's current color of each
+            infection state.
+
+        Returns:
+            palette (dict): The rgba color of each infection state, by state
+                name.
+        """
+        return {"healthy": self.simulation.healthy_color,
+                "infected": self.simulation.infected_color,
+                "recovered": self.simulation.recovered_color}
+
+    def color(self, index: int) -> list:
+        """ Method that returns the color the individual at "index" was last
+            drawn with.
+
+        Args:
+            index (int): The index of the individual in the population.
+
+        Returns:
+            color (list): The rgba color of the individual.
+        """
+        return list(self._colors[STATES[self._states[index]]].rgba)
+
+    def vertices(self, x: np.ndarray, y: np.ndarray,
+                 size: float) -> np.ndarray:
+        """ Method that builds the vertex buffer of a quad for every
+            position, in the (x, y, u, v) format of a Mesh.
+
+        Args:
+            x (np.ndarray): The positions in the 'x' axis.
+            y (np.ndarray): The positions in the 'y' axis.
+            size (float): The size of an individual.
+
+        Returns:
+            vertices (np.ndarray): Float32 array with shape (len(x), 4, 4).
+        """
+        vertices = np.empty((len(x), 4, 4), dtype=np.float32)
+        vertices[:, :, 0] = x[:, None] + size * CORNERS[:, 0]
+        vertices[:, :, 1] = y[:, None] + size * CORNERS[:, 1]
+        vertices[:, :, 2:] = CORNERS
+        return vertices
+
+    @instrumented("render")
+    def refresh(self) -> None:
+        """ Method that redraws the population: the individuals are grouped
+            by infection state with one stable sort, the vertex buffers of
+            every group are rebuilt from their positions, and the Colors are
+            updated from the simulation's palette.
+        """
+        population = self.simulation.population
+        self._states = np.where(population.recovered, 2, population.status)
+        order = np.argsort(self._states, kind="stable")
+        edges = np.concatenate(([0], np.cumsum(
+            np.bincount(self._states, minlength=len(STATES)))))
+        vertices = self.vertices(population.x[order], population.y[order],
+                                 self.simulation.individual_size)
+        self._buffers = [vertices]
+        for number, state in enumerate(STATES):
+            self._colors[state].rgba = self.palette()[state]
+            group = vertices[edges[number]:edges[number + 1]]
+            meshes = self._meshes[state]
+            chunks = range(0, len(group), MESH_CAPACITY)
+            while len(meshes) < len(chunks):
+                meshes.append(Mesh(texture=self.texture, mode="triangles"))
+                self._groups[state].add(meshes[-1])
+            for mesh, start in zip(meshes, chunks):
+                chunk = group[start:start + MESH_CAPACITY]
+                mesh.vertices = chunk.reshape(-1)
+                mesh.indices = self._indices[:6 * len(chunk)]
+            for mesh in meshes[len(chunks):]:
+                mesh.vertices = []
+                mesh.indices = []